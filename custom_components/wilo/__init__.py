@@ -1,14 +1,32 @@
 """Add Wilo integration."""
 import logging
+from pathlib import Path
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.importlib import async_import_module
 from homeassistant.helpers.update_coordinator import timedelta
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_MAX_DATA_AGE,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    DOMAIN,
+    HISTORY_BATCH_SIZE,
+    HISTORY_DIRECTORY,
+    LONG_TERM_STATISTICS_BATCH_HOURS,
+)
 from .coordinator import WiloCoordinator
 from .models import WiloModels
-from .providers import Rain3Provider
+from .providers import async_get_provider_class
+from .rate_limiter import get_rate_limiter, remove_rate_limiter
+from .services import async_setup_services, async_unload_services
+
+PLATFORMS = ["sensor"]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -20,21 +38,73 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     model:str = entry.data["model"]
     interval:int = entry.data["interval"]
     device_id:int = entry.data["device_id"]
+    long_term_statistics:bool = entry.data.get("long_term_statistics", False)
+    history:bool = entry.data.get("history", False)
+    burst_interval:float = entry.data.get("burst_interval", 0)
+    max_data_age:float = entry.data.get("max_data_age", DEFAULT_MAX_DATA_AGE)
+    rate_limit:float = entry.data.get("rate_limit", DEFAULT_RATE_LIMIT)
+    rate_limit_burst:int = entry.data.get("rate_limit_burst", DEFAULT_RATE_LIMIT_BURST)
+    timeout_floor:float = entry.data.get("timeout_floor", DEFAULT_TIMEOUT_FLOOR)
+    timeout_ceiling:float = entry.data.get("timeout_ceiling", DEFAULT_TIMEOUT_CEILING)
+    cistern_capacity:float = entry.data.get("cistern_capacity", 0)
+
+    get_rate_limiter(hass, ip).configure(rate_limit, rate_limit_burst)
+
+    provider_class = await async_get_provider_class(hass, WiloModels(model))
+    pump = provider_class(ip, device_id, hass, burst_interval, max_data_age, timeout_floor, timeout_ceiling, cistern_capacity)
+    try:
+        await pump.async_create_device_info()
+    except Exception as err:
+        await pump.async_close()
+        _remove_unused_rate_limiter(hass, ip)
+        raise ConfigEntryNotReady(f"Unable to read the device info of the pump at {ip}") from err
+
+    statistics_importer = None
+    if long_term_statistics:
+        # Optional features are imported on demand, the recorder modules are only needed if enabled.
+        module = await async_import_module(hass, f"{__name__}.long_term_statistics")
+        statistics_importer = module.LongTermStatisticsImporter(hass, pump, pump.LONG_TERM_STATISTICS, LONG_TERM_STATISTICS_BATCH_HOURS)
+        await statistics_importer.async_load()
+
+        @callback
+        def flush_statistics(event:Event):
+            """Imports the completed hours before home assistant stops, config entries are not unloaded on stop."""
+            statistics_importer.flush()
+
+        entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, flush_statistics))
+
+    history_sink = None
+    if history:
+        module = await async_import_module(hass, f"{__name__}.history")
+        history_sink = module.HistorySink(
+            hass,
+            Path(hass.config.path(HISTORY_DIRECTORY)) / pump.unique_id,
+            pump.DATASTORE.NUMERIC_FIELDS,
+            HISTORY_BATCH_SIZE
+        )
+
+        async def async_flush_history(event:Event):
+            """Writes the buffered history before home assistant stops."""
+            await history_sink.async_flush()
 
-    match model:
-        case WiloModels.RAIN3.value:
-            pump = Rain3Provider(ip, device_id, hass)
-    await pump.async_create_device_info()
+        entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_flush_history))
 
     coordinator = WiloCoordinator(
         hass,
         logger,
         timedelta(seconds=interval),
         f"Wilo {model} ({entry.entry_id})",
-        pump
+        pump,
+        statistics_importer,
+        history_sink
         )
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        await coordinator.async_shutdown()
+        _remove_unused_rate_limiter(hass, ip)
+        raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
@@ -42,6 +112,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "pump": pump
     }
 
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    async_setup_services(hass)
+    views = await async_import_module(hass, f"{__name__}.views")
+    views.async_register_views(hass)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a Wilo config entry, stopping its coordinator and releasing the resources of its pump."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+
+    data = hass.data[DOMAIN].pop(entry.entry_id)
+    await data["coordinator"].async_shutdown()
+    _remove_unused_rate_limiter(hass, entry.data["ip"])
+
+    if not hass.data[DOMAIN]:
+        hass.data.pop(DOMAIN)
+        async_unload_services(hass)
+
+    return True
+
+
+def _remove_unused_rate_limiter(hass:HomeAssistant, ip:str):
+    """Removes the rate limiter of the given host, unless another loaded entry still uses it."""
+    loaded = hass.data.get(DOMAIN, {})
+    if not any(other.data["ip"] == ip for other in hass.config_entries.async_entries(DOMAIN) if other.entry_id in loaded):
+        remove_rate_limiter(hass, ip)
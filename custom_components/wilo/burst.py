@@ -0,0 +1,109 @@
+"""Implements high rate sampling of selected values while the pump is running."""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from statistics import fmean
+
+from homeassistant.core import HomeAssistant
+
+
+class BurstSampler:
+    """Samples values at a high rate while active and aggregates them for publishing.
+
+    Samples are stored in a fixed-size ring buffer and drained by `aggregate`,
+    which is called once per regular update interval.
+    """
+
+    def __init__(
+        self,
+        hass:HomeAssistant,
+        name:str,
+        sample_function:Callable[[], Awaitable[dict[str, float] | None]],
+        keys:tuple[str, ...],
+        interval:float,
+        size:int
+    ):
+        """Initialize the burst sampler.
+
+        :param HomeAssistant hass:
+            Home assistant instance used to run the sampling task.
+
+        :param str name:
+            Name of the sampling task.
+
+        :param Callable sample_function:
+            Coroutine function returning a single sample, or None to end the burst.
+
+        :param tuple[str, ...] keys:
+            Keys of the values contained in each sample.
+
+        :param float interval:
+            Seconds between two samples. Burst sampling is disabled if not greater than zero.
+
+        :param int size:
+            Maximum number of samples kept between two aggregations.
+        """
+        self._hass = hass
+        self._name = name
+        self._sample_function = sample_function
+        self._keys = keys
+        self._interval = interval
+        self._samples:deque[dict[str, float]] = deque(maxlen=size)
+        self._task:asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """True if burst sampling is enabled."""
+        return self._interval > 0
+
+    @property
+    def active(self) -> bool:
+        """True if a burst is currently running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Starts a burst unless it is disabled or already running."""
+        if not self.enabled or self.active:
+            return
+        self._task = self._hass.async_create_background_task(self._async_run(), self._name)
+
+    async def async_stop(self):
+        """Cancels the running burst and waits for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def aggregate(self) -> dict[str, dict[str, float | None]]:
+        """Aggregates and removes all samples collected since the last aggregation.
+
+        :returns dict[str, dict[str, float | None]]:
+            Minimum, maximum, mean and last value for each key, None if no samples were collected.
+        """
+        samples = list(self._samples)
+        self._samples.clear()
+
+        aggregates = {}
+        for key in self._keys:
+            values = [sample[key] for sample in samples]
+            if not values:
+                aggregates[key] = {"min": None, "max": None, "mean": None, "last": None}
+                continue
+            aggregates[key] = {
+                "min": min(values),
+                "max": max(values),
+                "mean": fmean(values),
+                "last": values[-1],
+            }
+        return aggregates
+
+    async def _async_run(self):
+        """Collects samples until the sample function signals the end of the burst."""
+        while (sample := await self._sample_function()) is not None:
+            self._samples.append(sample)
+            await asyncio.sleep(self._interval)
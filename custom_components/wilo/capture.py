@@ -0,0 +1,94 @@
+"""Implements capturing of raw pump traffic for offline profiling and replay."""
+
+import base64
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+
+class TrafficCapture:
+    """Records raw page bodies and step timings of update cycles into a compressed archive.
+
+    The archive is a gzip compressed file containing one JSON document per line and update cycle.
+    """
+
+    def __init__(self, path:Path, cycles:int):
+        """Initialize the capture.
+
+        :param Path path:
+            Path of the archive to be written.
+
+        :param int cycles:
+            Number of update cycles to be captured.
+        """
+        self._path = path
+        self._cycles = cycles
+        self._records:list[dict[str, Any]] = []
+
+    @property
+    def path(self) -> Path:
+        """Path of the archive."""
+        return self._path
+
+    @property
+    def complete(self) -> bool:
+        """True if the requested number of cycles has been captured."""
+        return len(self._records) >= self._cycles
+
+    def add_cycle(self, timestamp:float, pages:dict[str, dict[str, Any]], timings:dict[str, float]):
+        """Adds a captured update cycle.
+
+        :param float timestamp:
+            Unix timestamp of the start of the cycle.
+
+        :param dict[str, dict[str, Any]] pages:
+            Captured response of each page, containing the raw `body` and its `encoding`.
+
+        :param dict[str, float] timings:
+            Duration in seconds of each step of the cycle.
+        """
+        self._records.append({
+            "timestamp": timestamp,
+            "timings": timings,
+            "pages": {
+                url_path: {"encoding": page["encoding"], "body": base64.b64encode(page["body"]).decode("ascii")}
+                for url_path, page in pages.items()
+            },
+        })
+
+    async def async_write(self, hass:HomeAssistant):
+        """Writes the captured cycles to the archive without blocking the event loop.
+
+        :param HomeAssistant hass:
+            Home assistant instance used to run the write in the executor.
+        """
+        await hass.async_add_executor_job(self._write)
+
+    def _write(self):
+        """Writes the captured cycles to the archive."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self._path, "wt", encoding="utf-8") as archive:
+            for record in self._records:
+                archive.write(json.dumps(record) + "\n")
+
+
+def read_capture(path:Path) -> list[dict[str, Any]]:
+    """Reads the cycles of a capture archive, decoding the page bodies.
+
+    :param Path path:
+        Path of the archive.
+
+    :returns list[dict[str, Any]]:
+        Captured cycles in the order they were recorded.
+    """
+    cycles = []
+    with gzip.open(path, "rt", encoding="utf-8") as archive:
+        for line in archive:
+            record = json.loads(line)
+            for page in record["pages"].values():
+                page["body"] = base64.b64decode(page["body"])
+            cycles.append(record)
+    return cycles
@@ -1,14 +1,32 @@
 """Handles config flow for Wilo integration."""
 
+import asyncio
+import ipaddress
+import re
+
 import aiohttp
-import regex as re
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_MAX_DATA_AGE,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_MAX_ADDRESSES,
+    DISCOVERY_TIMEOUT,
+    DOMAIN,
+    SOURCE_BULK_SETUP,
+)
 from .models import WiloModels
+from .rate_limiter import find_rate_limiter
+
+RAIN3_IDENTITY_MARKERS = ("Serial number", "SW Version", "Equipment number")
 
 
 class WiloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -17,11 +35,14 @@ class WiloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self):
         self._flow_data = {}
+        self._discovered_ips:list[str] = []
+        self._additional_ips:list[str] = []
 
     async def _async_verify_connectivity(self, ip_adress:str):
         """Checks the reachability of the specified IP address."""
         session = async_get_clientsession(self.hass)
 
+        await find_rate_limiter(self.hass, ip_adress).async_acquire("config_flow")
         try:
             async with session.get(f"http://{ip_adress}", timeout=10) as response:
                 if response.status != 200:
@@ -46,9 +67,111 @@ class WiloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return True
         return False
 
+    async def _async_probe_rain3(self, session:aiohttp.ClientSession, semaphore:asyncio.Semaphore, ip_adress:str) -> bool:
+        """Checks if a rain3 pump answers at the specified IP address, identified by the content of its identity page."""
+        async with semaphore:
+            await find_rate_limiter(self.hass, ip_adress).async_acquire("discovery")
+            try:
+                async with session.get(f"http://{ip_adress}/identity", timeout=DISCOVERY_TIMEOUT) as response:
+                    if response.status != 200:
+                        return False
+                    text = await response.text()
+            except (aiohttp.ClientError, TimeoutError, UnicodeDecodeError):
+                return False
+        return all(marker in text for marker in RAIN3_IDENTITY_MARKERS)
+
+    async def _async_discover_rain3(self, network:ipaddress.IPv4Network) -> list[str]:
+        """Probes all hosts of the network concurrently and returns the addresses of unconfigured rain3 pumps."""
+        session = async_get_clientsession(self.hass)
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+        configured = {entry.data["ip"] for entry in self.hass.config_entries.async_entries(domain=DOMAIN)}
+
+        hosts = [str(host) for host in network.hosts() if str(host) not in configured]
+        found = await asyncio.gather(*(self._async_probe_rain3(session, semaphore, host) for host in hosts))
+        return [host for host, is_rain3 in zip(hosts, found) if is_rain3]
+
     async def async_step_user(self, user_input=None):
         """Handle config flow start.
 
+        Lets the user choose between entering the address manually and searching the network.
+        """
+        return self.async_show_menu(step_id="user", menu_options=["manual", "discovery"])
+
+    async def async_step_bulk_setup(self, setup_data):
+        """Create an entry for a pump selected during a bulk setup of discovered pumps.
+
+        Started by the flow of the first selected pump with the `SOURCE_BULK_SETUP` source.
+        """
+        for entry in self.hass.config_entries.async_entries(domain=DOMAIN):
+            if entry.data["ip"] == setup_data["ip"]:
+                return self.async_abort(reason="already_configured")
+
+        return self.async_create_entry(
+            title=f"Wilo {setup_data["model"]} ({setup_data["ip"]})",
+            data=setup_data
+        )
+
+    async def async_step_discovery(self, user_input=None):
+        """Handle network discovery.
+
+        Requests the user to enter the IPv4 network (CIDR notation) to be searched for pumps.
+        """
+        errors = {}
+        if user_input is not None:
+            try:
+                network = ipaddress.ip_network(user_input["network"], strict=False)
+            except ValueError:
+                errors["base"] = "invalid_network"
+            else:
+                if not isinstance(network, ipaddress.IPv4Network):
+                    errors["base"] = "network_not_ipv4"
+                elif network.num_addresses > DISCOVERY_MAX_ADDRESSES:
+                    errors["base"] = "network_too_large"
+                else:
+                    self._discovered_ips = await self._async_discover_rain3(network)
+                    if not self._discovered_ips:
+                        errors["base"] = "no_devices_found"
+
+            if "base" in errors:
+                return self.async_show_form(
+                    step_id="discovery",
+                    data_schema=vol.Schema({
+                        vol.Required("network", default=user_input["network"]): str,
+                    }),
+                    errors=errors
+                )
+            return await self.async_step_discovery_select()
+
+        return self.async_show_form(
+            step_id="discovery",
+            data_schema=vol.Schema({
+                vol.Required("network"): str,
+            })
+        )
+
+    async def async_step_discovery_select(self, user_input=None):
+        """Handle selection of the discovered pumps to be set up."""
+        errors = {}
+        if user_input is not None:
+            if not user_input["ips"]:
+                errors["base"] = "no_device_selected"
+            else:
+                self._flow_data["model"] = WiloModels.RAIN3.value
+                self._flow_data["ip"] = user_input["ips"][0]
+                self._additional_ips = user_input["ips"][1:]
+                return await self.async_step_interval()
+
+        return self.async_show_form(
+            step_id="discovery_select",
+            data_schema=vol.Schema({
+                vol.Required("ips", default=self._discovered_ips): cv.multi_select(self._discovered_ips),
+            }),
+            errors=errors
+        )
+
+    async def async_step_manual(self, user_input=None):
+        """Handle manual setup.
+
         Requests the user to enter device relevant information (adress and model)
         """
         models = [model.value for model in WiloModels]
@@ -71,7 +194,7 @@ class WiloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             if "base" in errors:
                 return self.async_show_form(
-                    step_id="user",
+                    step_id="manual",
                     data_schema=vol.Schema({
                         vol.Required("ip", default=user_input["ip"]): str,
                         vol.Required("model", default=user_input["model"]): vol.In(models),
@@ -81,7 +204,7 @@ class WiloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_interval()
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema({
                 vol.Required("ip"): str,
                 vol.Required("model"): vol.In(models),
@@ -96,20 +219,49 @@ class WiloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "interval_is_zero"
             elif user_input["interval"] < 0:
                 errors["base"] = "intervall_smaller_than_zero"
+            elif user_input["timeout_floor"] > user_input["timeout_ceiling"]:
+                errors["base"] = "timeout_floor_above_ceiling"
             else:
                 self._flow_data["interval"] = user_input["interval"]
+                self._flow_data["long_term_statistics"] = user_input["long_term_statistics"]
+                self._flow_data["history"] = user_input["history"]
+                self._flow_data["burst_interval"] = user_input["burst_interval"]
+                self._flow_data["max_data_age"] = user_input["max_data_age"]
+                self._flow_data["rate_limit"] = user_input["rate_limit"]
+                self._flow_data["rate_limit_burst"] = user_input["rate_limit_burst"]
+                self._flow_data["timeout_floor"] = user_input["timeout_floor"]
+                self._flow_data["timeout_ceiling"] = user_input["timeout_ceiling"]
+                self._flow_data["cistern_capacity"] = user_input["cistern_capacity"]
 
             if "base" in errors:
                 return self.async_show_form(
                     step_id="interval",
                     data_schema=vol.Schema({
                         vol.Required("interval", default=60): int,
+                        vol.Required("long_term_statistics", default=user_input["long_term_statistics"]): bool,
+                        vol.Required("history", default=user_input["history"]): bool,
+                        vol.Required("burst_interval", default=user_input["burst_interval"]): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                        vol.Required("max_data_age", default=user_input["max_data_age"]): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                        vol.Required("rate_limit", default=user_input["rate_limit"]): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                        vol.Required("rate_limit_burst", default=user_input["rate_limit_burst"]): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                        vol.Required("timeout_floor", default=user_input["timeout_floor"]): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                        vol.Required("timeout_ceiling", default=user_input["timeout_ceiling"]): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                        vol.Required("cistern_capacity", default=user_input["cistern_capacity"]): vol.All(vol.Coerce(float), vol.Range(min=0)),
                     }),
                     errors=errors
                 )
 
             self._flow_data["device_id"] = self._async_get_id()
 
+            for offset, ip_adress in enumerate(self._additional_ips, start=1):
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": SOURCE_BULK_SETUP},
+                        data={**self._flow_data, "ip": ip_adress, "device_id": self._flow_data["device_id"] + offset}
+                    )
+                )
+
             return self.async_create_entry(
                 title=f"Wilo {self._flow_data["model"]} ({self._flow_data["ip"]})",
                 data=self._flow_data
@@ -119,5 +271,14 @@ class WiloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="interval",
             data_schema=vol.Schema({
                 vol.Required("interval", default=60): int,
+                vol.Required("long_term_statistics", default=False): bool,
+                vol.Required("history", default=False): bool,
+                vol.Required("burst_interval", default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Required("max_data_age", default=DEFAULT_MAX_DATA_AGE): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Required("rate_limit", default=DEFAULT_RATE_LIMIT): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                vol.Required("rate_limit_burst", default=DEFAULT_RATE_LIMIT_BURST): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required("timeout_floor", default=DEFAULT_TIMEOUT_FLOOR): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                vol.Required("timeout_ceiling", default=DEFAULT_TIMEOUT_CEILING): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                vol.Required("cistern_capacity", default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
             })
         )
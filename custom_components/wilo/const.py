@@ -1,3 +1,56 @@
 """Sets constants (like integration domain) to be used across all files."""
 
+from datetime import timedelta
+
 DOMAIN = "wilo"
+
+ROLLING_WINDOW = timedelta(hours=24)
+ROLLING_WINDOW_SIZE = 96
+UNIT_SWITCHES = "switches"
+UNIT_SWITCHES_PER_HOUR = "switches/h"
+
+LONG_TERM_STATISTICS_BATCH_HOURS = 3
+
+BURST_BUFFER_SIZE = 1024
+
+CAPTURE_DIRECTORY = "wilo_captures"
+
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_TIMEOUT = 2
+DISCOVERY_MAX_ADDRESSES = 1024
+SOURCE_BULK_SETUP = "bulk_setup"
+
+DEFAULT_MAX_DATA_AGE = 300
+REVALIDATION_ATTEMPTS = 3
+REVALIDATION_DELAY = 5
+
+DATA_RATE_LIMITERS = f"{DOMAIN}_rate_limiters"
+DATA_VIEWS = f"{DOMAIN}_views"
+DEFAULT_RATE_LIMIT = 4.0
+DEFAULT_RATE_LIMIT_BURST = 8
+
+PAGE_TTLS = {
+    "identity": 3600,
+    "download": 3600,
+    "installation": 300,
+    "settings": 300,
+}
+
+DEFAULT_TIMEOUT_FLOOR = 1.0
+DEFAULT_TIMEOUT_CEILING = 30.0
+TIMEOUT_INITIAL = 5.0
+LATENCY_SMOOTHING = 0.125
+LATENCY_WINDOW_SIZE = 32
+
+PROFILE_DIRECTORY = "wilo_profiles"
+PROFILE_SAMPLE_INTERVAL = 0.005
+
+HISTORY_DIRECTORY = "wilo_history"
+HISTORY_BATCH_SIZE = 60
+
+TREND_WINDOW = timedelta(hours=1)
+TREND_WINDOW_SIZE = 120
+
+VOLUME_TABLE_SIZE = 100
+
+MAX_QUIET_PERIOD = 900
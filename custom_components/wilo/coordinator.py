@@ -1,16 +1,236 @@
 """Coordinator to handle updates."""
 
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .providers import Providers
+from .const import PAGE_TTLS
+from .profiler import UpdateProfiler
+from .providers import BaseProvider
+
+if TYPE_CHECKING:
+    # Optional features, only imported by the setup if enabled.
+    from .history import HistorySink
+    from .long_term_statistics import LongTermStatisticsImporter
 
 
 class WiloCoordinator(DataUpdateCoordinator):
     """Class to regularly fetch new data."""
-    def __init__(self, hass, logger, update_interval, name, pump:Providers):
+    def __init__(
+        self,
+        hass,
+        logger,
+        update_interval,
+        name,
+        pump:BaseProvider,
+        statistics_importer:"LongTermStatisticsImporter | None" = None,
+        history_sink:"HistorySink | None" = None
+    ):
         """Initialize Wilo Coordinator."""
         super().__init__(hass, logger, update_interval=update_interval, name=name)
         self.__pump = pump
+        self.__statistics_importer = statistics_importer
+        self.__history_sink = history_sink
+        self.__generation = 0
+        self.__last_update:float | None = None
+        self.__fetches:dict[asyncio.Future, frozenset[str] | None] = {}
+        self.__refresh_tasks:set[asyncio.Task] = set()
+        self.__profiler:UpdateProfiler | None = None
+        self.__profile_write = False
+        self.__changed_groups:frozenset[str] | None = None
+        self.__notified_success:bool | None = None
+        pump.set_update_listener(self.__handle_provider_update)
+
+    @property
+    def fetch_time(self) -> float | None:
+        """Monotonic time of the last fetch, None if nothing has been fetched yet."""
+        return self.__last_update
+
+    @property
+    def generation(self) -> int:
+        """Generation of the coordinator data, incremented each time new data has been fetched."""
+        return self.__generation
+
+    @property
+    def profiling(self) -> bool:
+        """True while update cycles are profiled, until the profile has been written."""
+        return self.__profiler is not None
+
+    def start_profile(self, profiler:UpdateProfiler):
+        """Profiles the next regular update cycles, including the state write of the entities.
+
+        :param UpdateProfiler profiler:
+            Profiler the cycles are recorded in, written once complete.
+        """
+        if self.__profiler is not None:
+            self.logger.warning("Profiling of %s is already running", self.name)
+            return
+        self.__profiler = profiler
+        profiler.start()
+        self.logger.info("Profiling the next update cycles of %s", self.name)
 
     async def _async_update_data(self):
-        return await self.__pump.async_update()
+        profiler = self.__profiler
+        if profiler is None:
+            return await self._async_fetch(None)
+
+        with profiler.phase("update"):
+            data = await self._async_fetch(None)
+        profiler.add_timings(self.__pump.timings)
+        self.__profile_write = True
+        if profiler.complete:
+            # Listeners are updated synchronously after returning, so the task starts after the state write.
+            self.hass.async_create_task(self.__async_finish_profile(profiler))
+        return data
+
+    @staticmethod
+    def _get_changed_groups(previous, data) -> frozenset[str] | None:
+        """Returns the keys of the datastore data whose content changed, None if all have to be considered changed.
+
+        Pages served from the page cache are the same objects, so most unchanged pages are detected by identity.
+        """
+        if previous is None:
+            return None
+        previous_data = previous.data
+        return frozenset(
+            key for key, value in data.data.items()
+            if key not in previous_data or (previous_data[key] is not value and previous_data[key] != value)
+        )
+
+    @callback
+    def async_update_listeners(self):
+        """Updates the listeners of the groups changed by the last fetch, profiling the state write after a profiled update cycle.
+
+        Listeners without group are always updated, all listeners are updated if the update failed or recovered.
+        """
+        groups = self.__changed_groups
+        self.__changed_groups = None
+        if not self.last_update_success or self.last_update_success != self.__notified_success:
+            groups = None
+        self.__notified_success = self.last_update_success
+
+        profiler = self.__profiler
+        if profiler is None or not self.__profile_write:
+            self.__update_group_listeners(groups)
+            return
+
+        self.__profile_write = False
+        with profiler.phase("entity_write"):
+            self.__update_group_listeners(groups)
+
+    def __update_group_listeners(self, groups:frozenset[str] | None):
+        """Calls the listeners registered with one of the given groups (or without group) as context, all if None."""
+        if groups is None:
+            super().async_update_listeners()
+            return
+        for update_callback, group in list(self._listeners.values()):
+            if group is None or group in groups:
+                update_callback()
+
+    @callback
+    def __handle_provider_update(self, data):
+        """Publishes data the provider fetched outside an update cycle (e.g. a revalidated page).
+
+        The data is not passed to the statistics importer and history sink, which only receive regular fetches.
+        """
+        self.__changed_groups = self._get_changed_groups(self.data, data)
+        self.__generation += 1
+        self.__last_update = time.monotonic()
+        self.async_set_updated_data(data)
+
+    async def async_shutdown(self):
+        """Stops updating, cancels a running refresh, writes buffered data and closes the provider."""
+        await super().async_shutdown()
+        self.__pump.set_update_listener(None)
+
+        tasks = self.__refresh_tasks
+        self.__refresh_tasks = set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if (profiler := self.__profiler) is not None:
+            await self.__async_finish_profile(profiler)
+        if self.__statistics_importer is not None:
+            self.__statistics_importer.flush()
+        if self.__history_sink is not None:
+            await self.__history_sink.async_flush()
+        await self.__pump.async_close()
+
+    async def __async_finish_profile(self, profiler:UpdateProfiler):
+        """Writes the completed profile."""
+        self.__profiler = None
+        self.__profile_write = False
+        await profiler.async_write(self.hass)
+        self.logger.info("Profile of %s written to %s", self.name, profiler.path)
+
+    async def _async_fetch(self, pages:frozenset[str] | None):
+        """Fetches the given pages (all if None) from the pump, registered as in flight for `async_refresh_pages` until done."""
+        done = self.hass.loop.create_future()
+        self.__fetches[done] = pages
+        success = False
+        try:
+            data = await self.__pump.async_update(pages)
+            self.__changed_groups = self._get_changed_groups(self.data, data)
+            if self.__statistics_importer is not None:
+                self.__statistics_importer.add(data)
+            if self.__history_sink is not None:
+                self.__history_sink.add(data)
+            self.__generation += 1
+            self.__last_update = time.monotonic()
+            success = True
+            return data
+        finally:
+            del self.__fetches[done]
+            done.set_result(success)
+
+    @staticmethod
+    def _get_uncovered_pages(pages:frozenset[str] | None, fetched:frozenset[str] | None) -> frozenset[str] | None:
+        """Returns the requested pages a completed fetch did not fetch, an empty set if it covered the request.
+
+        Fetches without page selection (like the regular update) only fetch the pages whose TTL expired,
+        so of a page selection they only cover the pages without TTL.
+
+        :param frozenset[str] | None pages:
+            Requested pages, None for all.
+
+        :param frozenset[str] | None fetched:
+            Pages requested by the completed fetch, None for all.
+        """
+        if fetched is None:
+            return frozenset() if pages is None else frozenset(page for page in pages if page in PAGE_TTLS)
+        return pages if pages is None else pages - fetched
+
+    async def async_refresh_pages(self, pages:frozenset[str] | None = None):
+        """Refreshes the given pages (all if None) outside the regular interval.
+
+        Concurrent requests are coalesced: callers first wait for the fetches in flight (refreshes and the
+        regular update) and then only fetch the pages none of them covered, joining a refresh started meanwhile.
+        Publishing the refreshed data reschedules the regular update, which therefore does not fetch the pages
+        again right after a refresh.
+
+        :param frozenset[str] | None pages:
+            Pages to be refreshed.
+        """
+        while pages != frozenset() and self.__fetches:
+            fetches = dict(self.__fetches)
+            await asyncio.wait(fetches)
+            for done, fetched in fetches.items():
+                if done.result():
+                    pages = self._get_uncovered_pages(pages, fetched)
+
+        if pages == frozenset():
+            return
+
+        # Tasks start eagerly, so the fetch is registered as in flight before the next caller checks.
+        task = self.hass.async_create_task(self.__async_refresh_pages(pages))
+        self.__refresh_tasks.add(task)
+        task.add_done_callback(self.__refresh_tasks.discard)
+        await asyncio.shield(task)
+
+    async def __async_refresh_pages(self, pages:frozenset[str] | None):
+        """Fetches the given pages and publishes the new data to all listeners."""
+        self.async_set_updated_data(await self._async_fetch(pages))
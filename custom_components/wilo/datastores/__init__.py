@@ -1,7 +1,26 @@
-"""Providers are implemented by each provider alongside and offer stored data via property functions."""
+"""Providers are implemented by each provider alongside and offer stored data via property functions.
+
+The datastore of a model is only imported on first access, usually by the provider of its model,
+so modules depending on `BaseDatastore` alone do not pull in the field tables of all models.
+"""
+
+from importlib import import_module
 
 from .base import BaseDatastore
-from .rain3 import Rain3Datastore
 
 __all__ = ["BaseDatastore", "Rain3Datastore"]
-Datastores = Rain3Datastore
\ No newline at end of file
+
+_DATASTORES:dict[str, tuple[str, str]] = {
+    "Rain3Datastore": ("rain3", "Rain3Datastore"),
+    "Datastores": ("rain3", "Rain3Datastore"),
+}
+
+
+def __getattr__(name:str):
+    """Imports the datastore module of the requested datastore class on first access."""
+    if name not in _DATASTORES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, class_name = _DATASTORES[name]
+    value = getattr(import_module(f"{__name__}.{module_name}"), class_name)
+    globals()[name] = value
+    return value
@@ -2,9 +2,33 @@
 
 from typing import Any
 
+from .conversion import Field, FieldConverter, TimeUnit
+
 
 class BaseDatastore:
-    """Base class all providers implement alongside to store data in uniform structure."""
+    """Base class all providers implement alongside to store data in uniform structure.
+
+    Subclasses declare their raw page fields in `FIELDS`. When the subclass is created, an accessor
+    property is generated for each field not implemented by hand, together with `NUMERIC_FIELDS`
+    and the converter. Fields are converted all at once on first access and cached until the data is replaced.
+    """
+
+    FIELDS:dict[str, Field] = {}
+    NUMERIC_FIELDS:tuple[str, ...] = ()
+    _CONVERTER = FieldConverter({})
+
+    def __init_subclass__(cls, **kwargs):
+        """Generates the accessors, numeric field names and converter from the `FIELDS` schema of the subclass."""
+        super().__init_subclass__(**kwargs)
+        if "FIELDS" not in cls.__dict__:
+            return
+
+        cls.NUMERIC_FIELDS = tuple(name for name, field in cls.FIELDS.items() if field.kind is not str)
+        cls._CONVERTER = FieldConverter(cls.FIELDS)
+        for name, field in cls.FIELDS.items():
+            if name not in cls.__dict__:
+                setattr(cls, name, _create_accessor(name, field))
+
     def __init__(self, data:dict[str, Any]):
         """Initialize the PumpData class.
 
@@ -14,14 +38,17 @@ class BaseDatastore:
         Note: Use .update instead of creating a new instance.
         """
         self._data = data
+        self._values:dict[str, Any] | None = None
+        self._conversion_errors:dict[str, str] = {}
 
     def update(self, data:dict[str, Any]):
-        """Replaces the stored data with the new provided version.
+        """Replaces the stored data with the new provided version, discarding converted values.
 
         :param dict[str, Any] data:
             New dictionary replacing the internally stores one.
         """
         self._data = data
+        self._values = None
 
     @property
     def data(self) -> dict[str, Any]:
@@ -31,3 +58,51 @@ class BaseDatastore:
             Dictionary containing extracted data by the pump provider.
         """
         return self._data
+
+    @property
+    def conversion_errors(self) -> dict[str, str]:
+        """Raw values of fields which could not be converted, by field name."""
+        self._convert()
+        return self._conversion_errors
+
+    @property
+    def numeric_values(self) -> dict[str, float]:
+        """Values of the numeric fields listed in `NUMERIC_FIELDS`, leaving out missing fields and unparseable durations."""
+        values = self._convert()
+        return {name: values[name] for name in self.NUMERIC_FIELDS if values.get(name) is not None}
+
+    def _convert(self) -> dict[str, Any]:
+        """Converts all fields described in `FIELDS`, unless already converted.
+
+        :returns dict[str, Any]:
+            Converted values by field name.
+        """
+        if self._values is None:
+            self._values, self._conversion_errors = self._CONVERTER.convert(self._data)
+        return self._values
+
+
+def _create_accessor(name:str, field:Field) -> property:
+    """Creates the property returning the converted value of a field.
+
+    :raises KeyError:
+        The field is missing in the fetched data or could not be converted, unless the field is optional.
+    """
+    if field.optional:
+        def get(self:BaseDatastore) -> Any:
+            values = self._values
+            if values is None:
+                values = self._convert()
+            return values.get(name)
+    else:
+        def get(self:BaseDatastore) -> Any:
+            values = self._values
+            if values is None:
+                values = self._convert()
+            return values[name]
+
+    get.__name__ = name
+    get.__doc__ = field.doc
+    kind = int if isinstance(field.kind, TimeUnit) else field.kind
+    get.__annotations__ = {"return": kind | None if field.optional else kind}
+    return property(get)
@@ -0,0 +1,150 @@
+"""Implements the declarative field schema of the datastores and the table driven conversion of raw page fields into typed values."""
+
+from collections.abc import Callable
+from datetime import timedelta
+from enum import IntEnum
+from functools import partial
+import re
+from typing import Any, NamedTuple
+
+
+class TimeUnit(IntEnum):
+    """Contains conversion factors for converting strings into times."""
+    SECONDS = 1
+    MINUTES = 60
+    HOURS = 3600
+    DAYS = 86400
+
+
+class Entity(NamedTuple):
+    """Describes the sensor entity generated for a field.
+
+    `key` is used as translation key and as partial unique id of the entity,
+    the remaining attributes are passed on to the sensor descriptor.
+    """
+
+    key: str
+    device_class: str | None = None
+    native_unit: str | None = None
+    unit: str | None = None
+    state_class: str | None = None
+    category: str | None = None
+    enabled: bool = True
+    extrapolation_rate: float = 0
+    extrapolation_interval: float = 1
+    significant_change: float = 0
+    significant_change_relative: float = 0
+    max_quiet_period: float = 0
+
+
+class Field(NamedTuple):
+    """Describes a raw field of a page, the type it is converted to and the entity presenting it.
+
+    `kind` is either `int`, `float` or `str`, or a `TimeUnit` for durations
+    like `1h 20min` which are converted into an integer of the given unit, None if not parseable.
+    The datastore accessor of the field returns None instead of raising a `KeyError` if the field is `optional`.
+    """
+
+    page: str
+    key: str
+    kind: type | TimeUnit = str
+    unit: str | None = None
+    lower: bool = False
+    doc: str = ""
+    optional: bool = False
+    entity: Entity | None = None
+
+
+class FieldConverter:
+    """Converts all described fields of the raw page data at once, collecting fields that cannot be parsed."""
+
+    _RE_DURATION = re.compile(
+        r"""
+        ^
+        (?:(?P<days>\d+)\s*(?:d|days))?
+        \s*?
+        (?:(?P<hours>\d+)\s*(?:h|hours))?
+        \s*?
+        (?:(?P<minutes>\d+)\s*(?:m|min|minutes))?
+        \s*?
+        (?:(?P<seconds>\d+)\s*(?:s|sec|seconds))?
+        $
+        """,
+        re.VERBOSE | re.IGNORECASE,
+    )
+
+    def __init__(self, fields:dict[str, Field]):
+        """Initialize the converter, building the parse function of each field once.
+
+        :param dict[str, Field] fields:
+            Fields to be converted, by name.
+        """
+        self._fields = [
+            (name, field.page, field.key, self._build_parser(field), isinstance(field.kind, TimeUnit))
+            for name, field in fields.items()
+        ]
+
+    def convert(self, data:dict[str, dict[str, Any]]) -> tuple[dict[str, Any], dict[str, str]]:
+        """Converts the fields found in the given page data.
+
+        Fields whose page or key is missing are left out of both results. Fields that cannot be parsed
+        are left out of the values, except durations which are None like a countdown the pump does not run.
+
+        :param dict[str, dict[str, Any]] data:
+            Parsed data of each page.
+
+        :returns tuple[dict[str, Any], dict[str, str]]:
+            Converted values by name and the raw values of fields that could not be parsed.
+        """
+        values = {}
+        errors = {}
+        empty = {}
+        for name, page, key, parse, duration in self._fields:
+            raw = data.get(page, empty).get(key)
+            if raw is None:
+                continue
+            try:
+                values[name] = parse(raw)
+            except ValueError:
+                errors[name] = raw
+                if duration:
+                    values[name] = None
+        return values, errors
+
+    @classmethod
+    def _build_parser(cls, field:Field) -> Callable[[str], Any]:
+        """Builds the function converting a raw value of the field.
+
+        The returned function raises a `ValueError` if the raw value does not match the field description.
+        """
+        if field.kind is str:
+            return str.lower if field.lower else str
+
+        if isinstance(field.kind, TimeUnit):
+            return partial(cls._parse_duration, field.kind)
+
+        kind = field.kind
+        suffix = (field.unit or "").lower()
+        size = len(suffix)
+
+        def parse(raw:str) -> Any:
+            value = raw.strip()
+            if size and value[-size:].lower() == suffix:
+                value = value[:-size]
+            return kind(value)
+
+        return parse
+
+    @classmethod
+    def _parse_duration(cls, unit:TimeUnit, raw:str) -> int:
+        """Converts a duration like `1h 20min` into an integer of the given unit."""
+        match = cls._RE_DURATION.fullmatch(raw.strip())
+        if not match:
+            raise ValueError(raw)
+        total = timedelta(
+            days=int(match.group("days") or 0),
+            hours=int(match.group("hours") or 0),
+            minutes=int(match.group("minutes") or 0),
+            seconds=int(match.group("seconds") or 0),
+        ).total_seconds()
+        return int(total // unit)
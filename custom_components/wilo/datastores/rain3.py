@@ -1,38 +1,340 @@
 """Implements the datastore for the rain3 pump."""
 
-from datetime import timedelta
-from enum import IntEnum
+from functools import partial
 
-import regex as re
+from homeassistant.components.sensor import (
+    EntityCategory,
+    SensorDeviceClass,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfLength, UnitOfPressure, UnitOfTime
 
+from ..const import MAX_QUIET_PERIOD
 from .base import BaseDatastore
+from .conversion import Entity, Field, TimeUnit
 
-
-class TimeUnit(IntEnum):
-    """Contains conversion factors for converting strings into times."""
-    SECONDS = 1
-    MINUTES = 60
-    HOURS = 3600
-    DAYS = 86400
+_Diagnostic = partial(Entity, category=EntityCategory.DIAGNOSTIC, enabled=False)
 
 
 class Rain3Datastore(BaseDatastore):
-    """Datastore used to make fetched data accessible to rain3 sensors."""
-
-    @property
-    def serial_number(self) -> str:
-        """Serial number of the pump."""
-        return self._data["identity"]["Serial number"]
-
-    @property
-    def software_version(self) -> str:
-        """Software version running on the controller."""
-        return self._data["identity"]["SW Version"]
-
-    @property
-    def equipment_number(self) -> str:
-        """Equipment number of the pump."""
-        return self._data["identity"]["Equipment number"]
+    """Datastore used to make fetched data accessible to rain3 sensors.
+
+    `FIELDS` is the schema of the raw page fields: the accessor of each field and the
+    descriptors of the entities presenting them are generated from it, see `BaseDatastore`.
+    Values derived from several fields or computed by the provider are implemented as properties.
+    """
+
+    FIELDS = {
+        "serial_number": Field(
+            "identity", "Serial number", str,
+            doc="Serial number of the pump.",
+            entity=_Diagnostic("serial_number"),
+        ),
+        "software_version": Field(
+            "identity", "SW Version", str,
+            doc="Software version running on the controller.",
+            entity=_Diagnostic("software_version"),
+        ),
+        "equipment_number": Field(
+            "identity", "Equipment number", str,
+            doc="Equipment number of the pump.",
+            entity=_Diagnostic("equipment_number"),
+        ),
+        "pump_pressure": Field(
+            "state", "Pressure", float, "bar",
+            doc="Currently measured pressure.",
+            entity=Entity("pressure", device_class=SensorDeviceClass.PRESSURE, native_unit=UnitOfPressure.BAR, significant_change=0.05, max_quiet_period=MAX_QUIET_PERIOD),
+        ),
+        "cistern_level": Field(
+            "state", "Level", float, "cm",
+            doc="Fill level of the cistern.",
+            entity=Entity("cistern_level", device_class=SensorDeviceClass.DISTANCE, native_unit=UnitOfLength.CENTIMETERS, unit=UnitOfLength.CENTIMETERS, state_class=SensorStateClass.MEASUREMENT, significant_change=1, max_quiet_period=MAX_QUIET_PERIOD),
+        ),
+        "calc_protection_timer": Field(
+            "state", "Calc. protection in", TimeUnit.HOURS,
+            doc="Remaining time in hours for the calc. protection timer.",
+            entity=_Diagnostic("calc_protection_timer", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.HOURS, unit=UnitOfTime.HOURS),
+        ),
+        "flushing_timer": Field(
+            "state", "Flushing in", TimeUnit.HOURS,
+            doc="Remaining time in hours for the flushing timer.",
+            entity=_Diagnostic("flushing_timer", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.HOURS, unit=UnitOfTime.HOURS),
+        ),
+        "connected_wifi_ssid": Field(
+            "download", "Connected to", str,
+            doc="SSID of the wifi network the pump is connected to.",
+        ),
+        "connected_wifi_ip": Field(
+            "download", "Webserver IP", str,
+            doc="IP address of the pump in the Wi-Fi network.",
+        ),
+        "switch_on_pressure": Field(
+            "settings", "MP switch-on pressure", float, "bar",
+            doc="Switch on pressure of main pump in bar.",
+            entity=_Diagnostic("switch_on_pressure", device_class=SensorDeviceClass.PRESSURE, native_unit=UnitOfPressure.BAR, unit=UnitOfPressure.BAR),
+        ),
+        "switch_off_pressure": Field(
+            "settings", "MP switch-off pressure", float, "bar",
+            doc="Switch off pressure of main pump in bar.",
+            entity=_Diagnostic("switch_off_pressure", device_class=SensorDeviceClass.PRESSURE, native_unit=UnitOfPressure.BAR, unit=UnitOfPressure.BAR),
+        ),
+        "main_pump_stop_delay": Field(
+            "settings", "Stop MP in", int, "s",
+            doc="Delay, in seconds, after the main pump is stopped when the switch-off pressure is reached.",
+            entity=_Diagnostic("mp_stop_delay", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "cistern_pump_start_time": Field(
+            "settings", "CP start time", int, "s",
+            doc="Start time related to start of main pump.",
+            entity=_Diagnostic("cp_start_time", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "cistern_pump_stop_time": Field(
+            "settings", "CP stop time", int, "s",
+            doc="Start time related to stop of main pump.",
+            entity=_Diagnostic("cp_stop_time", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "pressure_delta_for_tap_water": Field(
+            "settings", "CP start time", int, "s",
+            doc="Modifier for the switch-off pressure when in tap water operation.",
+            entity=_Diagnostic("pressure_delta_tap_water", device_class=SensorDeviceClass.PRESSURE, native_unit=UnitOfPressure.BAR, unit=UnitOfPressure.BAR),
+        ),
+        "interval_for_switch_off_pressure_reduction": Field(
+            "settings", "Time pressure compare", int, "s",
+            doc="Interval at which the switch-off pressure will be (abitraitly) reduced by the in `pressure_reduction_amount` specified amount.",
+            entity=_Diagnostic("pressure_reduction_interval", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "pressure_reduction_amount": Field(
+            "settings", "Pressure jump in RWM", float, "bar",
+            doc="Value by which the switch-off pressure is reduced after the time set in `delay_for_switch_off_pressure_reduction` has elapsed.",
+            entity=_Diagnostic("pressure_reduction_amount", device_class=SensorDeviceClass.PRESSURE, native_unit=UnitOfPressure.BAR, unit=UnitOfPressure.BAR),
+        ),
+        "main_pump_mode": Field(
+            "settings", "Main pump mode", str, lower=True,
+            doc="Set mode for the main pump.",
+            entity=_Diagnostic("mp_mode"),
+        ),
+        "main_pump_current_runtime": Field(
+            "state", "MP running for", TimeUnit.SECONDS,
+            doc="Current runtime of the main pump in seconds.",
+            optional=True,
+            entity=Entity("running_duration", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.MINUTES, extrapolation_rate=1, extrapolation_interval=5, category=EntityCategory.DIAGNOSTIC),
+        ),
+        "main_pump_stop_in": Field(
+            "state", "Stop MP in", TimeUnit.SECONDS,
+            doc="Countdown for when the main pump stops after the switch-off pressure is reached.",
+            optional=True,
+            entity=_Diagnostic("mp_stop_in", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS, extrapolation_rate=-1, extrapolation_interval=1),
+        ),
+        "cistern_pump_mode": Field(
+            "settings", "Cistern pump mode", str, lower=True,
+            doc="Set mode for the cistern pump.",
+            entity=_Diagnostic("cp_mode"),
+        ),
+        "main_pump_manual_runtime": Field(
+            "settings", "Running time MP manual", int, "s",
+            doc="Duration for which the main pump runs when `main_pump_mode` is set to `Man`.",
+            entity=_Diagnostic("mp_manual_runtime", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "cistern_pump_manual_runtime": Field(
+            "settings", "Running time CP manual", int, "s",
+            doc="Duration for which the cistern pump runs when `main_pump_mode` is set to `Man`.",
+            entity=_Diagnostic("cp_manual_runtime", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "main_pump_switches_counter": Field(
+            "setup", "MP switches", int,
+            doc="Incremental counter for how many times the main pump turned on.",
+            entity=_Diagnostic("mp_switches", state_class=SensorStateClass.TOTAL_INCREASING),
+        ),
+        "main_pump_total_runtime": Field(
+            "setup", "MP", TimeUnit.MINUTES,
+            doc="Incremental meter for how long the main pump ran in minutes.",
+            entity=_Diagnostic("mp_hours", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.HOURS, unit=UnitOfTime.HOURS, state_class=SensorStateClass.TOTAL_INCREASING),
+        ),
+        "cistern_pump_switches_counter": Field(
+            "setup", "CP switches", int,
+            doc="Incremental counter for how many times the cistern pump turned on.",
+            entity=_Diagnostic("cp_switches", state_class=SensorStateClass.TOTAL_INCREASING),
+        ),
+        "cistern_pump_total_runtime": Field(
+            "setup", "CP", TimeUnit.MINUTES,
+            doc="Incremental meter for how long the cistern pump ran in minutes.",
+            entity=_Diagnostic("cp_hours", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.HOURS, unit=UnitOfTime.HOURS, state_class=SensorStateClass.TOTAL_INCREASING),
+        ),
+        "system_total_runtime": Field(
+            "setup", "System", TimeUnit.HOURS,
+            doc="Incremental meter for how long the system ran in hours.",
+            entity=_Diagnostic("system_hours", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.HOURS, unit=UnitOfTime.HOURS, state_class=SensorStateClass.TOTAL_INCREASING),
+        ),
+        "system_switches_counter": Field(
+            "setup", "System switches", int,
+            doc="Incremental meter for how many times the system was powercycled.",
+            entity=_Diagnostic("system_switches", state_class=SensorStateClass.TOTAL_INCREASING),
+        ),
+        "main_pump_type": Field(
+            "installation", "Pump type", str, lower=True,
+            doc="Model string of the main pump.",
+            entity=_Diagnostic("mp_type"),
+        ),
+        "cistern_pump_count": Field(
+            "installation", "Number of CP", int,
+            doc="Number of installed cistern pumps for this system.",
+            entity=_Diagnostic("cp_count"),
+        ),
+        "pressure_range": Field(
+            "installation", "Sensor range pressure", float, "bar",
+            doc="Upper limit (starting at 0.0) for the installed analog pressure sensor in bar.",
+            entity=_Diagnostic("pressure_range", device_class=SensorDeviceClass.PRESSURE, native_unit=UnitOfPressure.BAR, unit=UnitOfPressure.BAR),
+        ),
+        "over_pressure_threshold": Field(
+            "installation", "Threshold over pressure", float, "bar",
+            doc="Threshold to generate an error if reached.",
+            entity=_Diagnostic("over_pressure_threshold", device_class=SensorDeviceClass.PRESSURE, native_unit=UnitOfPressure.BAR, unit=UnitOfPressure.BAR),
+        ),
+        "cistern_sensor_range": Field(
+            "installation", "Sensor range level cistern", float, "m",
+            doc="Upper limit (starting at 0.0) for the installed cistern level sensor in meters.",
+            entity=_Diagnostic("cistern_sensor_range", device_class=SensorDeviceClass.DISTANCE, native_unit=UnitOfLength.METERS, unit=UnitOfLength.METERS),
+        ),
+        "cistern_sensor_installed_height": Field(
+            "installation", "Level sensor inst. height", float, "cm",
+            doc="Distance between ground level and installed height of the cistern sensor.",
+            entity=_Diagnostic("cistern_sensor_installed_height", device_class=SensorDeviceClass.DISTANCE, native_unit=UnitOfLength.CENTIMETERS, unit=UnitOfLength.CENTIMETERS),
+        ),
+        "high_water_threshold": Field(
+            "installation", "High water on threshold", float, "cm",
+            doc="Level threshold in cistern, if exceeded (`over_flow_threshold` + `high_water_threshold` > `cistern_level`), high water is reported.",
+            entity=_Diagnostic("high_water_threshold", device_class=SensorDeviceClass.DISTANCE, native_unit=UnitOfLength.CENTIMETERS, unit=UnitOfLength.CENTIMETERS),
+        ),
+        "cistern_shape": Field(
+            "installation", "Cistern shape", str, lower=True,
+            doc="Cisterns defined shape, used for volume calculation.",
+            entity=_Diagnostic("cistern_shape"),
+        ),
+        "cistern_height_or_diameter": Field(
+            "installation", "Cistern high/diameter", float, "cm",
+            doc="Provides the height or diameter parameter to enable cistern volume calculation.",
+            entity=_Diagnostic("cistern_height_or_diameter", device_class=SensorDeviceClass.DISTANCE, native_unit=UnitOfLength.CENTIMETERS, unit=UnitOfLength.CENTIMETERS),
+        ),
+        "pump_kick_interval": Field(
+            "installation", "Pump kick interval", int, "hours",
+            doc="Interval in hours between pump kicks. Internal countdown is reset to set value if the pump is turned on.",
+            entity=_Diagnostic("pump_kick_interval", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.HOURS, unit=UnitOfTime.HOURS),
+        ),
+        "pump_kick_duration": Field(
+            "installation", "Pump kick duration", int, "s",
+            doc="Duration in seconds the pump is running during pump kick.",
+            entity=_Diagnostic("pump_kick_duration", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "over_flow_threshold": Field(
+            "installation", "Over flow on threshold", int, "cm",
+            doc="Level threshold in cistern, if exceeded, high water is reported.",
+            entity=_Diagnostic("over_flow_threshold", device_class=SensorDeviceClass.DISTANCE, native_unit=UnitOfLength.CENTIMETERS, unit=UnitOfLength.CENTIMETERS),
+        ),
+        "tap_water_threshold": Field(
+            "installation", "Tap water on threshold", int, "cm",
+            doc="Level threshold in cistern, if fallen below, three way valve will be set to tap water.",
+            entity=_Diagnostic("tap_water_threshold", device_class=SensorDeviceClass.DISTANCE, native_unit=UnitOfLength.CENTIMETERS, unit=UnitOfLength.CENTIMETERS),
+        ),
+        "rain_water_threshold": Field(
+            "installation", "Rain water on threshold", int, "cm",
+            doc="Level threshold in cistern, if exceeded, three way valve will be set to rain water.",
+            entity=_Diagnostic("rain_water_threshold", device_class=SensorDeviceClass.DISTANCE, native_unit=UnitOfLength.CENTIMETERS, unit=UnitOfLength.CENTIMETERS),
+        ),
+        "calcination_protection_interval": Field(
+            "installation", "Calcination protection", int, "days",
+            doc="Interval in days between calcination protection cycles.",
+            entity=_Diagnostic("calcination_protection_interval", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.DAYS, unit=UnitOfTime.DAYS),
+        ),
+        "flushing_interval": Field(
+            "installation", "System flushing", int, "days",
+            doc="Interval in days between flushing cycles.",
+            entity=_Diagnostic("flushing_interval", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.DAYS, unit=UnitOfTime.DAYS),
+        ),
+        "flushing_duration": Field(
+            "installation", "Flushing duration", int, "min",
+            doc="Duration in minutes of the flushing cycle.",
+            entity=_Diagnostic("flushing_duration", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.MINUTES, unit=UnitOfTime.MINUTES),
+        ),
+        "pump_max_runtime": Field(
+            "installation", "Max. running time pump", int, "min",
+            doc="Maximum allowed running time of pump before error is generated.",
+            entity=_Diagnostic("pump_max_runtime", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.MINUTES, unit=UnitOfTime.MINUTES),
+        ),
+        "fault_message_behavior": Field(
+            "installation", "Fault message behavior", str, lower=True,
+            doc="Defines the fault message behaviour (rising or falling signal).",
+            entity=_Diagnostic("fault_message_behavior"),
+        ),
+        "minimum_pressure": Field(
+            "installation", "Minimum pressure", float, "bar",
+            doc="Minimum pressure setpoint, if fallen below, dry running alarm is raised.",
+            entity=_Diagnostic("minimum_pressure", device_class=SensorDeviceClass.PRESSURE, native_unit=UnitOfPressure.BAR, unit=UnitOfPressure.BAR),
+        ),
+        "dry_run_delay": Field(
+            "installation", "Delay dry run protection", int, "s",
+            doc="Set delay to detect dry running.",
+            entity=_Diagnostic("dry_run_delay", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "dry_run_tap_water": Field(
+            "installation", "Dry run tap water mode", int, "s",
+            doc='Time in seconds in "tap water"-mode for the pump to build up pressure.',
+            entity=_Diagnostic("dry_run_tap_water", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "dry_run_rain_water": Field(
+            "installation", "Dry run rain water mode", int, "s",
+            doc='Time in seconds in "rain water"-mode for the pump to build up pressure.',
+            entity=_Diagnostic("dry_run_rain_water", device_class=SensorDeviceClass.DURATION, native_unit=UnitOfTime.SECONDS, unit=UnitOfTime.SECONDS),
+        ),
+        "max_pump_cycles_per_hour": Field(
+            "installation", "Max. pump cycles per hour", int, "/hour",
+            doc="Maximum allowed pump cycles per hour before the pump raises an alarm.",
+        ),
+        "max_pump_cycles_alarm_count": Field(
+            "setup", "Max. pump cycles/hour", int, "x",
+            doc="Counter for how often the maximum set max pump cycles per hour fault alarm occured.",
+            entity=_Diagnostic("maximum_pump_cycles_per_hour"),
+        ),
+        "pressure_sensor_fault_alarm_count": Field(
+            "setup", "Pressure sensor fault", int, "x",
+            doc="Counter for how often the pressure sensor fault alarm occured.",
+        ),
+        "dry_running_tap_water_alarm_count": Field(
+            "setup", "Dry running RWM", int, "x",
+            doc="Counter for how often the dry running alarm in tap water mode occured.",
+        ),
+        "dry_running_rain_water_alarm_count": Field(
+            "setup", "Dry running TWM", int, "x",
+            doc="Counter for how often the dry running alarm in rain water mode occured.",
+        ),
+        "max_pump_runtime_alarm_count": Field(
+            "setup", "Max. runtime pump", int, "x",
+            doc="Counter for how often the maximum set runtime was reached.",
+        ),
+        "break_tank_overflow_alarm_count": Field(
+            "setup", "Break tank overflow", int, "x",
+            doc="Counter for how often the break tank overflow alarm occured.",
+        ),
+        "cistern_backflow_alarm_count": Field(
+            "setup", "Cistern backflow", int, "x",
+            doc="Counter for how often the cistern backflow alarm occured.",
+        ),
+        "cistern_overflow_alarm_count": Field(
+            "setup", "Cistern overflow", int, "x",
+            doc="Counter for how often the cistern overflow alarm occured.",
+        ),
+        "high_water_alarm_count": Field(
+            "setup", "High water alarm", int, "x",
+            doc="Counter for how often the high water alarm occured.",
+        ),
+        "level_sensor_fault_alarm_count": Field(
+            "setup", "Level sensor fault", int, "x",
+            doc="Counter for how often the level sensor fault alarm occured.",
+        ),
+        "system_over_pressure_alarm_count": Field(
+            "setup", "System over pressure", int, "x",
+            doc="Counter for how often the system over pressure alarm occured.",
+        ),
+    }
 
     @property
     def is_alarm_active(self) -> str:
@@ -62,31 +364,11 @@ class Rain3Datastore(BaseDatastore):
         """Indicator if the pump is running."""
         return self._data["state"]["MP"] == "ON"
 
-    @property
-    def pump_pressure(self) -> float:
-        """Currently measured pressure."""
-        return float(self._data["state"]["Pressure"].lower().replace("bar", "").strip())
-
-    @property
-    def cistern_level(self) -> int:
-        """Fill level of the cistern."""
-        return float(self._data["state"]["Level"].lower().replace("cm", "").strip())
-
     @property
     def valve_position(self) -> str:
         """Position of the three way valve."""
         return self._data["state"]["Ways-valve"].lower().replace(" ", "_")
 
-    @property
-    def calc_protection_timer(self) -> int:
-        """Remaining time in hours for the calc. protection timer."""
-        return self.__calculate_time_from_string(self._data["state"]["Calc. protection in"], TimeUnit.HOURS)
-
-    @property
-    def flushing_timer(self) -> int:
-        """Remaining time in hours for the flushing timer."""
-        return self.__calculate_time_from_string(self._data["state"]["Flushing in"], TimeUnit.HOURS)
-
     @property
     def pump_switches_this_hour(self) -> int:
         """Incremental counter for the pump switches this hour."""
@@ -95,344 +377,128 @@ class Rain3Datastore(BaseDatastore):
         except KeyError:
             return 0
 
-    @property
-    def connected_wifi_ssid(self) -> str:
-        """SSID of the wifi network the pump is connected to."""
-        return self._data["download"]["Connected to"]
-
-    @property
-    def connected_wifi_ip(self) -> str:
-        """IP address of the pump in the Wi-Fi network."""
-        return self._data["download"]["Webserver IP"]
-
-    @property
-    def switch_on_pressure(self) -> float:
-        """Switch on pressure of main pump in bar."""
-        return float(self._data["settings"]["MP switch-on pressure"].lower().replace("bar", "").strip())
-
     @property
     def is_switch_on_pressure_reached(self) -> bool:
         """True if the main pumps switch on pressure is reached."""
         return self._data["state"]["Switch on"] == "reached!"
 
-    @property
-    def switch_off_pressure(self) -> float:
-        """Switch off pressure of main pump in bar."""
-        return float(self._data["settings"]["MP switch-off pressure"].lower().replace("bar", "").strip())
-
     @property
     def is_switch_off_pressure_reached(self) -> bool:
         """True if the main pumps switch on pressure is reached."""
         return self._data["state"]["Switch off"] == "reached!"
 
-    @property
-    def main_pump_stop_delay(self) -> int:
-        """Delay, in seconds, after the main pump is stopped when the switch-off pressure is reached."""
-        return int(self._data["settings"]["Stop MP in"].lower().replace("s", "").strip())
-
-    @property
-    def cistern_pump_start_time(self) -> int:
-        """Start time related to start of main pump."""
-        return int(self._data["settings"]["CP start time"].lower().replace("s", "").strip())
-
-    @property
-    def cistern_pump_stop_time(self) -> int:
-        """Start time related to stop of main pump."""
-        return int(self._data["settings"]["CP stop time"].lower().replace("s", "").strip())
-
-    @property
-    def pressure_delta_for_tap_water(self) -> int:
-        """Modifier for the switch-off pressure when in tap water operation."""
-        return int(self._data["settings"]["CP start time"].lower().replace("s", "").strip())
-
-    @property
-    def interval_for_switch_off_pressure_reduction(self) -> int:
-        """Interval at which the switch-off pressure will be (abitraitly) reduced by the in `pressure_reduction_amount` specified amount."""
-        return int(self._data["settings"]["Time pressure compare"].lower().replace("s", "").strip())
-
-    @property
-    def pressure_reduction_amount(self) -> float:
-        """Value by which the switch-off pressure is reduced after the time set in `delay_for_switch_off_pressure_reduction` has elapsed."""
-        return float(self._data["settings"]["Pressure jump in RWM"].lower().replace("bar", "").strip())
-
     @property
     def is_drive_on(self) -> bool:
         """True if the drives of the pump are active."""
         return self._data["settings"]["Drives"] == "ON"
 
-    @property
-    def main_pump_mode(self) -> str:
-        """Set mode for the main pump."""
-        return self._data["settings"]["Main pump mode"].lower()
-
-    @property
-    def main_pump_current_runtime(self) -> int:
-        """Current runtime of the main pump in seconds."""
-        try:
-            return self.__calculate_time_from_string(self._data["state"]["MP running for"], TimeUnit.SECONDS)
-        except KeyError:
-            return None
-
-    @property
-    def main_pump_stop_in(self) -> int:
-        """Countdown for when the main pump stops after the switch-off pressure is reached."""
-        try:
-            return self.__calculate_time_from_string(self._data["state"]["Stop MP in"], TimeUnit.SECONDS)
-        except KeyError:
-            return None
-
-    @property
-    def cistern_pump_mode(self) -> str:
-        """Set mode for the cistern pump."""
-        return self._data["settings"]["Cistern pump mode"].lower()
-
-    @property
-    def main_pump_manual_runtime(self) -> int:
-        """Duration for which the main pump runs when `main_pump_mode` is set to `Man`."""
-        return int(self._data["settings"]["Running time MP manual"].lower().replace("s", "").strip())
-
-    @property
-    def cistern_pump_manual_runtime(self) -> int:
-        """Duration for which the cistern pump runs when `main_pump_mode` is set to `Man`."""
-        return int(self._data["settings"]["Running time CP manual"].lower().replace("s", "").strip())
-
-    @property
-    def main_pump_switches_counter(self) -> int:
-        """Incremental counter for how many times the main pump turned on."""
-        return int(self._data["setup"]["MP switches"])
-
-    @property
-    def main_pump_total_runtime(self) -> int:
-        """Incremental meter for how long the main pump ran in minutes."""
-        return self.__calculate_time_from_string(self._data["setup"]["MP"], TimeUnit.MINUTES)
-
-    @property
-    def cistern_pump_switches_counter(self) -> int:
-        """Incremental counter for how many times the cistern pump turned on."""
-        return int(self._data["setup"]["CP switches"])
-
-    @property
-    def cistern_pump_total_runtime(self) -> int:
-        """Incremental meter for how long the cistern pump ran in minutes."""
-        return self.__calculate_time_from_string(self._data["setup"]["CP"], TimeUnit.MINUTES)
-
-    @property
-    def system_total_runtime(self) -> int:
-        """Incremental meter for how long the system ran in hours."""
-        return self.__calculate_time_from_string(self._data["setup"]["System"], TimeUnit.HOURS)
-
-    @property
-    def system_switches_counter(self) -> int:
-        """Incremental meter for how many times the system was powercycled."""
-        return int(self._data["setup"]["System switches"])
-
-    @property
-    def main_pump_type(self) -> str:
-        """Model string of the main pump."""
-        return self._data["installation"]["Pump type"].lower()
-
-    @property
-    def cistern_pump_count(self) -> int:
-        """Number of installed cistern pumps for this system."""
-        return int(self._data["installation"]["Number of CP"])
-
-    @property
-    def pressure_range(self) -> float:
-        """Upper limit (starting at 0.0) for the installed analog pressure sensor in bar."""
-        return float(self._data["installation"]["Sensor range pressure"].lower().replace("bar", "").strip())
-
-    @property
-    def over_pressure_threshold(self) -> float:
-        """Threshold to generate an error if reached."""
-        return float(self._data["installation"]["Threshold over pressure"].lower().replace("bar", "").strip())
-
-    @property
-    def cistern_sensor_range(self) -> float:
-        """Upper limit (starting at 0.0) for the installed cistern level sensor in meters."""
-        return float(self._data["installation"]["Sensor range level cistern"].lower().replace("m", "").strip())
-
-    @property
-    def cistern_sensor_installed_height(self) -> float:
-        """Distance between ground level and installed height of the cistern sensor."""
-        return float(self._data["installation"]["Level sensor inst. height"].lower().replace("cm", "").strip())
-
-    @property
-    def high_water_threshold(self) -> int:
-        """Level threshold in cistern, if exceeded (`over_flow_threshold` + `high_water_threshold` > `cistern_level`), high water is reported."""
-        return float(self._data["installation"]["High water on threshold"].lower().replace("cm", "").strip())
-
-    @property
-    def cistern_shape(self) -> str:
-        """Cisterns defined shape, used for volume calculation."""
-        return self._data["installation"]["Cistern shape"].lower()
-
-    @property
-    def cistern_height_or_diameter(self) -> int:
-        """Provides the height or diameter parameter to enable cistern volume calculation."""
-        return float(self._data["installation"]["Cistern high/diameter"].lower().replace("cm", "").strip())
-
     @property
     def pump_kick_enabled(self) -> bool:
         """Indicates if the pump kick is enabled. Interval (`pump_kick_interval`) and duration (`pump_kick_duration`) are defined in additional propertys."""
         return self._data["installation"]["Pump kick"] == "ON"
 
     @property
-    def pump_kick_interval(self) -> int:
-        """Interval in hours between pump kicks. Internal countdown is reset to set value if the pump is turned on."""
-        return int(self._data["installation"]["Pump kick interval"].lower().replace("hours", "").strip())
-
-    @property
-    def pump_kick_duration(self) -> int:
-        """Duration in seconds the pump is running during pump kick."""
-        return int(self._data["installation"]["Pump kick duration"].lower().replace("s", "").strip())
-
-    @property
-    def over_flow_threshold(self) -> int:
-        """Level threshold in cistern, if exceeded, high water is reported."""
-        return int(self._data["installation"]["Over flow on threshold"].lower().replace("cm", "").strip())
-
-    @property
-    def tap_water_threshold(self) -> int:
-        """Level threshold in cistern, if fallen below, three way valve will be set to tap water."""
-        return int(self._data["installation"]["Tap water on threshold"].lower().replace("cm", "").strip())
-
-    @property
-    def rain_water_threshold(self) -> int:
-        """Level threshold in cistern, if exceeded, three way valve will be set to rain water."""
-        return int(self._data["installation"]["Rain water on threshold"].lower().replace("cm", "").strip())
-
-    @property
-    def calcination_protection_interval(self)-> int:
-        """Interval in days between calcination protection cycles."""
-        return int(self._data["installation"]["Calcination protection"].lower().replace("days", "").strip())
+    def main_pump_switches_rate(self) -> float | None:
+        """Average main pump switches per hour within the rolling window."""
+        return self._data["statistics"]["MP switches"]["rate"]
 
     @property
-    def flushing_interval(self) -> int:
-        """Interval in days between flushing cycles."""
-        return int(self._data["installation"]["System flushing"].lower().replace("days", "").strip())
+    def main_pump_switches_delta(self) -> int | None:
+        """Main pump switches within the rolling window."""
+        return self._data["statistics"]["MP switches"]["delta"]
 
     @property
-    def flushing_duration(self) -> int:
-        """Duration in minutes of the flushing cycle."""
-        return int(self._data["installation"]["Flushing duration"].lower().replace("min", "").strip())
+    def main_pump_duty_cycle(self) -> float | None:
+        """Share of the rolling window in percent during which the main pump was running."""
+        return self._data["statistics"]["MP"]["duty_cycle"]
 
     @property
-    def pump_max_runtime(self) -> int:
-        """Maximum allowed running time of pump before error is generated."""
-        return int(self._data["installation"]["Max. running time pump"].lower().replace("min", "").strip())
+    def cistern_pump_switches_rate(self) -> float | None:
+        """Average cistern pump switches per hour within the rolling window."""
+        return self._data["statistics"]["CP switches"]["rate"]
 
     @property
-    def fault_message_behavior(self) -> str:
-        """Defines the fault message behaviour (rising or falling signal)."""
-        return self._data["installation"]["Fault message behavior"].lower()
+    def cistern_pump_duty_cycle(self) -> float | None:
+        """Share of the rolling window in percent during which the cistern pump was running."""
+        return self._data["statistics"]["CP"]["duty_cycle"]
 
     @property
-    def minimum_pressure(self) -> float:
-        """Minimum pressure setpoint, if fallen below, dry running alarm is raised."""
-        return float(self._data["installation"]["Minimum pressure"].lower().replace("bar", "").strip())
+    def system_switches_delta(self) -> int | None:
+        """System powercycles within the rolling window."""
+        return self._data["statistics"]["System switches"]["delta"]
 
     @property
-    def dry_run_delay(self) -> int:
-        """Set delay to detect dry running."""
-        return int(self._data["installation"]["Delay dry run protection"].lower().replace("s", "").strip())
+    def pump_pressure_min(self) -> float | None:
+        """Minimum pressure sampled during pump runs since the last update."""
+        return self._data["burst"]["pressure"]["min"]
 
     @property
-    def dry_run_tap_water(self) -> int:
-        """Time in seconds in "tap water"-mode for the pump to build up pressure."""
-        return int(self._data["installation"]["Dry run tap water mode"].lower().replace("s", "").strip())
+    def pump_pressure_max(self) -> float | None:
+        """Maximum pressure sampled during pump runs since the last update."""
+        return self._data["burst"]["pressure"]["max"]
 
     @property
-    def dry_run_rain_water(self) -> int:
-        """Time in seconds in "rain water"-mode for the pump to build up pressure."""
-        return int(self._data["installation"]["Dry run rain water mode"].lower().replace("s", "").strip())
+    def pump_pressure_mean(self) -> float | None:
+        """Mean pressure sampled during pump runs since the last update."""
+        return self._data["burst"]["pressure"]["mean"]
 
     @property
-    def max_pump_cycles_per_hour(self) -> int:
-        """Maximum allowed pump cycles per hour before the pump raises an alarm."""
-        return int(self._data["installation"]["Max. pump cycles per hour"].lower().replace("/hour", "").strip())
+    def pump_pressure_last(self) -> float | None:
+        """Last pressure sampled during pump runs since the last update."""
+        return self._data["burst"]["pressure"]["last"]
 
     @property
-    def max_pump_cycles_alarm_count(self) -> int:
-        """Counter for how often the maximum set max pump cycles per hour fault alarm occured."""
-        return int(self._data["setup"]["Max. pump cycles/hour"].lower().replace("x", "").strip())
+    def cistern_level_min(self) -> float | None:
+        """Minimum cistern level sampled during pump runs since the last update."""
+        return self._data["burst"]["level"]["min"]
 
     @property
-    def pressure_sensor_fault_alarm_count(self) -> int:
-        """Counter for how often the pressure sensor fault alarm occured."""
-        return int(self._data["setup"]["Pressure sensor fault"].lower().replace("x", "").strip())
+    def cistern_level_max(self) -> float | None:
+        """Maximum cistern level sampled during pump runs since the last update."""
+        return self._data["burst"]["level"]["max"]
 
     @property
-    def dry_running_tap_water_alarm_count(self) -> int:
-        """Counter for how often the dry running alarm in tap water mode occured."""
-        return int(self._data["setup"]["Dry running RWM"].lower().replace("x", "").strip())
+    def cistern_level_mean(self) -> float | None:
+        """Mean cistern level sampled during pump runs since the last update."""
+        return self._data["burst"]["level"]["mean"]
 
     @property
-    def dry_running_rain_water_alarm_count(self) -> int:
-        """Counter for how often the dry running alarm in rain water mode occured."""
-        return int(self._data["setup"]["Dry running TWM"].lower().replace("x", "").strip())
+    def cistern_level_last(self) -> float | None:
+        """Last cistern level sampled during pump runs since the last update."""
+        return self._data["burst"]["level"]["last"]
 
     @property
-    def max_pump_runtime_alarm_count(self) -> int:
-        """Counter for how often the maximum set runtime was reached."""
-        return int(self._data["setup"]["Max. runtime pump"].lower().replace("x", "").strip())
+    def cistern_fill_rate(self) -> float | None:
+        """Trend of the cistern level within the trend window in cm per hour, negative while draining."""
+        return self._data["trend"]["rate"]
 
     @property
-    def break_tank_overflow_alarm_count(self) -> int:
-        """Counter for how often the break tank overflow alarm occured."""
-        return int(self._data["setup"]["Break tank overflow"].lower().replace("x", "").strip())
+    def cistern_time_to_overflow(self) -> float | None:
+        """Estimated hours until the overflow threshold is reached, None unless the cistern is filling."""
+        return self._data["trend"]["time_to_overflow"]
 
     @property
-    def cistern_backflow_alarm_count(self) -> int:
-        """Counter for how often the cistern backflow alarm occured."""
-        return int(self._data["setup"]["Cistern backflow"].lower().replace("x", "").strip())
+    def cistern_time_to_tap_water(self) -> float | None:
+        """Estimated hours until the tap water threshold is reached, None unless the cistern is draining."""
+        return self._data["trend"]["time_to_tap_water"]
 
     @property
-    def cistern_overflow_alarm_count(self) -> int:
-        """Counter for how often the cistern overflow alarm occured."""
-        return int(self._data["setup"]["Cistern overflow"].lower().replace("x", "").strip())
+    def cistern_fill(self) -> float | None:
+        """Filled share of the cistern volume in percent, derived from the level and the cistern geometry."""
+        return self._data["volume"]["fill"]
 
     @property
-    def high_water_alarm_count(self) -> int:
-        """Counter for how often the high water alarm occured."""
-        return int(self._data["setup"]["High water alarm"].lower().replace("x", "").strip())
+    def cistern_volume(self) -> float | None:
+        """Volume of water in the cistern in litres, None if the capacity of the cistern is not configured."""
+        return self._data["volume"]["volume"]
 
     @property
-    def level_sensor_fault_alarm_count(self) -> int:
-        """Counter for how often the level sensor fault alarm occured."""
-        return int(self._data["setup"]["Level sensor fault"].lower().replace("x", "").strip())
+    def data_age(self) -> float | None:
+        """Age in seconds of the oldest page data."""
+        ages = [age for age in self._data["page_age"].values() if age is not None]
+        return max(ages) if ages else None
 
     @property
-    def system_over_pressure_alarm_count(self) -> int:
-        """Counter for how often the system over pressure alarm occured."""
-        return int(self._data["setup"]["System over pressure"].lower().replace("x", "").strip())
-
-    @staticmethod
-    def __calculate_time_from_string(value: str, unit: TimeUnit = TimeUnit.MINUTES) -> int | None:
-        """Calculates the minutes from a string formatted in different ways."""
-        pattern = re.compile(
-            r"""
-            ^
-            (?:(?P<days>\d+)\s*(?:d|days))?
-            \s*?
-            (?:(?P<hours>\d+)\s*(?:h|hours))?
-            \s*?
-            (?:(?P<minutes>\d+)\s*(?:m|min|minutes))?
-            \s*?
-            (?:(?P<seconds>\d+)\s*(?:s|sec|seconds))?
-            $
-            """,
-            re.VERBOSE | re.IGNORECASE,
-        )
-
-        match = pattern.fullmatch(value.strip())
-        if not match:
-            return None
-
-        days = int(match.group("days") or 0)
-        hours = int(match.group("hours") or 0)
-        minutes = int(match.group("minutes") or 0)
-        seconds = int(match.group("seconds") or 0)
-
-        total = timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds).total_seconds()
-
-        return int(total // unit)
+    def page_ages(self) -> dict[str, float | None]:
+        """Age in seconds of the data of each page, None if the page has never been fetched."""
+        return self._data["page_age"]
@@ -0,0 +1,30 @@
+"""Provides diagnostics for the Wilo integration."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .rate_limiter import get_rate_limiter_metrics
+
+
+async def async_get_config_entry_diagnostics(hass:HomeAssistant, entry:ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics of a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+
+    entities = data.get("entities", [])
+    hits = sum(entity.cache.hits for entity in entities)
+    misses = sum(entity.cache.misses for entity in entities)
+
+    return {
+        "config": dict(entry.data),
+        "value_cache": {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else None,
+        },
+        "rate_limiter": get_rate_limiter_metrics(hass, entry.data["ip"]),
+        "latency": data["pump"].latency_metrics,
+        "conversion_errors": data["coordinator"].data.conversion_errors if data["coordinator"].data else {},
+    }
@@ -0,0 +1,137 @@
+"""Implements an append-only columnar history of the numeric pump values.
+
+Each day of a pump is stored in its own file, `<directory>/<unique id>/<YYYY-MM-DD>.wcol` (UTC day),
+consisting of batches appended one after another. Every batch starts with a JSON header line
+(`rows`, `columns`, `byteorder`) followed by the values of each column in the listed order as
+`rows` consecutive 64-bit floats. The first column is the unix timestamp, missing values are NaN.
+
+Columns of a batch can be read directly into numpy using `numpy.frombuffer`, or with `read_history`.
+"""
+
+from array import array
+import asyncio
+from datetime import date, datetime, timezone
+import json
+import math
+from pathlib import Path
+import sys
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .datastores.base import BaseDatastore
+
+TIMESTAMP_COLUMN = "timestamp"
+
+
+class HistorySink:
+    """Buffers numeric datastore snapshots in column arrays and appends them in batches to daily files.
+
+    Files are written in the executor, so the event loop is never blocked by disk access.
+    """
+
+    def __init__(self, hass:HomeAssistant, directory:Path, columns:tuple[str, ...], batch_size:int):
+        """Initialize the history sink.
+
+        :param HomeAssistant hass:
+            Home assistant instance used to run the writes in the executor.
+
+        :param Path directory:
+            Directory of the pump the daily files are written to.
+
+        :param tuple[str, ...] columns:
+            Names of the numeric fields stored.
+
+        :param int batch_size:
+            Number of snapshots buffered before they are written.
+        """
+        self._hass = hass
+        self._directory = directory
+        self._columns = (TIMESTAMP_COLUMN, *columns)
+        self._batch_size = batch_size
+        self._day:date | None = None
+        self._buffers = self._create_buffers()
+        self._pending:list[tuple[date, dict[str, array]]] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def buffered(self) -> int:
+        """Number of snapshots not yet written."""
+        return len(self._buffers[TIMESTAMP_COLUMN]) + sum(len(buffers[TIMESTAMP_COLUMN]) for _, buffers in self._pending)
+
+    def add(self, datastore:BaseDatastore):
+        """Adds the numeric values of a new datastore, writing the buffered snapshots once the batch is full.
+
+        :param BaseDatastore datastore:
+            Freshly created datastore.
+        """
+        timestamp = time.time()
+        day = datetime.fromtimestamp(timestamp, timezone.utc).date()
+        if day != self._day:
+            self._take_buffers()
+            self._day = day
+
+        values = datastore.numeric_values
+        self._buffers[TIMESTAMP_COLUMN].append(timestamp)
+        for column in self._columns[1:]:
+            self._buffers[column].append(values.get(column, math.nan))
+
+        if self.buffered >= self._batch_size:
+            self._hass.async_create_task(self.async_flush())
+
+    async def async_flush(self):
+        """Writes all buffered snapshots without blocking the event loop."""
+        async with self._lock:
+            self._take_buffers()
+            batches, self._pending = self._pending, []
+            if batches:
+                await self._hass.async_add_executor_job(self._write, batches)
+
+    def _create_buffers(self) -> dict[str, array]:
+        """Creates an empty buffer for each column."""
+        return {column: array("d") for column in self._columns}
+
+    def _take_buffers(self):
+        """Moves the buffered snapshots of the current day to the batches pending to be written."""
+        if self._day is not None and self._buffers[TIMESTAMP_COLUMN]:
+            self._pending.append((self._day, self._buffers))
+            self._buffers = self._create_buffers()
+
+    def _write(self, batches:list[tuple[date, dict[str, array]]]):
+        """Appends the given batches to the files of their days."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        for day, buffers in batches:
+            header = {"rows": len(buffers[TIMESTAMP_COLUMN]), "columns": list(self._columns), "byteorder": sys.byteorder}
+            with (self._directory / f"{day.isoformat()}.wcol").open("ab") as file:
+                file.write(json.dumps(header).encode("utf-8") + b"\n")
+                for column in self._columns:
+                    buffers[column].tofile(file)
+
+
+def read_history(path:Path) -> dict[str, array]:
+    """Reads all batches of a daily history file.
+
+    Columns missing in some batches (e.g. after an update adding fields) are filled with NaN.
+
+    :param Path path:
+        Path of the daily file.
+
+    :returns dict[str, array]:
+        Values of each column, including the unix timestamp.
+    """
+    columns:dict[str, array] = {}
+    rows = 0
+    with path.open("rb") as file:
+        while header_line := file.readline():
+            header = json.loads(header_line)
+            for column in header["columns"]:
+                values = array("d")
+                values.fromfile(file, header["rows"])
+                if header["byteorder"] != sys.byteorder:
+                    values.byteswap()
+                columns.setdefault(column, array("d", [math.nan]) * rows).extend(values)
+            rows += header["rows"]
+            for values in columns.values():
+                if len(values) < rows:
+                    values.extend(array("d", [math.nan]) * (rows - len(values)))
+    return columns
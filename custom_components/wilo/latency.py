@@ -0,0 +1,125 @@
+"""Implements latency tracking used to derive adaptive request timeouts."""
+
+from collections import deque
+from statistics import quantiles
+
+from aiohttp import ClientTimeout
+
+
+class LatencyTracker:
+    """Tracks the latency of a single request phase and derives a timeout budget from it.
+
+    The budget is the larger of the smoothed latency plus four times its smoothed deviation
+    (like the retransmission timeout of TCP) and twice the 95th percentile of the recent samples,
+    bounded by a floor and a ceiling. With backoff, every timeout doubles the budget until the next success.
+    """
+
+    def __init__(self, floor:float, ceiling:float, initial:float, smoothing:float, size:int, backoff:bool = True):
+        """Initialize the latency tracker.
+
+        :param float floor:
+            Minimum budget in seconds.
+
+        :param float ceiling:
+            Maximum budget in seconds.
+
+        :param float initial:
+            Budget in seconds used until the first sample is recorded.
+
+        :param float smoothing:
+            Weight of a new sample in the exponentially weighted moving averages.
+
+        :param int size:
+            Number of recent samples the percentile is calculated from.
+
+        :param bool backoff:
+            Whether timeouts increase the budget.
+        """
+        self._use_backoff = backoff
+        self._floor = floor
+        self._ceiling = ceiling
+        self._initial = initial
+        self._smoothing = smoothing
+        self._samples:deque[float] = deque(maxlen=size)
+        self._mean:float | None = None
+        self._deviation = 0.0
+        self._backoff = 1
+        self._timeouts = 0
+
+    @property
+    def budget(self) -> float:
+        """Current timeout budget in seconds."""
+        if self._mean is None:
+            budget = self._initial
+        else:
+            budget = max(self._mean + 4 * self._deviation, 2 * self.percentile)
+        return min(self._ceiling, max(self._floor, budget) * self._backoff)
+
+    @property
+    def percentile(self) -> float:
+        """95th percentile of the recent samples in seconds, 0 if there are none."""
+        if len(self._samples) < 2:
+            return self._samples[0] if self._samples else 0.0
+        return quantiles(self._samples, n=20)[-1]
+
+    @property
+    def metrics(self) -> dict[str, float | int | None]:
+        """Smoothed latency, deviation, percentile, current budget and number of timeouts."""
+        return {
+            "mean": self._mean,
+            "deviation": self._deviation,
+            "p95": self.percentile,
+            "budget": self.budget,
+            "timeouts": self._timeouts,
+        }
+
+    def add(self, latency:float):
+        """Records the latency of a successful request phase, resetting the backoff.
+
+        :param float latency:
+            Duration of the phase in seconds.
+        """
+        self._samples.append(latency)
+        self._backoff = 1
+        if self._mean is None:
+            self._mean = latency
+            self._deviation = latency / 2
+            return
+        self._deviation += self._smoothing * (abs(latency - self._mean) - self._deviation)
+        self._mean += self._smoothing * (latency - self._mean)
+
+    def timeout(self):
+        """Records a timeout of the phase, doubling the budget with backoff until it reaches the ceiling."""
+        self._timeouts += 1
+        if self._use_backoff and self.budget < self._ceiling:
+            self._backoff *= 2
+
+
+class PageLatency:
+    """Tracks connect and read latencies of a page, providing the timeouts of its next request.
+
+    The connect phase lasts until the response headers are received, the read phase until the body is complete.
+    A timeout backs off the budget of the phase it occured in, so a slow but responding page gets more time
+    on each attempt. Timeouts while establishing the connection are not recorded by the caller, so an
+    unreachable pump keeps failing fast.
+    """
+
+    def __init__(self, floor:float, ceiling:float, initial:float, smoothing:float, size:int):
+        """Initialize the page latency, see `LatencyTracker` for the parameters."""
+        self.connect = LatencyTracker(floor, ceiling, initial, smoothing, size)
+        self.read = LatencyTracker(floor, ceiling, initial, smoothing, size)
+
+    @property
+    def timeout(self) -> ClientTimeout:
+        """Timeout for the next request, bounding connecting, each read and the whole request.
+
+        The wait for the response headers is bounded by the socket read timeout, so it is at least the connect budget.
+        """
+        connect = self.connect.budget
+        read = self.read.budget
+        return ClientTimeout(total=connect + read, sock_connect=connect, sock_read=max(connect, read))
+
+    @property
+    def metrics(self) -> dict[str, dict[str, float | int | None]]:
+        """Metrics of both phases."""
+        return {"connect": self.connect.metrics, "read": self.read.metrics}
@@ -0,0 +1,125 @@
+"""Implements the import of pump counters as external long-term statistics."""
+
+from datetime import datetime
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .datastores.base import BaseDatastore
+from .wilo_sensor_descriptor import WiloStatisticDescriptor
+
+
+class LongTermStatisticsImporter:
+    """Accumulates hourly aggregates of counters and imports them in batches as external statistics.
+
+    For each hour the last seen value of a counter is kept as state, while the sum is continued
+    across counter resets and restarts (restored from the recorder by `async_load`).
+    """
+
+    def __init__(self, hass:HomeAssistant, provider, descriptors:list[WiloStatisticDescriptor], batch_hours:int):
+        """Initialize the importer.
+
+        :param HomeAssistant hass:
+            Home assistant instance used to access the recorder.
+
+        :param WiloProvider provider:
+            Provider whose counters are imported.
+
+        :param list[WiloStatisticDescriptor] descriptors:
+            Counters to be imported.
+
+        :param int batch_hours:
+            Number of completed hours collected before they are imported.
+        """
+        self._hass = hass
+        self._descriptors = descriptors
+        self._batch_hours = batch_hours
+        self._logger = logging.getLogger(f"{DOMAIN}_{provider.unique_id}")
+        self._metadata:dict[str, StatisticMetaData] = {
+            descriptor.partial_statistic_id: StatisticMetaData(
+                mean_type=StatisticMeanType.NONE,
+                has_sum=True,
+                name=f"{provider.device_info['name']} {descriptor.name}" if provider.device_info else descriptor.name,
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{provider.unique_id}_{descriptor.partial_statistic_id}",
+                unit_of_measurement=descriptor.unit_of_measurement,
+            )
+            for descriptor in descriptors
+        }
+        self._current_hour:datetime | None = None
+        self._states:dict[str, float] = {}
+        self._last_values:dict[str, float] = {}
+        self._sums:dict[str, float] = {}
+        self._pending:dict[str, list[StatisticData]] = {key: [] for key in self._metadata}
+        self._pending_hours = 0
+
+    async def async_load(self):
+        """Restores the last imported state and sum of each counter from the recorder."""
+        for key, metadata in self._metadata.items():
+            last = await get_instance(self._hass).async_add_executor_job(
+                get_last_statistics, self._hass, 1, metadata["statistic_id"], True, {"state", "sum"}
+            )
+            if rows := last.get(metadata["statistic_id"]):
+                self._last_values[key] = rows[0]["state"]
+                self._sums[key] = rows[0]["sum"]
+
+    def add(self, datastore:BaseDatastore):
+        """Adds the counters of a new datastore to the aggregate of the current hour.
+
+        :param BaseDatastore datastore:
+            Freshly updated datastore.
+        """
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        if self._current_hour is not None and hour != self._current_hour:
+            self._finish_hour()
+        self._current_hour = hour
+
+        for descriptor in self._descriptors:
+            key = descriptor.partial_statistic_id
+            try:
+                value = descriptor.value_update_function(datastore)
+            except (KeyError, ValueError):
+                continue
+            if value is None:
+                continue
+
+            last_value = self._last_values.get(key)
+            if last_value is None:
+                self._sums.setdefault(key, 0.0)
+            elif value >= last_value:
+                self._sums[key] += value - last_value
+            else:
+                self._sums[key] += value
+            self._last_values[key] = value
+            self._states[key] = value
+
+    def flush(self):
+        """Imports all completed hours not imported yet."""
+        for key, statistics in self._pending.items():
+            if statistics:
+                async_add_external_statistics(self._hass, self._metadata[key], statistics)
+                self._pending[key] = []
+        self._pending_hours = 0
+
+    def _finish_hour(self):
+        """Moves the aggregates of the current hour into the pending batch, importing it once full."""
+        for key, state in self._states.items():
+            self._pending[key].append(StatisticData(start=self._current_hour, state=state, sum=self._sums[key]))
+        self._states = {}
+        self._pending_hours += 1
+
+        if self._pending_hours >= self._batch_hours:
+            self._logger.debug("Importing %s hours of long-term statistics", self._pending_hours)
+            self.flush()
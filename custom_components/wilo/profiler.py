@@ -0,0 +1,157 @@
+"""Implements on-demand profiling of coordinator update cycles."""
+
+from collections import Counter
+from contextlib import contextmanager
+import cProfile
+import json
+import logging
+from pathlib import Path
+import sys
+import threading
+import time
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UpdateProfiler:
+    """Profiles update cycles deterministically and by sampling the stack of the event loop.
+
+    Three files are written once all cycles are profiled:
+    - `<name>.pstats` with the deterministic profile, readable by `pstats` or snakeviz,
+    - `<name>.collapsed` with the sampled stacks in the collapsed format of flamegraph.pl and speedscope,
+      each stack rooted at the phase (`update` or `entity_write`) it was sampled in,
+    - `<name>.json` with the duration of fetch, parse, datastore build and entity state write per cycle.
+
+    As the profiled phases await network requests, other tasks running on the event loop
+    in the meantime are included in the profiles as well.
+    """
+
+    def __init__(self, path:Path, cycles:int, sample_interval:float):
+        """Initialize the profiler.
+
+        :param Path path:
+            Path of the output files without suffix.
+
+        :param int cycles:
+            Number of update cycles to be profiled.
+
+        :param float sample_interval:
+            Seconds between two stack samples.
+        """
+        self._path = path
+        self._cycles = cycles
+        self._sample_interval = sample_interval
+        self._profile:cProfile.Profile | None = cProfile.Profile()
+        self._stacks:Counter[str] = Counter()
+        self._phase:str | None = None
+        self._thread_id = threading.get_ident()
+        self._sampler:threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._results:list[dict[str, float]] = []
+
+    @property
+    def path(self) -> Path:
+        """Path of the output files without suffix."""
+        return self._path
+
+    @property
+    def complete(self) -> bool:
+        """True if the requested number of cycles has been profiled."""
+        return len(self._results) >= self._cycles
+
+    def start(self):
+        """Starts the stack sampler, must be called from the event loop."""
+        self._thread_id = threading.get_ident()
+        self._sampler = threading.Thread(target=self._sample, name="wilo_profiler", daemon=True)
+        self._sampler.start()
+
+    @contextmanager
+    def phase(self, name:str):
+        """Profiles the wrapped code as the given phase.
+
+        The `update` phase starts a new cycle, the duration of each phase is stored in the current cycle.
+
+        :param str name:
+            Name of the phase, used as root of the sampled stacks.
+        """
+        self._phase = name
+        if self._profile is not None:
+            try:
+                self._profile.enable()
+            except ValueError:
+                _LOGGER.warning("Another profiler is active, only sampling the stacks")
+                self._profile = None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if self._profile is not None:
+                self._profile.disable()
+            self._phase = None
+            if name == "update":
+                self._results.append({})
+            if self._results:
+                self._results[-1][name] = duration
+
+    def add_timings(self, timings:dict[str, float]):
+        """Adds the step timings reported by the provider to the current cycle.
+
+        :param dict[str, float] timings:
+            Duration in seconds of each step, `fetch_<page>`, `parse_<page>` and `datastore`.
+        """
+        cycle = self._results[-1]
+        for step, duration in timings.items():
+            phase = step.split("_", 1)[0]
+            cycle[phase] = cycle.get(phase, 0.0) + duration
+
+    async def async_write(self, hass:HomeAssistant):
+        """Stops sampling and writes the output files without blocking the event loop.
+
+        If called before all cycles are profiled, the cycles profiled so far are written.
+
+        :param HomeAssistant hass:
+            Home assistant instance used to run the write in the executor.
+        """
+        self._stopped.set()
+        await hass.async_add_executor_job(self._write)
+
+    def _sample(self):
+        """Samples the stack of the event loop thread while a phase is profiled."""
+        while not self._stopped.wait(self._sample_interval):
+            phase = self._phase
+            if phase is None:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.append(phase)
+            self._stacks[";".join(reversed(stack))] += 1
+
+    def _write(self):
+        """Writes the output files."""
+        if self._sampler is not None:
+            self._sampler.join()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self._profile is not None:
+            self._profile.dump_stats(self._path.with_suffix(".pstats"))
+
+        with self._path.with_suffix(".collapsed").open("w", encoding="utf-8") as collapsed:
+            for stack, count in self._stacks.most_common():
+                collapsed.write(f"{stack} {count}\n")
+
+        phases = sorted({phase for cycle in self._results for phase in cycle})
+        summary = {
+            "cycles": self._results,
+            "mean": {phase: sum(cycle.get(phase, 0.0) for cycle in self._results) / len(self._results) for phase in phases},
+            "samples": sum(self._stacks.values()),
+            "sample_interval": self._sample_interval,
+        }
+        with self._path.with_suffix(".json").open("w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
@@ -1,8 +1,35 @@
-"""Providers implement update functionality and describe supported entities."""
+"""Providers implement update functionality and describe supported entities.
 
+Provider modules pull in their parser dependencies and entity tables, so they are registered
+by module name in `PROVIDERS` and only imported once an entry of their model is set up.
+"""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.importlib import async_import_module
+
+from ..models import WiloModels
 from .base import BaseProvider
-from .rain3 import Rain3Provider
 
-__all__ = ["BaseProvider", "Rain3Provider"]
+__all__ = ["PROVIDERS", "BaseProvider", "async_get_provider_class"]
+
+PROVIDERS:dict[WiloModels, tuple[str, str]] = {
+    WiloModels.RAIN3: ("rain3", "Rain3Provider"),
+}
+
+
+async def async_get_provider_class(hass:HomeAssistant, model:WiloModels) -> type[BaseProvider]:
+    """Imports the provider module of a model in the executor and returns its provider class.
+
+    :param HomeAssistant hass:
+        Home assistant instance, the import is run in its import executor.
+
+    :param WiloModels model:
+        Model of the pump.
+
+    :raises KeyError:
+        No provider is registered for the model.
+    """
+    module_name, class_name = PROVIDERS[model]
+    module = await async_import_module(hass, f"{__name__}.{module_name}")
+    return getattr(module, class_name)
 
-Providers = Rain3Provider
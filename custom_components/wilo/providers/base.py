@@ -1,21 +1,25 @@
 """Defines the base class all providers inherit from."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 import logging
+from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from ..const import DOMAIN
-from ..datastores import Datastores
+from ..datastores.base import BaseDatastore
 from ..models import WiloModels
-from ..wilo_sensor_descriptor import WiloSensorDescriptors
+from ..wilo_sensor_descriptor import WiloSensorDescriptors, WiloStatisticDescriptor
 
 
 class BaseProvider(ABC):
     """Base class all providers inherit from."""
 
     SENSORS:list[WiloSensorDescriptors]
+    DATASTORE:type[BaseDatastore]
+    LONG_TERM_STATISTICS:list[WiloStatisticDescriptor] = []
 
     def __init__(self, device_ip:str, device_id:int, model:WiloModels, hass:HomeAssistant):
         """Initialize the provider class.
@@ -42,6 +46,7 @@ class BaseProvider(ABC):
         self._model = model
         self._hass = hass
         self._device_info:DeviceInfo | None = None
+        self._update_listener:Callable[[BaseDatastore], None] | None = None
         self._logger:logging.Logger = logging.getLogger(f"{DOMAIN}_{self._unique_id}")
 
     @abstractmethod
@@ -51,9 +56,52 @@ class BaseProvider(ABC):
     async def async_close(self) -> None:
         """Optional cleanup."""
 
+    def set_update_listener(self, listener:Callable[[BaseDatastore], None] | None):
+        """Sets the callback receiving data fetched outside of `async_update`, e.g. by a background retry.
+
+        The datastore is only to be published, its values have not been sampled by `async_update`.
+
+        :param Callable[[BaseDatastore], None] | None listener:
+            Callback run in the event loop, None to remove the listener.
+        """
+        self._update_listener = listener
+
+    def _notify_update_listener(self, datastore:BaseDatastore):
+        """Passes data fetched outside of `async_update` to the update listener, if set."""
+        if self._update_listener is not None:
+            self._update_listener(datastore)
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Optional duration in seconds of each step of the last update, used for profiling."""
+        return {}
+
+    @property
+    def latency_metrics(self) -> dict[str, Any]:
+        """Optional request latency metrics per page, used for diagnostics."""
+        return {}
+
+    def get_raw_page(self, url_path:str) -> tuple[float, str | None, bytes] | None:
+        """Optional body of the last successful fetch of a page, served to external consumers.
+
+        :param str url_path:
+            Path of the page.
+
+        :returns tuple[float, str | None, bytes]:
+            Unix timestamp of the fetch, charset (None if not sent by the device) and body as received from the device.
+
+        :returns None:
+            The page is not available.
+        """
+        return None
+
     @abstractmethod
-    async def async_update(self) -> Datastores:
-        """Fetch and normalize data. Return dict for this provider namespace."""
+    async def async_update(self, pages:frozenset[str] | None = None) -> BaseDatastore:
+        """Fetch and normalize data. Return dict for this provider namespace.
+
+        :param frozenset[str] | None pages:
+            Pages to be fetched, the remaining pages are served from the last fetch. All pages if None.
+        """
 
     @property
     def device_info(self) -> DeviceInfo | None:
@@ -1,9 +1,14 @@
 """Implements the provider for rain3 pump."""
 
+import asyncio
+from datetime import timedelta
+from pathlib import Path
 import re
+import time
+from typing import Any
 
-from aiohttp import ClientError, ClientResponseError, ClientSession
-from lxml import html as lxml_html
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout, ConnectionTimeoutError
+from lxml import etree, html as lxml_html
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.sensor import (
@@ -11,14 +16,46 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfLength, UnitOfPressure, UnitOfTime
+from homeassistant.const import PERCENTAGE, UnitOfLength, UnitOfPressure, UnitOfTime, UnitOfVolume
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from ..const import DOMAIN
+from ..burst import BurstSampler
+from ..capture import TrafficCapture
+from ..const import (
+    BURST_BUFFER_SIZE,
+    DEFAULT_MAX_DATA_AGE,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    DOMAIN,
+    LATENCY_SMOOTHING,
+    LATENCY_WINDOW_SIZE,
+    MAX_QUIET_PERIOD,
+    PAGE_TTLS,
+    REVALIDATION_ATTEMPTS,
+    REVALIDATION_DELAY,
+    ROLLING_WINDOW,
+    ROLLING_WINDOW_SIZE,
+    TIMEOUT_INITIAL,
+    TREND_WINDOW,
+    TREND_WINDOW_SIZE,
+    UNIT_SWITCHES,
+    UNIT_SWITCHES_PER_HOUR,
+    VOLUME_TABLE_SIZE,
+)
 from ..datastores import Rain3Datastore
+from ..latency import PageLatency
 from ..models import WiloModels
-from ..wilo_sensor_descriptor import WiloBinarySensorDescriptor, WiloSensorDescriptor
+from ..rate_limiter import TokenBucket, get_rate_limiter
+from ..rolling import RollingCounter
+from ..trend import LinearTrend
+from ..volume import VolumeTable
+from ..wilo_sensor_descriptor import (
+    WiloBinarySensorDescriptor,
+    WiloSensorDescriptor,
+    WiloStatisticDescriptor,
+    generate_sensor_descriptors,
+)
 from .base import BaseProvider
 
 
@@ -26,539 +63,337 @@ class Rain3Provider(BaseProvider):
     """Provider class for rain3 pump."""
 
     SENSORS = [
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "serial_number",
-            translation_key = "serial_number",
-            value_update_function = lambda data: data.serial_number,
-            entity_category = EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default = False
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "software_version",
-            translation_key = "software_version",
-            value_update_function = lambda data: data.software_version,
-            entity_category = EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default = False
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "equipment_number",
-            translation_key = "equipment_number",
-            value_update_function = lambda data: data.equipment_number,
-            entity_category = EntityCategory.DIAGNOSTIC,
-            entity_registry_enabled_default = False
-        ),
+        *generate_sensor_descriptors(Rain3Datastore),
         WiloBinarySensorDescriptor(
             partial_unique_entity_id = "state",
             translation_key = "state",
             value_update_function = lambda data: data.is_pump_running,
             device_class = BinarySensorDeviceClass.RUNNING,
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "running_duration",
-            translation_key = "running_duration",
-            value_update_function = lambda data: data.main_pump_current_runtime,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.MINUTES,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "pressure",
-            translation_key = "pressure",
-            value_update_function = lambda data: data.pump_pressure,
-            device_class = SensorDeviceClass.PRESSURE,
-            native_unit_of_measurement = UnitOfPressure.BAR
+            group = "state"
         ),
         WiloBinarySensorDescriptor(
             partial_unique_entity_id = "on_pressure_reached",
             translation_key = "on_pressure_reached",
             value_update_function = lambda data: data.is_switch_on_pressure_reached,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "state"
         ),
         WiloBinarySensorDescriptor(
             partial_unique_entity_id = "off_pressure_reached",
             translation_key = "off_pressure_reached",
             value_update_function = lambda data: data.is_switch_off_pressure_reached,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "mp_stop_in",
-            translation_key = "mp_stop_in",
-            value_update_function = lambda data: data.main_pump_stop_in,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "cistern_level",
-            translation_key = "cistern_level",
-            value_update_function = lambda data: data.cistern_level,
-            device_class = SensorDeviceClass.DISTANCE,
-            native_unit_of_measurement = UnitOfLength.CENTIMETERS,
-            unit_of_measurement = UnitOfLength.CENTIMETERS,
-            state_class = SensorStateClass.MEASUREMENT
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "state"
         ),
         WiloSensorDescriptor(
             partial_unique_entity_id = "valve_position",
             translation_key = "valve_position",
             value_update_function = lambda data: data.valve_position,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "calc_protection_timer",
-            translation_key = "calc_protection_timer",
-            value_update_function = lambda data: data.calc_protection_timer,
-            device_class = SensorDeviceClass.DURATION,
-            unit_of_measurement = UnitOfTime.HOURS,
-            native_unit_of_measurement = UnitOfTime.HOURS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "flushing_timer",
-            translation_key = "flushing_timer",
-            value_update_function = lambda data: data.flushing_timer,
-            device_class = SensorDeviceClass.DURATION,
-            unit_of_measurement = UnitOfTime.HOURS,
-            native_unit_of_measurement = UnitOfTime.HOURS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "state"
         ),
         WiloSensorDescriptor(
             partial_unique_entity_id = "pump_switches_this_hour",
             translation_key = "pump_switches_this_hour",
             value_update_function = lambda data: data.pump_switches_this_hour,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "state"
         ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "system_hours",
-            translation_key = "system_hours",
-            value_update_function = lambda data: data.system_total_runtime,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.HOURS,
-            unit_of_measurement = UnitOfTime.HOURS,
-            state_class = SensorStateClass.TOTAL_INCREASING,
+        WiloBinarySensorDescriptor(
+            partial_unique_entity_id = "pump_kick",
+            translation_key = "pump_kick",
+            value_update_function = lambda data: data.pump_kick_enabled,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "installation"
+        ),
+        WiloBinarySensorDescriptor(
+            partial_unique_entity_id = "drives_enabled",
+            translation_key = "drives_enabled",
+            value_update_function = lambda data: data.is_drive_on,
+            entity_registry_enabled_default = False,
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "settings"
+        ),
+        WiloBinarySensorDescriptor(
+            partial_unique_entity_id = "alarm_active",
+            translation_key = "alarm_active",
+            value_update_function = lambda data: data.is_alarm_active,
+            extra_value_update_function = lambda data: data.alarm_data,
+            device_class = BinarySensorDeviceClass.PROBLEM,
+            group = "errors"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "mp_hours",
-            translation_key = "mp_hours",
-            value_update_function = lambda data: data.main_pump_total_runtime,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.HOURS,
-            unit_of_measurement = UnitOfTime.HOURS,
-            state_class = SensorStateClass.TOTAL_INCREASING,
+            partial_unique_entity_id = "mp_switches_rate",
+            translation_key = "mp_switches_rate",
+            value_update_function = lambda data: data.main_pump_switches_rate,
+            native_unit_of_measurement = UNIT_SWITCHES_PER_HOUR,
+            unit_of_measurement = UNIT_SWITCHES_PER_HOUR,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
             entity_category = EntityCategory.DIAGNOSTIC,
+            group = "statistics"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "cp_hours",
-            translation_key = "cp_hours",
-            value_update_function = lambda data: data.cistern_pump_total_runtime,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.HOURS,
-            unit_of_measurement = UnitOfTime.HOURS,
-            state_class = SensorStateClass.TOTAL_INCREASING,
+            partial_unique_entity_id = "mp_switches_delta",
+            translation_key = "mp_switches_delta",
+            value_update_function = lambda data: data.main_pump_switches_delta,
+            native_unit_of_measurement = UNIT_SWITCHES,
+            unit_of_measurement = UNIT_SWITCHES,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "statistics"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "system_switches",
-            translation_key = "system_switches",
-            value_update_function = lambda data: data.system_switches_counter,
-            state_class = SensorStateClass.TOTAL_INCREASING,
+            partial_unique_entity_id = "mp_duty_cycle",
+            translation_key = "mp_duty_cycle",
+            value_update_function = lambda data: data.main_pump_duty_cycle,
+            native_unit_of_measurement = PERCENTAGE,
+            unit_of_measurement = PERCENTAGE,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "statistics"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "mp_switches",
-            translation_key = "mp_switches",
-            value_update_function = lambda data: data.main_pump_switches_counter,
-            state_class = SensorStateClass.TOTAL_INCREASING,
+            partial_unique_entity_id = "cp_switches_rate",
+            translation_key = "cp_switches_rate",
+            value_update_function = lambda data: data.cistern_pump_switches_rate,
+            native_unit_of_measurement = UNIT_SWITCHES_PER_HOUR,
+            unit_of_measurement = UNIT_SWITCHES_PER_HOUR,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "statistics"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "cp_switches",
-            translation_key = "cp_switches",
-            value_update_function = lambda data: data.cistern_pump_switches_counter,
-            state_class = SensorStateClass.TOTAL_INCREASING,
+            partial_unique_entity_id = "cp_duty_cycle",
+            translation_key = "cp_duty_cycle",
+            value_update_function = lambda data: data.cistern_pump_duty_cycle,
+            native_unit_of_measurement = PERCENTAGE,
+            unit_of_measurement = PERCENTAGE,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "statistics"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "mp_type",
-            translation_key = "mp_type",
-            value_update_function = lambda data: data.main_pump_type,
+            partial_unique_entity_id = "data_age",
+            translation_key = "data_age",
+            value_update_function = lambda data: data.data_age,
+            extra_value_update_function = lambda data: data.page_ages,
+            device_class = SensorDeviceClass.DURATION,
+            native_unit_of_measurement = UnitOfTime.SECONDS,
+            unit_of_measurement = UnitOfTime.SECONDS,
             entity_registry_enabled_default = False,
             entity_category = EntityCategory.DIAGNOSTIC,
+            group = "page_age"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "cp_count",
-            translation_key = "cp_count",
-            value_update_function = lambda data: data.cistern_pump_count,
+            partial_unique_entity_id = "system_switches_delta",
+            translation_key = "system_switches_delta",
+            value_update_function = lambda data: data.system_switches_delta,
+            native_unit_of_measurement = UNIT_SWITCHES,
+            unit_of_measurement = UNIT_SWITCHES,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            entity_category = EntityCategory.DIAGNOSTIC,
+            group = "statistics"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "pressure_range",
-            translation_key = "pressure_range",
-            value_update_function = lambda data: data.pressure_range,
+            partial_unique_entity_id = "pressure_min",
+            translation_key = "pressure_min",
+            value_update_function = lambda data: data.pump_pressure_min,
             device_class = SensorDeviceClass.PRESSURE,
             native_unit_of_measurement = UnitOfPressure.BAR,
             unit_of_measurement = UnitOfPressure.BAR,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            group = "burst"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "over_pressure_threshold",
-            translation_key = "over_pressure_threshold",
-            value_update_function = lambda data: data.over_pressure_threshold,
+            partial_unique_entity_id = "pressure_max",
+            translation_key = "pressure_max",
+            value_update_function = lambda data: data.pump_pressure_max,
             device_class = SensorDeviceClass.PRESSURE,
             native_unit_of_measurement = UnitOfPressure.BAR,
             unit_of_measurement = UnitOfPressure.BAR,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "cistern_sensor_range",
-            translation_key = "cistern_sensor_range",
-            value_update_function = lambda data: data.cistern_sensor_range,
-            device_class = SensorDeviceClass.DISTANCE,
-            native_unit_of_measurement = UnitOfLength.METERS,
-            unit_of_measurement = UnitOfLength.METERS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "cistern_sensor_installed_height",
-            translation_key = "cistern_sensor_installed_height",
-            value_update_function = lambda data: data.cistern_sensor_installed_height,
-            device_class = SensorDeviceClass.DISTANCE,
-            native_unit_of_measurement = UnitOfLength.CENTIMETERS,
-            unit_of_measurement = UnitOfLength.CENTIMETERS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            group = "burst"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "high_water_threshold",
-            translation_key = "high_water_threshold",
-            value_update_function = lambda data: data.high_water_threshold,
-            device_class = SensorDeviceClass.DISTANCE,
-            native_unit_of_measurement = UnitOfLength.CENTIMETERS,
-            unit_of_measurement = UnitOfLength.CENTIMETERS,
+            partial_unique_entity_id = "pressure_mean",
+            translation_key = "pressure_mean",
+            value_update_function = lambda data: data.pump_pressure_mean,
+            device_class = SensorDeviceClass.PRESSURE,
+            native_unit_of_measurement = UnitOfPressure.BAR,
+            unit_of_measurement = UnitOfPressure.BAR,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            group = "burst"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "cistern_shape",
-            translation_key = "cistern_shape",
-            value_update_function = lambda data: data.cistern_shape,
+            partial_unique_entity_id = "pressure_last",
+            translation_key = "pressure_last",
+            value_update_function = lambda data: data.pump_pressure_last,
+            device_class = SensorDeviceClass.PRESSURE,
+            native_unit_of_measurement = UnitOfPressure.BAR,
+            unit_of_measurement = UnitOfPressure.BAR,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            group = "burst"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "cistern_height_or_diameter",
-            translation_key = "cistern_height_or_diameter",
-            value_update_function = lambda data: data.cistern_height_or_diameter,
+            partial_unique_entity_id = "cistern_level_min",
+            translation_key = "cistern_level_min",
+            value_update_function = lambda data: data.cistern_level_min,
             device_class = SensorDeviceClass.DISTANCE,
             native_unit_of_measurement = UnitOfLength.CENTIMETERS,
             unit_of_measurement = UnitOfLength.CENTIMETERS,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloBinarySensorDescriptor(
-            partial_unique_entity_id = "pump_kick",
-            translation_key = "pump_kick",
-            value_update_function = lambda data: data.pump_kick_enabled,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "pump_kick_interval",
-            translation_key = "pump_kick_interval",
-            value_update_function = lambda data: data.pump_kick_interval,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.HOURS,
-            unit_of_measurement = UnitOfTime.HOURS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "pump_kick_duration",
-            translation_key = "pump_kick_duration",
-            value_update_function = lambda data: data.pump_kick_interval,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            group = "burst"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "over_flow_threshold",
-            translation_key = "over_flow_threshold",
-            value_update_function = lambda data: data.over_flow_threshold,
+            partial_unique_entity_id = "cistern_level_max",
+            translation_key = "cistern_level_max",
+            value_update_function = lambda data: data.cistern_level_max,
             device_class = SensorDeviceClass.DISTANCE,
             native_unit_of_measurement = UnitOfLength.CENTIMETERS,
             unit_of_measurement = UnitOfLength.CENTIMETERS,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            group = "burst"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "tap_water_threshold",
-            translation_key = "tap_water_threshold",
-            value_update_function = lambda data: data.tap_water_threshold,
+            partial_unique_entity_id = "cistern_level_mean",
+            translation_key = "cistern_level_mean",
+            value_update_function = lambda data: data.cistern_level_mean,
             device_class = SensorDeviceClass.DISTANCE,
             native_unit_of_measurement = UnitOfLength.CENTIMETERS,
             unit_of_measurement = UnitOfLength.CENTIMETERS,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            group = "burst"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "rain_water_threshold",
-            translation_key = "rain_water_threshold",
-            value_update_function = lambda data: data.rain_water_threshold,
+            partial_unique_entity_id = "cistern_level_last",
+            translation_key = "cistern_level_last",
+            value_update_function = lambda data: data.cistern_level_last,
             device_class = SensorDeviceClass.DISTANCE,
             native_unit_of_measurement = UnitOfLength.CENTIMETERS,
             unit_of_measurement = UnitOfLength.CENTIMETERS,
+            state_class = SensorStateClass.MEASUREMENT,
             entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "calcination_protection_interval",
-            translation_key = "calcination_protection_interval",
-            value_update_function = lambda data: data.calcination_protection_interval,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.DAYS,
-            unit_of_measurement = UnitOfTime.DAYS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            group = "burst"
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "flushing_interval",
-            translation_key = "flushing_interval",
-            value_update_function = lambda data: data.flushing_interval,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.DAYS,
-            unit_of_measurement = UnitOfTime.DAYS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            partial_unique_entity_id = "cistern_fill_rate",
+            translation_key = "cistern_fill_rate",
+            value_update_function = lambda data: data.cistern_fill_rate,
+            native_unit_of_measurement = "cm/h",
+            state_class = SensorStateClass.MEASUREMENT,
+            group = "trend",
+            significant_change = 0.5,
+            max_quiet_period = MAX_QUIET_PERIOD
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "flushing_duration",
-            translation_key = "flushing_duration",
-            value_update_function = lambda data: data.flushing_duration,
+            partial_unique_entity_id = "cistern_time_to_overflow",
+            translation_key = "cistern_time_to_overflow",
+            value_update_function = lambda data: data.cistern_time_to_overflow,
             device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.MINUTES,
-            unit_of_measurement = UnitOfTime.MINUTES,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "pump_max_runtime",
-            translation_key = "pump_max_runtime",
-            value_update_function = lambda data: data.pump_max_runtime,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.MINUTES,
-            unit_of_measurement = UnitOfTime.MINUTES,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "fault_message_behavior",
-            translation_key = "fault_message_behavior",
-            value_update_function = lambda data: data.fault_message_behavior,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "minimum_pressure",
-            translation_key = "minimum_pressure",
-            value_update_function = lambda data: data.minimum_pressure,
-            device_class = SensorDeviceClass.PRESSURE,
-            native_unit_of_measurement = UnitOfPressure.BAR,
-            unit_of_measurement = UnitOfPressure.BAR,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "dry_run_delay",
-            translation_key = "dry_run_delay",
-            value_update_function = lambda data: data.dry_run_delay,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "dry_run_tap_water",
-            translation_key = "dry_run_tap_water",
-            value_update_function = lambda data: data.dry_run_tap_water,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "dry_run_rain_water",
-            translation_key = "dry_run_rain_water",
-            value_update_function = lambda data: data.dry_run_rain_water,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "maximum_pump_cycles_per_hour",
-            translation_key = "maximum_pump_cycles_per_hour",
-            value_update_function = lambda data: data.max_pump_cycles_alarm_count,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "switch_on_pressure",
-            translation_key = "switch_on_pressure",
-            value_update_function = lambda data: data.switch_on_pressure,
-            device_class = SensorDeviceClass.PRESSURE,
-            native_unit_of_measurement = UnitOfPressure.BAR,
-            unit_of_measurement = UnitOfPressure.BAR,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "switch_off_pressure",
-            translation_key = "switch_off_pressure",
-            value_update_function = lambda data: data.switch_off_pressure,
-            device_class = SensorDeviceClass.PRESSURE,
-            native_unit_of_measurement = UnitOfPressure.BAR,
-            unit_of_measurement = UnitOfPressure.BAR,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "mp_stop_delay",
-            translation_key = "mp_stop_delay",
-            value_update_function = lambda data: data.cistern_pump_start_time,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "cp_start_time",
-            translation_key = "cp_start_time",
-            value_update_function = lambda data: data.cistern_pump_start_time,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "cp_stop_time",
-            translation_key = "cp_stop_time",
-            value_update_function = lambda data: data.cistern_pump_stop_time,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "pressure_delta_tap_water",
-            translation_key = "pressure_delta_tap_water",
-            value_update_function = lambda data: data.pressure_delta_for_tap_water,
-            device_class = SensorDeviceClass.PRESSURE,
-            native_unit_of_measurement = UnitOfPressure.BAR,
-            unit_of_measurement = UnitOfPressure.BAR,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            native_unit_of_measurement = UnitOfTime.HOURS,
+            unit_of_measurement = UnitOfTime.HOURS,
+            group = "trend",
+            significant_change_relative = 0.05,
+            max_quiet_period = MAX_QUIET_PERIOD
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "pressure_reduction_interval",
-            translation_key = "pressure_reduction_interval",
-            value_update_function = lambda data: data.interval_for_switch_off_pressure_reduction,
+            partial_unique_entity_id = "cistern_time_to_tap_water",
+            translation_key = "cistern_time_to_tap_water",
+            value_update_function = lambda data: data.cistern_time_to_tap_water,
             device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "pressure_reduction_amount",
-            translation_key = "pressure_reduction_amount",
-            value_update_function = lambda data: data.pressure_reduction_amount,
-            device_class = SensorDeviceClass.PRESSURE,
-            native_unit_of_measurement = UnitOfPressure.BAR,
-            unit_of_measurement = UnitOfPressure.BAR,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloBinarySensorDescriptor(
-            partial_unique_entity_id = "drives_enabled",
-            translation_key = "drives_enabled",
-            value_update_function = lambda data: data.is_drive_on,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "mp_mode",
-            translation_key = "mp_mode",
-            value_update_function = lambda data: data.main_pump_mode,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloSensorDescriptor(
-            partial_unique_entity_id = "cp_mode",
-            translation_key = "cp_mode",
-            value_update_function = lambda data: data.main_pump_mode,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            native_unit_of_measurement = UnitOfTime.HOURS,
+            unit_of_measurement = UnitOfTime.HOURS,
+            group = "trend",
+            significant_change_relative = 0.05,
+            max_quiet_period = MAX_QUIET_PERIOD
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "mp_manual_runtime",
-            translation_key = "mp_manual_runtime",
-            value_update_function = lambda data: data.main_pump_manual_runtime,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
+            partial_unique_entity_id = "cistern_fill",
+            translation_key = "cistern_fill",
+            value_update_function = lambda data: data.cistern_fill,
+            native_unit_of_measurement = PERCENTAGE,
+            state_class = SensorStateClass.MEASUREMENT,
+            group = "volume",
+            significant_change = 0.5,
+            max_quiet_period = MAX_QUIET_PERIOD
         ),
         WiloSensorDescriptor(
-            partial_unique_entity_id = "cp_manual_runtime",
-            translation_key = "cp_manual_runtime",
-            value_update_function = lambda data: data.cistern_pump_manual_runtime,
-            device_class = SensorDeviceClass.DURATION,
-            native_unit_of_measurement = UnitOfTime.SECONDS,
-            unit_of_measurement = UnitOfTime.SECONDS,
-            entity_registry_enabled_default = False,
-            entity_category = EntityCategory.DIAGNOSTIC
-        ),
-        WiloBinarySensorDescriptor(
-            partial_unique_entity_id = "alarm_active",
-            translation_key = "alarm_active",
-            value_update_function = lambda data: data.is_alarm_active,
-            extra_value_update_function = lambda data: data.alarm_data,
-            device_class = BinarySensorDeviceClass.PROBLEM
+            partial_unique_entity_id = "cistern_volume",
+            translation_key = "cistern_volume",
+            value_update_function = lambda data: data.cistern_volume,
+            device_class = SensorDeviceClass.VOLUME_STORAGE,
+            native_unit_of_measurement = UnitOfVolume.LITERS,
+            state_class = SensorStateClass.MEASUREMENT,
+            group = "volume",
+            significant_change_relative = 0.005,
+            max_quiet_period = MAX_QUIET_PERIOD
         )
     ]
 
+    LONG_TERM_STATISTICS = [
+        WiloStatisticDescriptor("mp_switches", "Main pump switches", lambda data: data.main_pump_switches_counter),
+        WiloStatisticDescriptor("cp_switches", "Cistern pump switches", lambda data: data.cistern_pump_switches_counter),
+        WiloStatisticDescriptor("system_switches", "System switches", lambda data: data.system_switches_counter),
+        WiloStatisticDescriptor("mp_runtime", "Main pump runtime", lambda data: data.main_pump_total_runtime, UnitOfTime.MINUTES),
+        WiloStatisticDescriptor("cp_runtime", "Cistern pump runtime", lambda data: data.cistern_pump_total_runtime, UnitOfTime.MINUTES),
+        WiloStatisticDescriptor("system_runtime", "System runtime", lambda data: data.system_total_runtime, UnitOfTime.HOURS),
+        WiloStatisticDescriptor("max_pump_cycles_alarms", "Max. pump cycles alarms", lambda data: data.max_pump_cycles_alarm_count),
+        WiloStatisticDescriptor("pressure_sensor_fault_alarms", "Pressure sensor fault alarms", lambda data: data.pressure_sensor_fault_alarm_count),
+        WiloStatisticDescriptor("dry_running_tap_water_alarms", "Dry running tap water alarms", lambda data: data.dry_running_tap_water_alarm_count),
+        WiloStatisticDescriptor("dry_running_rain_water_alarms", "Dry running rain water alarms", lambda data: data.dry_running_rain_water_alarm_count),
+        WiloStatisticDescriptor("max_pump_runtime_alarms", "Max. pump runtime alarms", lambda data: data.max_pump_runtime_alarm_count),
+        WiloStatisticDescriptor("break_tank_overflow_alarms", "Break tank overflow alarms", lambda data: data.break_tank_overflow_alarm_count),
+        WiloStatisticDescriptor("cistern_backflow_alarms", "Cistern backflow alarms", lambda data: data.cistern_backflow_alarm_count),
+        WiloStatisticDescriptor("cistern_overflow_alarms", "Cistern overflow alarms", lambda data: data.cistern_overflow_alarm_count),
+        WiloStatisticDescriptor("high_water_alarms", "High water alarms", lambda data: data.high_water_alarm_count),
+        WiloStatisticDescriptor("level_sensor_fault_alarms", "Level sensor fault alarms", lambda data: data.level_sensor_fault_alarm_count),
+        WiloStatisticDescriptor("system_over_pressure_alarms", "System over pressure alarms", lambda data: data.system_over_pressure_alarm_count),
+    ]
+
+    DATASTORE = Rain3Datastore
+
+    PAGES = ("identity", "state", "download", "setup", "installation", "settings", "errors")
+
+    ROLLING_COUNTERS = {
+        "MP switches": (lambda data: data.main_pump_switches_counter, None),
+        "MP": (lambda data: data.main_pump_total_runtime, timedelta(minutes=1)),
+        "CP switches": (lambda data: data.cistern_pump_switches_counter, None),
+        "CP": (lambda data: data.cistern_pump_total_runtime, timedelta(minutes=1)),
+        "System switches": (lambda data: data.system_switches_counter, None),
+    }
+
     _RE_LEADING_NUM = re.compile(r"^\s*\d+(\.\d+)*\s*")
     _RE_E_CODE = re.compile(r"^\s*E\d+(?:\.\d+)?\s*")
     _RE_TRAILING_COLON = re.compile(r":\s*$")
 
-    def __init__(self, device_ip, device_id, hass):
+    def __init__(
+        self,
+        device_ip,
+        device_id,
+        hass,
+        burst_interval:float = 0,
+        max_data_age:float = DEFAULT_MAX_DATA_AGE,
+        timeout_floor:float = DEFAULT_TIMEOUT_FLOOR,
+        timeout_ceiling:float = DEFAULT_TIMEOUT_CEILING,
+        cistern_capacity:float = 0
+    ):
         """Initialize rain3 provider class.
 
         :param str device_ip:
@@ -569,9 +404,51 @@ class Rain3Provider(BaseProvider):
 
         :param HomeAssistant hass:
             Home assistant instance used for various tasks.
+
+        :param float burst_interval:
+            Seconds between samples of the state page while the pump is running, 0 disables burst sampling.
+
+        :param float max_data_age:
+            Seconds the last successfully fetched data of a page is served past its TTL if fetching it fails.
+
+        :param float timeout_floor:
+            Minimum connect and read timeout of a request in seconds.
+
+        :param float timeout_ceiling:
+            Maximum connect and read timeout of a request in seconds.
+
+        :param float cistern_capacity:
+            Volume of the full cistern in litres, 0 if unknown.
         """
         super().__init__(device_ip, device_id, WiloModels.RAIN3, hass)
         self.__client_session:ClientSession | None = None
+        self.__rate_limiter:TokenBucket | None = None
+        self.__layouts:dict[str, tuple[int, dict[str, int]]] = {}
+        self.__rolling_counters = {key: RollingCounter(ROLLING_WINDOW, ROLLING_WINDOW_SIZE) for key in self.ROLLING_COUNTERS}
+        self.__cistern_trend = LinearTrend(TREND_WINDOW, TREND_WINDOW_SIZE)
+        self.__cistern_sample_time:float | None = None
+        self.__cistern_capacity = cistern_capacity
+        self.__volume_table:tuple[tuple, VolumeTable] | None = None
+        self.__capture:TrafficCapture | None = None
+        self.__max_data_age = max_data_age
+        self.__conversion_errors:dict[str, str] = {}
+        self.__page_cache:dict[str, tuple[float, dict[str, Any]]] = {}
+        self.__combined_data:dict[str, Any] | None = None
+        self.__raw_pages:dict[str, tuple[float, str | None, bytes]] = {}
+        self.__revalidations:dict[str, asyncio.Task] = {}
+        self.__timeout_floor = timeout_floor
+        self.__timeout_ceiling = timeout_ceiling
+        self.__latencies:dict[str, PageLatency] = {}
+        self.__timings:dict[str, float] = {}
+        self.__fetch_tasks:set[asyncio.Task] = set()
+        self.__burst_sampler = BurstSampler(
+            hass,
+            f"{DOMAIN}_{self._unique_id}_burst",
+            self._async_sample_state,
+            ("pressure", "level"),
+            burst_interval,
+            BURST_BUFFER_SIZE
+        )
 
     @property
     def session(self) -> ClientSession:
@@ -580,6 +457,37 @@ class Rain3Provider(BaseProvider):
             self.__client_session = async_get_clientsession(self._hass)
         return self.__client_session
 
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        """Rate limiter shared by all requests to the pump."""
+        if self.__rate_limiter is None:
+            self.__rate_limiter = get_rate_limiter(self._hass, self._device_ip)
+        return self.__rate_limiter
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Duration in seconds of each fetch, parse and datastore step of the last update."""
+        return self.__timings
+
+    @property
+    def latency_metrics(self) -> dict[str, Any]:
+        """Connect and read latencies and timeout budgets per page."""
+        return {url_path: latency.metrics for url_path, latency in self.__latencies.items()}
+
+    def get_raw_page(self, url_path:str) -> tuple[float, str | None, bytes] | None:
+        """Returns the body of the last successful fetch of the given page.
+
+        :param str url_path:
+            Path of the page, one of `PAGES`.
+
+        :returns tuple[float, str | None, bytes]:
+            Unix timestamp of the fetch, charset (None if not sent by the pump) and body as received from the pump.
+
+        :returns None:
+            The page has not been fetched successfully yet.
+        """
+        return self.__raw_pages.get(url_path)
+
     async def async_create_device_info(self):
         """Creates device info for rain3 pump."""
         device_data = await self.async_update()
@@ -595,22 +503,335 @@ class Rain3Provider(BaseProvider):
             sw_version=device_data.software_version,
         )
 
-    async def async_update(self):
-        """Update the Datastore in the DataUpdateCoordinator."""
+    async def async_update(self, pages:frozenset[str] | None = None):
+        """Update the Datastore in the DataUpdateCoordinator.
+
+        :param frozenset[str] | None pages:
+            Pages to be fetched regardless of their TTL, the remaining pages are served from the
+            page cache within their TTL and afterwards as stale data (if not expired longer than
+            the maximum data age ago). All pages if None.
+        """
+        capture = self.__capture
+        timestamp = time.time()
+        timings:dict[str, float] = {}
+        captured_pages:dict[str, dict[str, Any]] = {}
+
         combined_data = {}
-        for url_path in ["identity", "state", "download", "setup", "installation", "settings", "errors"]:
-            html = await self.__fetch_html(url_path)
-            if not html:
-                combined_data[url_path] = {}
+        for url_path in self.PAGES:
+            cached = self.__page_cache.get(url_path)
+            requested = pages is not None and url_path in pages
+            if (
+                not requested
+                and (pages is not None or capture is None)
+                and cached is not None
+                and time.monotonic() - cached[0] < PAGE_TTLS.get(url_path, 0)
+            ):
+                combined_data[url_path] = cached[1]
                 continue
 
-            if url_path == "errors":
-                parsed = self._parse_errors_page(html)
-            else:
-                parsed = self._parse_html(html)
+            if pages is not None and not requested:
+                combined_data[url_path] = self._get_stale_page(url_path)
+                continue
+
+            page = {} if capture is not None else None
+            start = time.perf_counter()
+            root = await self._async_fetch_document(url_path, capture=page)
+            timings[f"fetch_{url_path}"] = time.perf_counter() - start
+            if page:
+                captured_pages[url_path] = page
+
+            if root is None:
+                combined_data[url_path] = self._get_stale_page(url_path)
+                self._start_revalidation(url_path)
+                continue
+
+            start = time.perf_counter()
+            parsed = self._parse_document(url_path, root)
+            timings[f"parse_{url_path}"] = time.perf_counter() - start
 
+            self.__page_cache[url_path] = (time.monotonic(), parsed)
             combined_data[url_path] = parsed
-        return Rain3Datastore(combined_data)
+
+        start = time.perf_counter()
+        combined_data["page_age"] = self._get_page_ages()
+        datastore = Rain3Datastore(combined_data)
+        self._report_conversion_errors(datastore)
+        combined_data["statistics"] = self._update_rolling_statistics(datastore)
+        combined_data["trend"] = self._update_cistern_trend(datastore)
+        combined_data["volume"] = self._update_cistern_volume(datastore)
+        combined_data["burst"] = self.__burst_sampler.aggregate()
+        timings["datastore"] = time.perf_counter() - start
+        self.__timings = timings
+        self.__combined_data = combined_data
+
+        try:
+            if datastore.is_pump_running:
+                self.__burst_sampler.start()
+        except KeyError:
+            pass
+
+        if capture is not None:
+            capture.add_cycle(timestamp, captured_pages, timings)
+            if capture.complete:
+                self.__capture = None
+                await capture.async_write(self._hass)
+                self._logger.info("Captured traffic written to %s", capture.path)
+        return datastore
+
+    def start_capture(self, path:Path, cycles:int):
+        """Captures raw page bodies and step timings of the next update cycles.
+
+        :param Path path:
+            Path of the compressed archive the capture is written to.
+
+        :param int cycles:
+            Number of update cycles to be captured.
+        """
+        self.__capture = TrafficCapture(path, cycles)
+        self._logger.info("Capturing the next %s update cycles", cycles)
+
+    async def async_close(self):
+        """Cancels in-flight requests, stops a running burst and pending revalidations and drops all cached state.
+
+        The client session is shared by home assistant and therefore not closed, only released.
+        """
+        await self.__burst_sampler.async_stop()
+        tasks = [*self.__revalidations.values(), *(task for task in self.__fetch_tasks if task is not asyncio.current_task())]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.__revalidations = {}
+        self.__fetch_tasks = set()
+
+        self.__capture = None
+        self.__client_session = None
+        self.__rate_limiter = None
+        self.__page_cache = {}
+        self.__combined_data = None
+        self.__raw_pages = {}
+        self.__layouts = {}
+        self.__latencies = {}
+        self.__timings = {}
+
+    def _parse_document(self, url_path:str, root) -> dict[str, Any]:
+        """Parses the document of the given page using the parser matching the page.
+
+        :param str url_path:
+            Path of the page.
+
+        :param HtmlElement root:
+            Root element of the parsed document.
+
+        :returns dict[str, Any]:
+            Dictionary containing parsed data from the given document.
+        """
+        if url_path == "errors":
+            return self._parse_errors_tree(root)
+        return self._parse_page(url_path, root)
+
+    def _get_stale_page(self, url_path:str) -> dict[str, Any]:
+        """Returns the last successfully parsed data of the page, unless it expired longer than the allowed data age ago.
+
+        Pages with a TTL are only refetched once their TTL expired, so their staleness is measured from then on.
+
+        :param str url_path:
+            Path of the page.
+
+        :returns dict[str, Any]:
+            Parsed data of the page, empty if no recent enough data is available.
+        """
+        cached = self.__page_cache.get(url_path)
+        if cached is None or time.monotonic() - cached[0] > PAGE_TTLS.get(url_path, 0) + self.__max_data_age:
+            return {}
+        self._logger.debug("Serving %s data fetched %.0f seconds ago", url_path, time.monotonic() - cached[0])
+        return cached[1]
+
+    def _start_revalidation(self, url_path:str):
+        """Retries fetching the page in the background, unless a retry is already running.
+
+        :param str url_path:
+            Path of the page.
+        """
+        task = self.__revalidations.get(url_path)
+        if task is not None and not task.done():
+            return
+        self.__revalidations[url_path] = self._hass.async_create_background_task(
+            self._async_revalidate(url_path), f"{DOMAIN}_{self._unique_id}_revalidate_{url_path}"
+        )
+
+    async def _async_revalidate(self, url_path:str):
+        """Retries fetching the page with increasing delay, updating the page cache and publishing the page on success.
+
+        :param str url_path:
+            Path of the page.
+        """
+        for attempt in range(1, REVALIDATION_ATTEMPTS + 1):
+            await asyncio.sleep(REVALIDATION_DELAY * attempt)
+            root = await self._async_fetch_document(url_path, caller="revalidation")
+            if root is not None:
+                parsed = self._parse_document(url_path, root)
+                self.__page_cache[url_path] = (time.monotonic(), parsed)
+                self._publish_page(url_path, parsed)
+                return
+
+    def _publish_page(self, url_path:str, parsed:dict[str, Any]):
+        """Notifies the update listener with the data of the last update, the given page replaced by a fresh fetch.
+
+        Rolling statistics, trend and burst are carried over instead of being sampled again,
+        only the cistern volume (which has no state) is recalculated.
+
+        :param str url_path:
+            Path of the page.
+
+        :param dict[str, Any] parsed:
+            Parsed data of the page.
+        """
+        if self.__combined_data is None:
+            return
+        combined_data = {**self.__combined_data, url_path: parsed, "page_age": self._get_page_ages()}
+        datastore = Rain3Datastore(combined_data)
+        combined_data["volume"] = self._update_cistern_volume(datastore)
+        self.__combined_data = combined_data
+        self._notify_update_listener(datastore)
+
+    def _get_page_ages(self) -> dict[str, float | None]:
+        """Returns the seconds since each page has been fetched successfully, None if never."""
+        now = time.monotonic()
+        return {
+            url_path: now - self.__page_cache[url_path][0] if url_path in self.__page_cache else None
+            for url_path in self.PAGES
+        }
+
+    async def _async_sample_state(self) -> dict[str, float] | None:
+        """Fetches the state page for a single burst sample.
+
+        :returns dict[str, float]:
+            Pressure and cistern level.
+
+        :returns None:
+            The pump stopped running or the page could not be fetched, ending the burst.
+        """
+        root = await self._async_fetch_document("state", caller="burst")
+        if root is None:
+            return None
+
+        datastore = Rain3Datastore({"state": self._parse_page("state", root)})
+        try:
+            if not datastore.is_pump_running:
+                return None
+            return {"pressure": datastore.pump_pressure, "level": datastore.cistern_level}
+        except (KeyError, ValueError):
+            return None
+
+    def _report_conversion_errors(self, datastore:Rain3Datastore):
+        """Logs fields which could not be converted, once per field and raw value.
+
+        :param Rain3Datastore datastore:
+            Freshly created datastore.
+        """
+        for name, raw in datastore.conversion_errors.items():
+            if self.__conversion_errors.get(name) != raw:
+                self._logger.warning("Unable to convert field %s with value %r", name, raw)
+        self.__conversion_errors = dict(datastore.conversion_errors)
+
+    def _update_cistern_trend(self, datastore:Rain3Datastore) -> dict[str, float | None]:
+        """Feeds a newly fetched cistern level into the trend estimator.
+
+        Levels served from the page cache are not added again, the fetch time of the state page is used as sample time.
+
+        :param Rain3Datastore datastore:
+            Freshly created datastore.
+
+        :returns dict[str, float | None]:
+            Fill rate in cm/h (negative while draining) and hours until the overflow threshold is reached
+            while filling or the tap water threshold while draining.
+        """
+        cached = self.__page_cache.get("state")
+        if cached is not None and cached[0] != self.__cistern_sample_time:
+            try:
+                level = datastore.cistern_level
+            except KeyError:
+                level = None
+            if level is not None:
+                self.__cistern_trend.add(cached[0], level)
+                self.__cistern_sample_time = cached[0]
+
+        trend = self.__cistern_trend
+        rate = trend.rate()
+        time_to_overflow = None
+        time_to_tap_water = None
+        try:
+            if rate is not None and rate > 0:
+                time_to_overflow = trend.time_until(datastore.over_flow_threshold, timedelta(hours=1))
+            elif rate is not None and rate < 0:
+                time_to_tap_water = trend.time_until(datastore.tap_water_threshold, timedelta(hours=1))
+        except KeyError:
+            pass
+        return {"rate": rate, "time_to_overflow": time_to_overflow, "time_to_tap_water": time_to_tap_water}
+
+    def _update_cistern_volume(self, datastore:Rain3Datastore) -> dict[str, float | None]:
+        """Converts the cistern level into its filled share and volume using the lookup table of the cistern geometry.
+
+        The table is only recomputed when the geometry on the installation page changes.
+
+        :param Rain3Datastore datastore:
+            Freshly created datastore.
+
+        :returns dict[str, float | None]:
+            Filled share in percent and volume in litres (None if the capacity is unknown).
+        """
+        try:
+            geometry = (
+                datastore.cistern_shape,
+                datastore.cistern_height_or_diameter,
+                datastore.cistern_sensor_range * 100,
+                datastore.cistern_sensor_installed_height,
+            )
+            level = datastore.cistern_level
+        except KeyError:
+            return {"fill": None, "volume": None}
+
+        if self.__volume_table is None or self.__volume_table[0] != geometry:
+            try:
+                self.__volume_table = (geometry, VolumeTable(*geometry, VOLUME_TABLE_SIZE))
+            except ValueError as err:
+                self._logger.warning("Unable to calculate the cistern volume: %s", err)
+                return {"fill": None, "volume": None}
+
+        fraction = self.__volume_table[1].fraction(level)
+        return {
+            "fill": fraction * 100,
+            "volume": fraction * self.__cistern_capacity if self.__cistern_capacity else None,
+        }
+
+    def _update_rolling_statistics(self, datastore:Rain3Datastore) -> dict[str, dict[str, float | None]]:
+        """Feeds the counters of the given datastore into the rolling window aggregators.
+
+        Counters missing in the datastore (e.g. failed page fetch) are skipped for this update.
+
+        :param Rain3Datastore datastore:
+            Freshly created datastore.
+
+        :returns dict[str, dict[str, float | None]]:
+            Dictionary containing delta, rate and duty cycle of each counter within the window.
+        """
+        timestamp = time.monotonic()
+        statistics = {}
+        for key, (value_function, unit) in self.ROLLING_COUNTERS.items():
+            counter = self.__rolling_counters[key]
+            try:
+                value = value_function(datastore)
+            except (KeyError, ValueError):
+                value = None
+            if value is not None:
+                counter.add(timestamp, value)
+
+            statistics[key] = {
+                "delta": counter.delta,
+                "rate": counter.rate(),
+                "duty_cycle": counter.duty_cycle(unit) if unit is not None else None,
+            }
+        return statistics
 
     def _clean_key(self, raw_key: str) -> str:
         """Cleans the given key removing setting numbers and error codes.
@@ -641,17 +862,64 @@ class Rain3Provider(BaseProvider):
         value = raw_value.replace("\x00", "").strip()
         return re.sub(r"<br\s*/?>", "", value, flags=re.IGNORECASE).strip()
 
-    def _parse_html(self, html: str) -> dict[str, str]:
-        """Default parser for pages using the following format: `<span>...<b>...</b>`.
+    def _parse_page(self, url_path:str, root) -> dict[str, str]:
+        """Parses the given page, using the learned layout of the page if its structure is unchanged.
+
+        On the first parse (and whenever the structure or a label changes, e.g. after a firmware update)
+        the page is parsed using `_parse_tree` and the position of each key's `<b>` element is stored.
+        Later parses with a matching fingerprint read the values directly from those positions.
+
+        :param str url_path:
+            Path of the page, used to store the learned layout.
 
-        :param str html:
-            HTML as string to be parsed.
+        :param HtmlElement root:
+            Root element of the parsed document.
 
         :returns dict[str, str]:
             Dictionary containing parsed data from the given input html document.
         """
-        root = lxml_html.fromstring(html.replace("\x00", ""))
+        fingerprint = self._layout_fingerprint(root)
+
+        layout = self.__layouts.get(url_path)
+        if layout is not None and layout[0] == fingerprint:
+            b_tags = list(root.iter("b"))
+            return {key: self._clean_value(b_tags[index].text_content()) for key, index in layout[1].items()}
+
+        results, positions = self._parse_tree(root)
+        self.__layouts[url_path] = (fingerprint, positions)
+        return results
+
+    @staticmethod
+    def _layout_fingerprint(root) -> int:
+        """Creates a fingerprint of the document structure and its labels, ignoring the values.
+
+        The label texts are included, as conditional rows (e.g. `MP running for` and `Stop MP in`)
+        share the same structure, but must not reuse the positions learned for the other label.
+
+        :param HtmlElement root:
+            Root element of the parsed document.
+
+        :returns int:
+            Hash over the tags of all elements and the texts of all `<span>` elements in document order.
+        """
+        return hash(tuple(
+            (element.tag, element.text_content()) if element.tag == "span" else element.tag
+            for element in root.iter()
+        ))
+
+    def _parse_tree(self, root) -> tuple[dict[str, str], dict[str, int]]:
+        """Parses an already built document using the following format: `<span>...<b>...</b>`.
+
+        :param HtmlElement root:
+            Root element of the parsed document.
+
+        :returns tuple[dict[str, str], dict[str, int]]:
+            Dictionary containing the parsed data and dictionary containing the
+            index (in document order) of the `<b>` element each key was read from.
+        """
         results: dict[str, str] = {}
+        positions: dict[str, int] = {}
+        b_indices = {b: index for index, b in enumerate(root.iter("b"))}
 
         for span in root.xpath("//span"):
             raw_key = span.text_content() or ""
@@ -666,22 +934,22 @@ class Rain3Provider(BaseProvider):
 
             value = self._clean_value(raw_value)
             results[key] = value
+            positions[key] = b_indices[b[0]]
 
-        return results
+        return results, positions
 
-    def _parse_errors_page(self, html: str) -> dict[str, str]:
+    def _parse_errors_tree(self, root) -> dict[str, str]:
         """Specialized parser used for error-endpoint to extract additional fields like alarm history.
 
-        :param str html:
-            HTML as string to be parsed.
+        :param HtmlElement root:
+            Root element of the parsed document.
 
         :returns dict[str, str]:
             Dictionary containing parsed data from the given input html document.
         """
-        root = lxml_html.fromstring(html.replace("\x00", ""))
         results: dict[str, str] = {}
 
-        results.update(self._parse_html(html))
+        results.update(self._parse_tree(root)[0])
 
         alarm_text = root.xpath("string(//h2[normalize-space()='Alarm']/following-sibling::text()[1])")
         if alarm_text:
@@ -703,32 +971,103 @@ class Rain3Provider(BaseProvider):
 
         return results
 
-    async def __fetch_html(self, url_path:str, timeout:int = 10) -> str | None:
-        """Loads the contents of the webpage and returns them.
+    def _get_latency(self, url_path:str) -> PageLatency:
+        """Returns the latency tracker of the given page, creating it on first use."""
+        latency = self.__latencies.get(url_path)
+        if latency is None:
+            latency = self.__latencies[url_path] = PageLatency(
+                self.__timeout_floor,
+                self.__timeout_ceiling,
+                min(self.__timeout_ceiling, max(self.__timeout_floor, TIMEOUT_INITIAL)),
+                LATENCY_SMOOTHING,
+                LATENCY_WINDOW_SIZE
+            )
+        return latency
+
+    async def _async_fetch_document(self, url_path:str, timeout:ClientTimeout | None = None, capture:dict[str, Any] | None = None, caller:str = "poll"):
+        """Loads the webpage and parses it incrementally while the response body is still arriving.
 
+        Each received chunk is fed into an incremental lxml parser, so parsing overlaps the
+        network transfer and the finished tree is available as soon as the transfer completes.
+        Unless given, the timeout adapts to the latencies previously observed for the page.
         Errors are silently ignored and logged directly to ha.
 
         :param str url_path:
             Path of the url to the requested webpage.
 
-        :param int timeout:
-            Timeout in seconds before the request fails with a timeout error.
+        :param ClientTimeout | None timeout:
+            Timeout before the request fails with a timeout error, adaptive per page if None.
 
-        :returns str:
-            Content of the response.
+        :param dict[str, Any] | None capture:
+            If given, the raw `body` and its `encoding` are stored in this dictionary.
+
+        :param str caller:
+            Name of the caller, used for the rate limiter wait time metrics.
+
+        :returns HtmlElement:
+            Root element of the parsed document.
 
         :returns None:
-            An error occured.
+            An error occured or the response was empty.
         """
+        latency = None
+        if timeout is None:
+            latency = self._get_latency(url_path)
+            timeout = latency.timeout
+
+        task = asyncio.current_task()
+        self.__fetch_tasks.add(task)
+        phase = latency.connect if latency is not None else None
         try:
+            await self.rate_limiter.async_acquire(caller)
+            start = time.monotonic()
             async with self.session.get(f"http://{self._device_ip}/{url_path}", timeout=timeout) as response:
+                if latency is not None:
+                    latency.connect.add(time.monotonic() - start)
+                    phase = latency.read
+                    start = time.monotonic()
+
                 if response.status != 200:
                     self._logger.warning("Unexpected response status %s while fetching %s", response.status, url_path)
 
-                return await response.text()
+                # Without a charset header, libxml2 detects the encoding from the BOM or meta tag
+                encoding = response.charset
+                parser = lxml_html.HTMLParser(encoding=encoding)
+                body = bytearray()
+                if capture is not None:
+                    capture["encoding"] = encoding
+                    capture["body"] = body
+
+                received = False
+                async for chunk in response.content.iter_any():
+                    body += chunk
+                    chunk = chunk.replace(b"\x00", b"")
+                    if chunk:
+                        parser.feed(chunk)
+                        received = True
+
+                if latency is not None:
+                    latency.read.add(time.monotonic() - start)
+                    phase = None
+
+                if not received:
+                    return None
+                root = parser.close()
+                if response.status == 200:
+                    self.__raw_pages[url_path] = (time.time(), encoding, bytes(body))
+                return root
+        except ConnectionTimeoutError:
+            # Not recorded, so the budget of an unreachable pump is not increased
+            self._logger.warning("Timeout while connecting to fetch %s", url_path)
         except TimeoutError:
-            self._logger.warning("Timeout after %s seconds while fetching %s", timeout, url_path)
+            if phase is not None:
+                phase.timeout()
+            self._logger.warning("Timeout after %.1f seconds while fetching %s", timeout.total, url_path)
         except ClientResponseError as err:
             self._logger.warning("Client response error while fetching %s: %s", url_path, err)
         except ClientError as err:
             self._logger.warning("Client error while fetching %s: %s", url_path, err)
+        except etree.ParseError as err:
+            self._logger.warning("Failed to parse %s: %s", url_path, err)
+        finally:
+            self.__fetch_tasks.discard(task)
@@ -0,0 +1,138 @@
+"""Implements a per-host rate limiter protecting the embedded web server of the pumps."""
+
+import asyncio
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_RATE_LIMITERS, DEFAULT_RATE_LIMIT, DEFAULT_RATE_LIMIT_BURST
+
+
+class TokenBucket:
+    """Token bucket rate limiter handing out tokens in the order they were requested.
+
+    Waiting callers are queued in FIFO order, so no caller can starve another one.
+    Waiting times are recorded per caller.
+    """
+
+    def __init__(self, rate:float, burst:int):
+        """Initialize the token bucket.
+
+        :param float rate:
+            Sustained rate in requests per second.
+
+        :param int burst:
+            Maximum number of requests allowed in a burst.
+        """
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._metrics:dict[str, dict[str, float]] = {}
+
+    def configure(self, rate:float, burst:int):
+        """Changes the rates of the bucket.
+
+        :param float rate:
+            Sustained rate in requests per second.
+
+        :param int burst:
+            Maximum number of requests allowed in a burst.
+        """
+        self._refill()
+        self._rate = rate
+        self._burst = burst
+        self._tokens = min(self._tokens, burst)
+
+    @property
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """Number of requests and total, mean and maximum queue wait time in seconds per caller."""
+        return {
+            caller: {**metrics, "mean_wait": metrics["total_wait"] / metrics["requests"]}
+            for caller, metrics in self._metrics.items()
+        }
+
+    async def async_acquire(self, caller:str) -> float:
+        """Waits until a request may be sent.
+
+        :param str caller:
+            Name of the caller, used for the wait time metrics.
+
+        :returns float:
+            Time in seconds the caller waited.
+        """
+        start = time.monotonic()
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+        wait = time.monotonic() - start
+        metrics = self._metrics.setdefault(caller, {"requests": 0, "total_wait": 0.0, "max_wait": 0.0})
+        metrics["requests"] += 1
+        metrics["total_wait"] += wait
+        metrics["max_wait"] = max(metrics["max_wait"], wait)
+        return wait
+
+    def _refill(self):
+        """Adds the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+def get_rate_limiter(hass:HomeAssistant, host:str) -> TokenBucket:
+    """Returns the rate limiter shared by all requests to the given host.
+
+    :param HomeAssistant hass:
+        Home assistant instance storing the rate limiters.
+
+    :param str host:
+        IP address of the pump.
+
+    :returns TokenBucket:
+        Rate limiter of the host, created with the default rates if not existing yet.
+    """
+    rate_limiters:dict[str, TokenBucket] = hass.data.setdefault(DATA_RATE_LIMITERS, {})
+    if host not in rate_limiters:
+        rate_limiters[host] = TokenBucket(DEFAULT_RATE_LIMIT, DEFAULT_RATE_LIMIT_BURST)
+    return rate_limiters[host]
+
+
+def find_rate_limiter(hass:HomeAssistant, host:str) -> TokenBucket:
+    """Returns the shared rate limiter of the given host without registering a new one.
+
+    Used by requests outside of a loaded entry (e.g. probes of the config flow), so hosts which
+    never become an entry do not leave a rate limiter behind.
+
+    :param HomeAssistant hass:
+        Home assistant instance storing the rate limiters.
+
+    :param str host:
+        IP address of the pump.
+
+    :returns TokenBucket:
+        Rate limiter of the host, a new unregistered one with the default rates if not existing.
+    """
+    rate_limiter = hass.data.get(DATA_RATE_LIMITERS, {}).get(host)
+    if rate_limiter is None:
+        rate_limiter = TokenBucket(DEFAULT_RATE_LIMIT, DEFAULT_RATE_LIMIT_BURST)
+    return rate_limiter
+
+
+def get_rate_limiter_metrics(hass:HomeAssistant, host:str) -> dict[str, Any]:
+    """Returns the wait time metrics of the given host, empty if no request has been made yet."""
+    rate_limiter = hass.data.get(DATA_RATE_LIMITERS, {}).get(host)
+    return rate_limiter.metrics if rate_limiter is not None else {}
+
+
+def remove_rate_limiter(hass:HomeAssistant, host:str):
+    """Removes the rate limiter of the given host, to be called once no pump of the host is loaded anymore."""
+    rate_limiters:dict[str, TokenBucket] = hass.data.get(DATA_RATE_LIMITERS, {})
+    rate_limiters.pop(host, None)
+    if not rate_limiters:
+        hass.data.pop(DATA_RATE_LIMITERS, None)
@@ -0,0 +1,98 @@
+"""Implements rolling window aggregators for incremental counters."""
+
+from collections import deque
+from datetime import timedelta
+
+
+class RollingCounter:
+    """Tracks the increase of an incremental counter over a sliding time window.
+
+    Samples are kept in a fixed-size ring buffer with a resolution of `window / size`,
+    so memory usage and the cost per update are independent of the polling interval.
+    Counter resets (value lower than the previous one) are treated as a restart from zero.
+    """
+
+    def __init__(self, window:timedelta, size:int):
+        """Initialize the rolling counter.
+
+        :param timedelta window:
+            Length of the sliding window.
+
+        :param int size:
+            Number of samples kept in the ring buffer for the window.
+        """
+        self._window = window.total_seconds()
+        self._resolution = self._window / size
+        self._samples:deque[tuple[float, float]] = deque(maxlen=size + 1)
+        self._last_value:float | None = None
+        self._last_timestamp:float | None = None
+        self._total = 0.0
+
+    def add(self, timestamp:float, value:float):
+        """Adds a new reading of the counter.
+
+        :param float timestamp:
+            Monotonic timestamp in seconds of the reading.
+
+        :param float value:
+            Current value of the counter.
+        """
+        if self._last_value is not None:
+            if value >= self._last_value:
+                self._total += value - self._last_value
+            else:
+                self._total += value
+        self._last_value = value
+        self._last_timestamp = timestamp
+
+        if not self._samples or timestamp - self._samples[-1][0] >= self._resolution:
+            self._samples.append((timestamp, self._total))
+
+        while len(self._samples) > 1 and timestamp - self._samples[0][0] > self._window:
+            self._samples.popleft()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds covered by the samples currently in the window."""
+        if not self._samples:
+            return 0.0
+        return self._last_timestamp - self._samples[0][0]
+
+    @property
+    def delta(self) -> float | None:
+        """Increase of the counter within the window.
+
+        :returns None:
+            No reading has been added yet.
+        """
+        if not self._samples:
+            return None
+        return self._total - self._samples[0][1]
+
+    def rate(self, per:timedelta = timedelta(hours=1)) -> float | None:
+        """Average increase of the counter within the window.
+
+        :param timedelta per:
+            Time unit the rate is expressed in.
+
+        :returns None:
+            Not enough readings to calculate a rate.
+        """
+        elapsed = self.elapsed
+        if elapsed <= 0:
+            return None
+        return self.delta / elapsed * per.total_seconds()
+
+    def duty_cycle(self, unit:timedelta) -> float | None:
+        """Share of the window in percent during which the counter, measuring a runtime, increased.
+
+        :param timedelta unit:
+            Time unit of the counter value.
+
+        :returns None:
+            Not enough readings to calculate the duty cycle.
+        """
+        elapsed = self.elapsed
+        if elapsed <= 0:
+            return None
+        return min(self.delta * unit.total_seconds() / elapsed * 100, 100.0)
@@ -4,7 +4,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
-from .providers import Providers
+from .providers import BaseProvider
 from .wilo_sensor import GenericWiloBinarySensor, GenericWiloSensor
 from .wilo_sensor_descriptor import WiloBinarySensorDescriptor, WiloSensorDescriptor
 
@@ -13,7 +13,7 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry, async_add_ent
     """Initialize all entities associated with the PumpHandlerClass."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
-    pump:Providers = data["pump"]
+    pump:BaseProvider = data["pump"]
 
     entities:list[GenericWiloSensor | GenericWiloBinarySensor] = []
     for sensor_descriptor in pump.SENSORS:
@@ -24,4 +24,5 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry, async_add_ent
             case WiloBinarySensorDescriptor():
                 entities.append(GenericWiloBinarySensor(coordinator, sensor_descriptor, pump))
 
+    data["entities"] = entities
     async_add_entities(entities)
@@ -0,0 +1,97 @@
+"""Registers the services offered by the Wilo integration."""
+
+import asyncio
+from pathlib import Path
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import CAPTURE_DIRECTORY, DOMAIN, PROFILE_DIRECTORY, PROFILE_SAMPLE_INTERVAL
+from .profiler import UpdateProfiler
+
+SERVICE_CAPTURE = "capture"
+SERVICE_REFRESH = "refresh"
+SERVICE_PROFILE = "profile"
+
+CAPTURE_SCHEMA = vol.Schema({
+    vol.Required("cycles"): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+    vol.Optional("config_entry_id"): cv.string,
+})
+
+REFRESH_SCHEMA = vol.Schema({
+    vol.Optional("pages"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional("config_entry_id"): cv.string,
+})
+
+PROFILE_SCHEMA = vol.Schema({
+    vol.Required("cycles"): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    vol.Optional("config_entry_id"): cv.string,
+})
+
+
+def async_setup_services(hass:HomeAssistant):
+    """Registers the integration services, unless already registered by another entry."""
+    if hass.services.has_service(DOMAIN, SERVICE_CAPTURE):
+        return
+
+    async def async_capture(call:ServiceCall):
+        """Starts capturing the traffic of the selected pumps."""
+        for entry_data in _get_entry_data(hass, call.data.get("config_entry_id")):
+            pump = entry_data["pump"]
+            path = Path(hass.config.path(CAPTURE_DIRECTORY)) / f"{pump.unique_id}_{dt_util.utcnow():%Y%m%dT%H%M%S}.jsonl.gz"
+            pump.start_capture(path, call.data["cycles"])
+
+    async def async_refresh(call:ServiceCall):
+        """Refreshes the selected pages of the selected pumps."""
+        requested = call.data.get("pages")
+        refreshes = []
+        for entry_data in _get_entry_data(hass, call.data.get("config_entry_id")):
+            pages = None
+            if requested:
+                pages = frozenset(page for page in requested if page in entry_data["pump"].PAGES)
+                if not pages:
+                    continue
+            refreshes.append(entry_data["coordinator"].async_refresh_pages(pages))
+        await asyncio.gather(*refreshes)
+
+    async def async_profile(call:ServiceCall):
+        """Profiles the next update cycles of the selected pump.
+
+        cProfile allows only one active profiler per process, so only one pump is profiled at a time.
+        """
+        selected = _get_entry_data(hass, call.data.get("config_entry_id"))
+        if len(selected) > 1:
+            raise ServiceValidationError(translation_domain=DOMAIN, translation_key="profile_multiple_pumps")
+        if any(entry_data["coordinator"].profiling for entry_data in hass.data.get(DOMAIN, {}).values()):
+            raise ServiceValidationError(translation_domain=DOMAIN, translation_key="profile_running")
+
+        for entry_data in selected:
+            pump = entry_data["pump"]
+            path = Path(hass.config.path(PROFILE_DIRECTORY)) / f"{pump.unique_id}_{dt_util.utcnow():%Y%m%dT%H%M%S}"
+            entry_data["coordinator"].start_profile(UpdateProfiler(path, call.data["cycles"], PROFILE_SAMPLE_INTERVAL))
+
+    hass.services.async_register(DOMAIN, SERVICE_CAPTURE, async_capture, schema=CAPTURE_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, async_refresh, schema=REFRESH_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA)
+
+
+def async_unload_services(hass:HomeAssistant):
+    """Removes the integration services once no entry is loaded anymore."""
+    if hass.data.get(DOMAIN):
+        return
+    for service in (SERVICE_CAPTURE, SERVICE_REFRESH, SERVICE_PROFILE):
+        hass.services.async_remove(DOMAIN, service)
+
+
+def _get_entry_data(hass:HomeAssistant, config_entry_id:str | None) -> list[dict]:
+    """Returns the stored data of the given config entry, or of all entries if none is given."""
+    entries = hass.data.get(DOMAIN, {})
+    if config_entry_id is None:
+        return list(entries.values())
+    if config_entry_id in entries:
+        return [entries[config_entry_id]]
+    return []
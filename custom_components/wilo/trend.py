@@ -0,0 +1,138 @@
+"""Implements an incremental linear trend estimator for sampled values."""
+
+from collections import deque
+from datetime import timedelta
+
+
+class LinearTrend:
+    """Fits a least-squares line through the samples of a sliding time window in O(1) per sample.
+
+    The sums needed for the fit are updated incrementally when samples enter or leave the
+    fixed-size ring buffer. Timestamps are stored relative to an origin which is moved to the
+    oldest sample once per `size` samples (recomputing the sums), keeping the sums numerically stable.
+    """
+
+    def __init__(self, window:timedelta, size:int, min_samples:int = 3):
+        """Initialize the trend estimator.
+
+        :param timedelta window:
+            Length of the sliding window.
+
+        :param int size:
+            Maximum number of samples kept in the window.
+
+        :param int min_samples:
+            Number of samples required before a trend is reported.
+        """
+        self._window = window.total_seconds()
+        self._size = size
+        self._min_samples = max(2, min_samples)
+        self._samples:deque[tuple[float, float]] = deque()
+        self._origin:float | None = None
+        self._added = 0
+        self._sum_t = 0.0
+        self._sum_y = 0.0
+        self._sum_tt = 0.0
+        self._sum_ty = 0.0
+
+    def add(self, timestamp:float, value:float):
+        """Adds a new sample, removing samples which left the window.
+
+        :param float timestamp:
+            Monotonic timestamp in seconds of the sample.
+
+        :param float value:
+            Sampled value.
+        """
+        if self._origin is None:
+            self._origin = timestamp
+
+        t = timestamp - self._origin
+        self._samples.append((t, value))
+        self._sum_t += t
+        self._sum_y += value
+        self._sum_tt += t * t
+        self._sum_ty += t * value
+
+        while len(self._samples) > self._size or (len(self._samples) > 1 and t - self._samples[0][0] > self._window):
+            old_t, old_value = self._samples.popleft()
+            self._sum_t -= old_t
+            self._sum_y -= old_value
+            self._sum_tt -= old_t * old_t
+            self._sum_ty -= old_t * old_value
+
+        self._added += 1
+        if self._added >= self._size:
+            self._rebase()
+
+    @property
+    def slope(self) -> float | None:
+        """Change of the value per second.
+
+        :returns None:
+            Not enough samples, or all samples share the same timestamp.
+        """
+        n = len(self._samples)
+        if n < self._min_samples:
+            return None
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 0:
+            return None
+        return (n * self._sum_ty - self._sum_t * self._sum_y) / denominator
+
+    @property
+    def value(self) -> float | None:
+        """Value of the fitted line at the latest sample.
+
+        :returns None:
+            Not enough samples to fit a line.
+        """
+        slope = self.slope
+        if slope is None:
+            return None
+        n = len(self._samples)
+        intercept = (self._sum_y - slope * self._sum_t) / n
+        return intercept + slope * self._samples[-1][0]
+
+    def rate(self, per:timedelta = timedelta(hours=1)) -> float | None:
+        """Change of the value per time unit.
+
+        :param timedelta per:
+            Time unit the rate is expressed in.
+
+        :returns None:
+            Not enough samples to fit a line.
+        """
+        slope = self.slope
+        if slope is None:
+            return None
+        return slope * per.total_seconds()
+
+    def time_until(self, threshold:float, per:timedelta = timedelta(seconds=1)) -> float | None:
+        """Time until the fitted line crosses the given threshold.
+
+        :param float threshold:
+            Value to be crossed.
+
+        :param timedelta per:
+            Time unit the result is expressed in.
+
+        :returns None:
+            Not enough samples, or the fitted line runs parallel to or away from the threshold.
+        """
+        slope = self.slope
+        if not slope:
+            return None
+        seconds = (threshold - self.value) / slope
+        return seconds / per.total_seconds() if seconds >= 0 else None
+
+    def _rebase(self):
+        """Moves the origin to the oldest sample and recomputes the sums from the buffer."""
+        shift = self._samples[0][0]
+        self._origin += shift
+        self._samples = deque((t - shift, value) for t, value in self._samples)
+        self._sum_t = sum(t for t, _ in self._samples)
+        self._sum_y = sum(value for _, value in self._samples)
+        self._sum_tt = sum(t * t for t, _ in self._samples)
+        self._sum_ty = sum(t * value for t, value in self._samples)
+        self._added = 0
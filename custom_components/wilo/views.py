@@ -0,0 +1,101 @@
+"""Registers the HTTP views serving the cached pump data to external consumers.
+
+Both views require home assistant authentication (e.g. a long-lived access token) and only
+serve data already fetched by the coordinator, so consumers never cause requests to the pump.
+"""
+
+from http import HTTPStatus
+import time
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.http import KEY_HASS
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_VIEWS, DOMAIN
+
+
+def async_register_views(hass:HomeAssistant):
+    """Registers the views, unless already registered by another entry.
+
+    Views cannot be removed from the http server, unloaded entries are answered with 404 instead.
+    """
+    if hass.data.get(DATA_VIEWS):
+        return
+    hass.http.register_view(WiloDataView())
+    hass.http.register_view(WiloPageView())
+    hass.data[DATA_VIEWS] = True
+
+
+def _get_entry_data(hass:HomeAssistant, entry_id:str) -> dict | None:
+    """Returns the data of a loaded config entry, None if not loaded."""
+    return hass.data.get(DOMAIN, {}).get(entry_id)
+
+
+class WiloDataView(HomeAssistantView):
+    """Serves the parsed datastore of a pump as JSON.
+
+    The response carries the coordinator generation as ETag, allowing consumers to poll
+    with `If-None-Match` and receive 304 until new data has been fetched.
+    """
+
+    url = "/api/wilo/{entry_id}"
+    name = "api:wilo:data"
+
+    async def get(self, request:web.Request, entry_id:str) -> web.Response:
+        """Returns the latest datastore of the given config entry."""
+        entry_data = _get_entry_data(request.app[KEY_HASS], entry_id)
+        if entry_data is None:
+            return self.json_message("Config entry not loaded", HTTPStatus.NOT_FOUND)
+
+        coordinator = entry_data["coordinator"]
+        datastore = coordinator.data
+        if datastore is None:
+            return self.json_message("No data fetched yet", HTTPStatus.SERVICE_UNAVAILABLE)
+
+        etag = f'"{entry_data["pump"].unique_id}-{coordinator.generation}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        response = self.json({
+            "unique_id": entry_data["pump"].unique_id,
+            "generation": coordinator.generation,
+            "last_update_success": coordinator.last_update_success,
+            "data": datastore.data,
+            "values": datastore.numeric_values,
+            "conversion_errors": datastore.conversion_errors,
+        })
+        response.headers.update(headers)
+        return response
+
+
+class WiloPageView(HomeAssistantView):
+    """Serves the body of the last successful fetch of a pump page, exactly as received from the pump."""
+
+    url = "/api/wilo/{entry_id}/pages/{page}"
+    name = "api:wilo:page"
+
+    async def get(self, request:web.Request, entry_id:str, page:str) -> web.Response:
+        """Returns the cached raw body of the given page."""
+        entry_data = _get_entry_data(request.app[KEY_HASS], entry_id)
+        if entry_data is None:
+            return self.json_message("Config entry not loaded", HTTPStatus.NOT_FOUND)
+
+        raw_page = entry_data["pump"].get_raw_page(page)
+        if raw_page is None:
+            return self.json_message("Page not cached", HTTPStatus.NOT_FOUND)
+
+        fetched, encoding, body = raw_page
+        return web.Response(
+            body=body,
+            content_type="text/html",
+            charset=encoding,
+            headers={
+                "Age": str(max(int(time.time() - fetched), 0)),
+                "Last-Modified": dt_util.utc_from_timestamp(fetched).strftime("%a, %d %b %Y %H:%M:%S GMT"),
+                "Cache-Control": "no-cache",
+            },
+        )
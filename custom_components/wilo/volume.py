@@ -0,0 +1,82 @@
+"""Implements the lookup table converting the cistern level into its filled share of the volume."""
+
+import math
+
+
+class VolumeTable:
+    """Precomputed level to fill fraction lookup table for a cistern geometry.
+
+    The table is computed once per geometry, converting a level afterwards only interpolates between two entries.
+    Lying cylinders and spheres are filled non-linearly, all other (upright) shapes linearly.
+    The level is measured by the sensor, which is mounted `installed_height` above the bottom of the cistern.
+    """
+
+    def __init__(self, shape:str, height:float, sensor_range:float, installed_height:float, size:int):
+        """Initialize the volume table.
+
+        :param str shape:
+            Shape of the cistern as reported by the pump.
+
+        :param float height:
+            Height (or diameter of lying cylinders and spheres) of the cistern in cm.
+
+        :param float sensor_range:
+            Measuring range of the level sensor in cm, limiting the levels covered by the table.
+
+        :param float installed_height:
+            Height of the level sensor above the bottom of the cistern in cm.
+
+        :param int size:
+            Number of intervals of the table.
+        """
+        if height <= 0:
+            raise ValueError(f"Invalid cistern height {height}")
+
+        self._installed_height = installed_height
+        self._max_level = max(min(sensor_range, height - installed_height), 0.0)
+        self._step = self._max_level / size if self._max_level else 0.0
+        fill_function = self._get_fill_function(shape)
+        self._table = [
+            fill_function(min(max((installed_height + index * self._step) / height, 0.0), 1.0))
+            for index in range(size + 1)
+        ]
+
+    def fraction(self, level:float) -> float:
+        """Returns the filled share of the cistern volume at the given level.
+
+        :param float level:
+            Level in cm as measured by the sensor.
+
+        :returns float:
+            Filled share between 0 and 1.
+        """
+        if not self._step:
+            return self._table[0]
+        position = min(max(level, 0.0), self._max_level) / self._step
+        index = min(int(position), len(self._table) - 2)
+        lower = self._table[index]
+        return lower + (self._table[index + 1] - lower) * (position - index)
+
+    @classmethod
+    def _get_fill_function(cls, shape:str):
+        """Returns the function converting the relative filling height into the filled share of the volume."""
+        if "lying" in shape or "horizontal" in shape:
+            return cls._lying_cylinder
+        if "sphere" in shape or "ball" in shape:
+            return cls._sphere
+        return cls._upright
+
+    @staticmethod
+    def _upright(height:float) -> float:
+        """Share of an upright cylinder or cuboid filled up to the relative height."""
+        return height
+
+    @staticmethod
+    def _lying_cylinder(height:float) -> float:
+        """Share of a lying cylinder filled up to the relative height, using the area of the circular segment."""
+        return (math.acos(1 - 2 * height) - (1 - 2 * height) * math.sqrt(max(1 - (1 - 2 * height) ** 2, 0.0))) / math.pi
+
+    @staticmethod
+    def _sphere(height:float) -> float:
+        """Share of a sphere filled up to the relative height, using the volume of the spherical cap."""
+        return height * height * (3 - 2 * height)
@@ -1,8 +1,15 @@
 """Implements the GenericWiloSensor."""
 
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import time
+from typing import Any
+
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -12,6 +19,44 @@ from .wilo_sensor_descriptor import WiloSensorDescriptor
 from .const import DOMAIN
 
 
+class GenerationCache:
+    """Memoizes values computed from the coordinator data until the coordinator fetched new data."""
+
+    def __init__(self, coordinator:DataUpdateCoordinator):
+        """Initialize GenerationCache.
+
+        :param DataUpdateCoordinator coordinator:
+            Coordinator providing the data and its generation.
+        """
+        self._coordinator = coordinator
+        self._generation:int | None = None
+        self._values:dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key:str, function:Callable[[Any], Any]) -> Any:
+        """Returns the memoized value, computing it only once per data generation.
+
+        :param str key:
+            Key of the memoized value.
+
+        :param Callable function:
+            Function computing the value from the coordinator data.
+        """
+        generation = self._coordinator.generation
+        if generation != self._generation:
+            self._values = {}
+            self._generation = generation
+
+        if key in self._values:
+            self.hits += 1
+            return self._values[key]
+
+        self.misses += 1
+        value = self._values[key] = function(self._coordinator.data)
+        return value
+
+
 class GenericWiloSensor(CoordinatorEntity, SensorEntity):
     """Generic sensor class used to, in combination with WiloSensorDescriptor, create sensors for each provider."""
 
@@ -27,7 +72,7 @@ class GenericWiloSensor(CoordinatorEntity, SensorEntity):
         :param WiloProvider provider:
             Provider providing this sensor entity.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, descriptor.group)
         self._provider = provider
         self._attr_unique_id = f"{provider.unique_id}_{descriptor.partial_unique_entity_id}"
         self.entity_id = f"sensor.{DOMAIN}_{provider.unique_id}_{descriptor.partial_unique_entity_id}"
@@ -40,15 +85,101 @@ class GenericWiloSensor(CoordinatorEntity, SensorEntity):
         self._attr_entity_registry_enabled_default = descriptor.entity_registry_enabled_default
         self._attr_entity_category = descriptor.entity_category
         self.__update_function = descriptor.value_update_function
+        self.__update_function_extra_attributes = descriptor.extra_value_update_function
+        self.__group = descriptor.group
+        self.__extrapolation_rate = descriptor.extrapolation_rate
+        self.__extrapolation_interval = descriptor.extrapolation_interval
+        self.__significant_change = descriptor.significant_change
+        self.__significant_change_relative = descriptor.significant_change_relative
+        self.__max_quiet_period = descriptor.max_quiet_period
+        self.__filtered = bool(descriptor.significant_change or descriptor.significant_change_relative)
+        self.__written:tuple[bool, Any, float] | None = None
+        self.cache = GenerationCache(coordinator)
+
+    async def async_added_to_hass(self):
+        """Starts the local timer of extrapolated sensors."""
+        await super().async_added_to_hass()
+        if self.__extrapolation_rate:
+            self.async_on_remove(async_track_time_interval(
+                self.hass, self.__async_tick, timedelta(seconds=self.__extrapolation_interval)
+            ))
+
+    @property
+    def available(self) -> bool:
+        """Unavailable if the data of the page the value is read from is missing or too old."""
+        if not super().available:
+            return False
+        try:
+            self.cache.get("value", self.__update_function)
+        except KeyError:
+            return False
+        return True
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Writes the state of new coordinator data, unless filtered as insignificant change."""
+        if self.__filtered and not self.__is_significant_change():
+            return
+        super()._handle_coordinator_update()
+
+    @callback
+    def async_write_ha_state(self):
+        """Writes the state, remembering the written value to filter the following updates."""
+        super().async_write_ha_state()
+        if self.__filtered:
+            available = self.available
+            self.__written = (available, self.native_value if available else None, time.monotonic())
 
     @property
     def native_value(self):
-        return self.__update_function(self.coordinator.data)
+        value = self.cache.get("value", self.__update_function)
+        if not self.__extrapolation_rate or value is None:
+            return value
+
+        value += self.__extrapolation_rate * (time.monotonic() - self.cache.get("sample_time", self.__get_sample_time))
+        if self.__extrapolation_rate < 0:
+            value = max(0, value)
+        return round(value) if float(self.__extrapolation_rate).is_integer() else round(value, 2)
+
+    @property
+    def extra_state_attributes(self):
+        return self.cache.get("attributes", self.__update_function_extra_attributes)
 
     @property
     def device_info(self) -> DeviceInfo:
         return self._provider.device_info
 
+    def __is_significant_change(self) -> bool:
+        """True if the current value differs significantly from the last written one, see `WiloSensorDescriptor`."""
+        if self.__written is None:
+            return True
+
+        written_available, written_value, written_time = self.__written
+        available = self.available
+        value = self.native_value if available else None
+        if available != written_available:
+            return True
+        if self.__max_quiet_period and time.monotonic() - written_time >= self.__max_quiet_period:
+            return True
+        if value == written_value:
+            return False
+        if not isinstance(value, (int, float)) or not isinstance(written_value, (int, float)):
+            return True
+
+        threshold = max(self.__significant_change, self.__significant_change_relative * abs(written_value))
+        return abs(value - written_value) >= threshold
+
+    def __get_sample_time(self, data) -> float:
+        """Returns the monotonic time the page of the value was fetched at."""
+        age = data.data.get("page_age", {}).get(self.__group) or 0.0
+        return (self.coordinator.fetch_time or time.monotonic()) - age
+
+    @callback
+    def __async_tick(self, now:datetime):
+        """Writes the extrapolated value between two polls."""
+        if self.available and self.native_value is not None:
+            self.async_write_ha_state()
+
 
 class GenericWiloBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Generic binary sensor class used to, in combination with WiloSensorDescriptor, create sensors for each provider."""
@@ -65,7 +196,7 @@ class GenericWiloBinarySensor(CoordinatorEntity, BinarySensorEntity):
         :param WiloProvider provider:
             Provider providing this sensor entity.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, descriptor.group)
         self._provider = provider
         self._attr_unique_id = f"{provider.unique_id}_{descriptor.partial_unique_entity_id}"
         self.entity_id = f"sensor.{DOMAIN}_{provider.unique_id}_{descriptor.partial_unique_entity_id}"
@@ -76,14 +207,26 @@ class GenericWiloBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_entity_category = descriptor.entity_category
         self.__update_function = descriptor.value_update_function
         self.__update_function_extra_attributes = descriptor.extra_value_update_function
+        self.cache = GenerationCache(coordinator)
+
+    @property
+    def available(self) -> bool:
+        """Unavailable if the data of the page the value is read from is missing or too old."""
+        if not super().available:
+            return False
+        try:
+            self.cache.get("value", self.__update_function)
+        except KeyError:
+            return False
+        return True
 
     @property
     def is_on(self):
-        return self.__update_function(self.coordinator.data)
+        return self.cache.get("value", self.__update_function)
 
     @property
     def extra_state_attributes(self):
-        return self.__update_function_extra_attributes(self.coordinator.data)
+        return self.cache.get("attributes", self.__update_function_extra_attributes)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -2,6 +2,7 @@
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -11,12 +12,24 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 
-from .datastores import BaseDatastore
+from .datastores.base import BaseDatastore
 
 
 @dataclass
 class WiloSensorDescriptor:
-    """Describes the main sensor attributes."""
+    """Describes the main sensor attributes.
+
+    `group` names the key of the datastore data (page, `statistics`, `trend`, `volume`, `burst` or `page_age`) the value is read from.
+    The entity is only updated when the data of its group changed, or on every update if None.
+
+    Timers set `extrapolation_rate` to the change of their native value per second. Between polls the value
+    is then extrapolated from the last sample and the fetch time of its page every `extrapolation_interval` seconds.
+
+    Noisy sensors set `significant_change` (in the native unit) and/or `significant_change_relative` (share of the
+    last written value). Their state is then only written on updates changing the value by at least the larger
+    threshold, or once `max_quiet_period` seconds (unless 0) passed since the last write.
+    Changes of the availability and from or to None are always written.
+    """
 
     partial_unique_entity_id: str
     translation_key: str
@@ -28,10 +41,16 @@ class WiloSensorDescriptor:
     state_class: SensorStateClass | None = None
     entity_registry_enabled_default: bool = True
     entity_category: EntityCategory | None = None
+    group: str | None = None
+    extrapolation_rate: float = 0
+    extrapolation_interval: float = 1
+    significant_change: float = 0
+    significant_change_relative: float = 0
+    max_quiet_period: float = 0
 
 @dataclass
 class WiloBinarySensorDescriptor:
-    """Describes the main binary sensor attributes."""
+    """Describes the main binary sensor attributes, see `WiloSensorDescriptor` for `group`."""
 
     partial_unique_entity_id: str
     translation_key: str
@@ -40,6 +59,51 @@ class WiloBinarySensorDescriptor:
     device_class: BinarySensorDeviceClass | None = None
     entity_registry_enabled_default: bool = True
     entity_category: EntityCategory | None = None
+    group: str | None = None
+
+@dataclass
+class WiloStatisticDescriptor:
+    """Describes a counter imported as external long-term statistic."""
+
+    partial_statistic_id: str
+    name: str
+    value_update_function: Callable[[BaseDatastore], Any]
+    unit_of_measurement: str | None = None
 
 
 WiloSensorDescriptors = WiloSensorDescriptor | WiloBinarySensorDescriptor
+
+
+def generate_sensor_descriptors(datastore:type[BaseDatastore]) -> list[WiloSensorDescriptor]:
+    """Generates the descriptors of the sensors presenting the fields of a datastore schema.
+
+    Fields without entity description are skipped, the value of each sensor is read by the
+    accessor generated for its field and the page of the field is used as group.
+
+    :param type[BaseDatastore] datastore:
+        Datastore class declaring the fields.
+
+    :returns list[WiloSensorDescriptor]:
+        Descriptors in the order of the fields.
+    """
+    return [
+        WiloSensorDescriptor(
+            partial_unique_entity_id = field.entity.key,
+            translation_key = field.entity.key,
+            value_update_function = attrgetter(name),
+            device_class = field.entity.device_class,
+            native_unit_of_measurement = field.entity.native_unit,
+            unit_of_measurement = field.entity.unit,
+            state_class = field.entity.state_class,
+            entity_registry_enabled_default = field.entity.enabled,
+            entity_category = field.entity.category,
+            group = field.page,
+            extrapolation_rate = field.entity.extrapolation_rate,
+            extrapolation_interval = field.entity.extrapolation_interval,
+            significant_change = field.entity.significant_change,
+            significant_change_relative = field.entity.significant_change_relative,
+            max_quiet_period = field.entity.max_quiet_period
+        )
+        for name, field in datastore.FIELDS.items()
+        if field.entity is not None
+    ]
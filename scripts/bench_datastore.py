@@ -0,0 +1,168 @@
+"""Benchmarks reading the properties of the rain3 datastore from synthetic page data.
+
+Usage (from the repository root): `python -m scripts.bench_datastore [--root PATH] [--reads N] [--runs N] [--repeat N] [--dump]`
+
+Development tool, not part of the integration. Each run creates a datastore like an update cycle does
+and reads every property `--reads` times, like entities reading the value for availability and state.
+`--root` imports the datastore from another checkout instead, e.g. a `git worktree` of an older revision,
+so both versions are measured on the same data. `--dump` prints the values to compare their output.
+"""
+
+import argparse
+import inspect
+from pathlib import Path
+import sys
+import timeit
+from typing import Any
+
+PAGES:dict[str, Any] = {
+    "identity": {
+        "Serial number": "123456789",
+        "SW Version": "1.2.3",
+        "Equipment number": "2548512",
+    },
+    "state": {
+        "Pressure": "3.2 bar",
+        "Level": "120 cm",
+        "Calc. protection in": "5h",
+        "Flushing in": "12h",
+        "MP": "ON",
+        "MP running for": "1min 20s",
+        "Stop MP in": "15s",
+        "Ways-valve": "Rain water",
+        "Pump switches/hour": "2/20",
+        "Switch on": "not reached",
+        "Switch off": "not reached",
+    },
+    "download": {
+        "Connected to": "HomeWifi",
+        "Webserver IP": "192.168.1.50",
+    },
+    "setup": {
+        "MP switches": "100",
+        "MP": "10h 20min",
+        "CP switches": "50",
+        "CP": "5h",
+        "System": "100h",
+        "System switches": "7",
+        "Max. pump cycles/hour": "0x",
+        "Pressure sensor fault": "1x",
+        "Dry running RWM": "0x",
+        "Dry running TWM": "2x",
+        "Max. runtime pump": "0x",
+        "Break tank overflow": "0x",
+        "Cistern backflow": "0x",
+        "Cistern overflow": "3x",
+        "High water alarm": "0x",
+        "Level sensor fault": "0x",
+        "System over pressure": "0x",
+    },
+    "installation": {
+        "Pump type": "Helix",
+        "Number of CP": "1",
+        "Sensor range pressure": "10 bar",
+        "Threshold over pressure": "8 bar",
+        "Sensor range level cistern": "2.5 m",
+        "Level sensor inst. height": "5 cm",
+        "High water on threshold": "200 cm",
+        "Cistern shape": "Standing cylinder",
+        "Cistern high/diameter": "250 cm",
+        "Pump kick": "ON",
+        "Pump kick interval": "24 hours",
+        "Pump kick duration": "10 s",
+        "Over flow on threshold": "220 cm",
+        "Tap water on threshold": "20 cm",
+        "Rain water on threshold": "40 cm",
+        "Calcination protection": "7 days",
+        "System flushing": "30 days",
+        "Flushing duration": "5 min",
+        "Max. running time pump": "60 min",
+        "Fault message behavior": "Rising",
+        "Minimum pressure": "1.5 bar",
+        "Delay dry run protection": "30 s",
+        "Dry run tap water mode": "10 s",
+        "Dry run rain water mode": "10 s",
+        "Max. pump cycles per hour": "20/hour",
+    },
+    "settings": {
+        "MP switch-on pressure": "2.5 bar",
+        "MP switch-off pressure": "4 bar",
+        "Stop MP in": "10 s",
+        "CP start time": "5 s",
+        "CP stop time": "5 s",
+        "Time pressure compare": "60 s",
+        "Pressure jump in RWM": "0.2 bar",
+        "Main pump mode": "Auto",
+        "Cistern pump mode": "Auto",
+        "Running time MP manual": "60 s",
+        "Running time CP manual": "60 s",
+        "Drives": "ON",
+    },
+    "errors": {
+        "Alarm": "No active alarm",
+        "Alarm history": [
+            {"error": "Dry running TWM", "timestamp": "01.01.2026 10:00"},
+            {"error": "Cistern overflow", "timestamp": "02.01.2026 11:30"},
+        ],
+    },
+}
+
+# Properties of the datastore itself rather than of the pump.
+EXCLUDED = {"data", "conversion_errors", "numeric_values"}
+
+
+def get_readable_properties(datastore_class:type) -> list[str]:
+    """Returns the properties of the datastore which can be read from `PAGES`.
+
+    Properties reading data added by the provider (statistics, trend, burst, ...) are left out.
+    """
+    datastore = datastore_class(PAGES)
+    names = []
+    for name, _ in inspect.getmembers(datastore_class, lambda member: isinstance(member, property)):
+        if name in EXCLUDED:
+            continue
+        try:
+            getattr(datastore, name)
+        except (KeyError, TypeError):
+            continue
+        names.append(name)
+    return names
+
+
+def main():
+    """Runs the benchmark from the command line and prints the results."""
+    parser = argparse.ArgumentParser(description="Benchmark the rain3 datastore properties.")
+    parser.add_argument("--root", type=Path, default=Path.cwd(), help="checkout the datastore is imported from")
+    parser.add_argument("--reads", type=int, default=1, help="reads of each property per run")
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--dump", action="store_true", help="print the values instead of measuring")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(args.root.resolve()))
+    from custom_components.wilo.datastores import Rain3Datastore
+
+    names = get_readable_properties(Rain3Datastore)
+    if args.dump:
+        datastore = Rain3Datastore(PAGES)
+        for name in names:
+            print(f"{name} = {getattr(datastore, name)!r}")
+        return
+
+    reads = range(args.reads)
+
+    def run():
+        datastore = Rain3Datastore(PAGES)
+        for name in names:
+            for _ in reads:
+                getattr(datastore, name)
+
+    best = min(timeit.repeat(run, number=args.runs, repeat=args.repeat)) / args.runs
+    print(f"Datastore:        {inspect.getfile(Rain3Datastore)}")
+    print(f"Properties:       {len(names)}")
+    print(f"Reads:            {args.reads} per property")
+    print(f"Time per update:  {best * 1e6:.1f} us (best of {args.repeat} x {args.runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
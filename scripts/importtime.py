@@ -0,0 +1,103 @@
+"""Measures the import cost of the integration using `python -X importtime`.
+
+Usage (from the repository root): `python -m scripts.importtime [--module NAME] [--top N] [--max-ms MS] [--forbid MODULE ...]`
+
+Development tool, not part of the integration. The module is imported in a fresh interpreter after the
+home assistant modules in `--preload`, which are loaded by home assistant before any integration and
+therefore not attributed to it. By default these are `homeassistant.bootstrap`, which imports the core,
+the helpers and the components set up before integrations (e.g. the recorder), and the `http` component
+the integration depends on. The cumulative import time and the modules with the highest own import time
+are reported. The check fails if the import takes longer than `--max-ms` or pulls in a module listed in
+`--forbid`, by default the modules only needed once an entry of a model or an optional feature is set up.
+"""
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+from typing import Any
+
+MARKER = "wilo-importtime-start"
+
+PRELOAD = ["homeassistant.bootstrap", "homeassistant.components.http"]
+
+FORBID = [
+    "lxml",
+    "custom_components.wilo.datastores.rain3",
+    "custom_components.wilo.history",
+    "custom_components.wilo.long_term_statistics",
+    "custom_components.wilo.providers.rain3",
+    "custom_components.wilo.views",
+]
+
+
+def measure(module:str, preload:list[str]) -> dict[str, Any]:
+    """Imports the module in a fresh interpreter and parses the reported import times.
+
+    :param str module:
+        Module to be measured.
+
+    :param list[str] preload:
+        Modules imported before the measurement starts.
+
+    :returns dict[str, Any]:
+        Cumulative time in microseconds (`total`) and the own time of each imported module (`modules`).
+    """
+    code = "".join(f"import {name}\n" for name in preload)
+    code += f"import sys\nsys.stderr.write({MARKER!r} + '\\n')\nimport {module}\n"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "Import failed")
+
+    lines = result.stderr.splitlines()
+    total = 0
+    modules:dict[str, int] = {}
+    for line in lines[lines.index(MARKER) + 1:]:
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if not own.strip().isdigit():
+            continue
+        if not name.startswith("  "):
+            total += int(cumulative)
+        modules[name.strip()] = int(own)
+    return {"total": total, "modules": modules}
+
+
+def main():
+    """Runs the measurement from the command line and prints the results."""
+    parser = argparse.ArgumentParser(description="Measure the import cost of the Wilo integration.")
+    parser.add_argument("--module", default="custom_components.wilo")
+    parser.add_argument("--preload", nargs="*", default=PRELOAD)
+    parser.add_argument("--top", type=int, default=15, help="number of modules with the highest own import time shown")
+    parser.add_argument("--max-ms", type=float, default=0, help="fail if the import takes longer, disabled if 0")
+    parser.add_argument("--forbid", nargs="*", default=FORBID, help="fail if one of these modules is imported")
+    args = parser.parse_args()
+
+    results = measure(args.module, args.preload)
+    print(f"Import time:      {results['total'] / 1000:.1f} ms")
+    print(f"Modules imported: {len(results['modules'])}")
+    print("Highest own import time:")
+    for name, own in sorted(results["modules"].items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {own / 1000:>8.2f} ms  {name}")
+
+    forbidden = sorted(
+        name for name in results["modules"]
+        if any(name == forbid or name.startswith(f"{forbid}.") for forbid in args.forbid)
+    )
+    if forbidden:
+        print(f"Forbidden modules imported: {', '.join(forbidden)}")
+        sys.exit(1)
+    if args.max_ms and results["total"] > args.max_ms * 1000:
+        print(f"Import time exceeds {args.max_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
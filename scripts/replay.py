@@ -0,0 +1,116 @@
+"""Replays captured pump traffic offline through the provider, parser and datastore.
+
+Usage (from the repository root): `python -m scripts.replay <archive> [--repeat N]`
+
+Development tool, not part of the integration. Archives are written by the `wilo.capture` service.
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+import time
+from typing import Any
+
+from aiohttp import ClientTimeout
+from lxml import html as lxml_html
+
+from custom_components.wilo.capture import read_capture
+from custom_components.wilo.providers.rain3 import Rain3Provider
+
+
+class ReplayRain3Provider(Rain3Provider):
+    """Rain3 provider serving pages from a capture instead of the pump."""
+
+    def __init__(self):
+        """Initialize the replay provider."""
+        super().__init__("replay", 0, None)
+        self._pages:dict[str, dict[str, Any]] = {}
+
+    def load_cycle(self, cycle:dict[str, Any]):
+        """Sets the captured cycle the next update is served from.
+
+        :param dict[str, Any] cycle:
+            Captured cycle as returned by `read_capture`.
+        """
+        self._pages = cycle["pages"]
+
+    async def async_update(self, pages:frozenset[str] | None = None):
+        """Updates from the loaded cycle, see `Rain3Provider.async_update`.
+
+        All pages are fetched regardless of their TTL unless pages are given, as the cycles are replayed
+        faster than the TTLs expire and most pages would otherwise be served from the page cache.
+        """
+        return await super().async_update(frozenset(self.PAGES) if pages is None else pages)
+
+    def _start_revalidation(self, url_path:str):
+        """Pages missing in the capture are not retried."""
+
+    async def _async_fetch_document(self, url_path:str, timeout:ClientTimeout | None = None, capture:dict[str, Any] | None = None, caller:str = "poll"):
+        """Parses the captured body of the page, see `Rain3Provider._async_fetch_document`."""
+        page = self._pages.get(url_path)
+        if page is None:
+            return None
+
+        body = page["body"].replace(b"\x00", b"")
+        if not body:
+            return None
+
+        parser = lxml_html.HTMLParser(encoding=page["encoding"])
+        parser.feed(body)
+        return parser.close()
+
+
+async def async_replay(path:Path, repeat:int) -> dict[str, float]:
+    """Replays all cycles of the archive `repeat` times as fast as possible.
+
+    :param Path path:
+        Path of the capture archive.
+
+    :param int repeat:
+        Number of passes over the captured cycles.
+
+    :returns dict[str, float]:
+        Number of cycles, total duration, throughput and mean time per cycle.
+    """
+    cycles = read_capture(path)
+    provider = ReplayRain3Provider()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for cycle in cycles:
+            provider.load_cycle(cycle)
+            await provider.async_update()
+    duration = time.perf_counter() - start
+
+    count = len(cycles) * repeat
+    return {
+        "cycles": count,
+        "duration": duration,
+        "cycles_per_second": count / duration if duration else 0.0,
+        "ms_per_cycle": duration / count * 1000 if count else 0.0,
+    }
+
+
+def main():
+    """Runs the replay from the command line and prints the results."""
+    parser = argparse.ArgumentParser(description="Replay captured Wilo pump traffic.")
+    parser.add_argument("archive", type=Path)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    results = asyncio.run(async_replay(args.archive, args.repeat))
+    print(f"Cycles:           {results['cycles']}")
+    print(f"Duration:         {results['duration']:.3f} s")
+    print(f"Throughput:       {results['cycles_per_second']:.1f} cycles/s")
+    print(f"Time per cycle:   {results['ms_per_cycle']:.3f} ms")
+
+    captured = [cycle["timings"] for cycle in read_capture(args.archive)]
+    if captured:
+        print("Captured mean step timings:")
+        for step in captured[0]:
+            values = [timings[step] for timings in captured if step in timings]
+            print(f"  {step:<24}{sum(values) / len(values) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
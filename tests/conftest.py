@@ -0,0 +1,196 @@
+"""Shared fixtures of the Wilo integration tests."""
+
+import asyncio
+from collections import Counter
+from html import escape
+
+from aiohttp import ClientConnectionError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker, AiohttpClientMockResponse
+from yarl import URL
+
+from custom_components.wilo.const import DOMAIN
+from custom_components.wilo.models import WiloModels
+
+FAKE_PUMP_IP = "192.168.1.50"
+
+FAKE_PUMP_PAGES:dict[str, dict[str, str]] = {
+    "identity": {
+        "Serial number": "123456789",
+        "SW Version": "1.2.3",
+        "Equipment number": "2548512",
+    },
+    "state": {
+        "Pressure": "3.2 bar",
+        "Level": "120 cm",
+        "Calc. protection in": "5h",
+        "Flushing in": "12h",
+        "MP": "OFF",
+        "Ways-valve": "Rain water",
+        "Pump switches/hour": "2/20",
+        "Switch on": "not reached",
+        "Switch off": "not reached",
+    },
+    "download": {
+        "Connected to": "HomeWifi",
+        "Webserver IP": FAKE_PUMP_IP,
+    },
+    "setup": {
+        "MP switches": "100",
+        "MP": "10h 20min",
+        "CP switches": "50",
+        "CP": "5h",
+        "System": "100h",
+        "System switches": "7",
+        "Max. pump cycles/hour": "0x",
+        "Pressure sensor fault": "0x",
+        "Dry running RWM": "0x",
+        "Dry running TWM": "0x",
+        "Max. runtime pump": "0x",
+        "Break tank overflow": "0x",
+        "Cistern backflow": "0x",
+        "Cistern overflow": "0x",
+        "High water alarm": "0x",
+        "Level sensor fault": "0x",
+        "System over pressure": "0x",
+    },
+    "installation": {
+        "Pump type": "Helix",
+        "Number of CP": "1",
+        "Sensor range pressure": "10 bar",
+        "Threshold over pressure": "8 bar",
+        "Sensor range level cistern": "2.5 m",
+        "Level sensor inst. height": "5 cm",
+        "High water on threshold": "200 cm",
+        "Cistern shape": "Standing cylinder",
+        "Cistern high/diameter": "250 cm",
+        "Pump kick": "ON",
+        "Pump kick interval": "24 hours",
+        "Pump kick duration": "10 s",
+        "Over flow on threshold": "220 cm",
+        "Tap water on threshold": "20 cm",
+        "Rain water on threshold": "40 cm",
+        "Calcination protection": "7 days",
+        "System flushing": "30 days",
+        "Flushing duration": "5 min",
+        "Max. running time pump": "60 min",
+        "Fault message behavior": "Rising",
+        "Minimum pressure": "1.5 bar",
+        "Delay dry run protection": "30 s",
+        "Dry run tap water mode": "10 s",
+        "Dry run rain water mode": "10 s",
+        "Max. pump cycles per hour": "20/hour",
+    },
+    "settings": {
+        "MP switch-on pressure": "2.5 bar",
+        "MP switch-off pressure": "4 bar",
+        "Stop MP in": "10 s",
+        "CP start time": "5 s",
+        "CP stop time": "5 s",
+        "Time pressure compare": "60 s",
+        "Pressure jump in RWM": "0.2 bar",
+        "Main pump mode": "Auto",
+        "Cistern pump mode": "Auto",
+        "Running time MP manual": "60 s",
+        "Running time CP manual": "60 s",
+        "Drives": "ON",
+    },
+}
+
+
+class FakePump:
+    """Rain3 pump answering the requests of the mocked client session with generated pages.
+
+    Each page lists its fields as `<span>label</span><b>value</b>` rows like the real pump,
+    the errors page additionally contains the active alarm and the alarm history.
+    """
+
+    def __init__(self, ip:str):
+        """Initialize the fake pump with the default page content."""
+        self.ip = ip
+        self.pages = {url_path: dict(fields) for url_path, fields in FAKE_PUMP_PAGES.items()}
+        self.alarm = "No active alarm"
+        self.failing:Counter[str] = Counter()
+        self.requests:Counter[str] = Counter()
+        self.cycle = 0
+        # Cleared to hold the responses, keeping the requests in flight until set again.
+        self.released = asyncio.Event()
+        self.released.set()
+
+    def register(self, aioclient_mock:AiohttpClientMocker):
+        """Answers all requests to the address of the pump."""
+        aioclient_mock.get(f"http://{self.ip}/", side_effect=self._async_respond)
+        for url_path in (*self.pages, "errors"):
+            aioclient_mock.get(f"http://{self.ip}/{url_path}", side_effect=self._async_respond)
+
+    def advance(self):
+        """Simulates the pump between two polls: the level and pressure change and the counters increase."""
+        self.cycle += 1
+        state = self.pages["state"]
+        state["Level"] = f"{120 + self.cycle % 40} cm"
+        state["Pressure"] = f"{3.0 + (self.cycle % 5) / 10:.1f} bar"
+        setup = self.pages["setup"]
+        setup["MP switches"] = str(100 + self.cycle)
+        setup["CP switches"] = str(50 + self.cycle // 2)
+        setup["MP"] = f"{10 + self.cycle // 60}h {self.cycle % 60}min"
+
+    def render(self, url_path:str) -> str:
+        """Returns the html of the given page."""
+        if url_path == "errors":
+            return (
+                "<html><body><h2>Alarm</h2>" + escape(self.alarm) + "<br>"
+                "<h3>Alarm history</h3>Dry running TWM <b>01.01.2026 10:00</b><br>"
+                "Cistern overflow <b>02.01.2026 11:30</b><br></body></html>"
+            )
+        rows = "".join(
+            f"<span>{escape(label)}</span><b>{escape(value)}</b><br>"
+            for label, value in self.pages.get(url_path, {}).items()
+        )
+        return f"<html><body>{rows}</body></html>"
+
+    async def _async_respond(self, method:str, url:URL, data) -> AiohttpClientMockResponse:
+        """Answers a request, failing with a connection error while `failing` counts failures left for the page."""
+        url_path = url.path.strip("/")
+        self.requests[url_path] += 1
+        await self.released.wait()
+        if self.failing[url_path] > 0:
+            self.failing[url_path] -= 1
+            return AiohttpClientMockResponse(method, url, exc=ClientConnectionError("Fake pump unreachable"))
+        return AiohttpClientMockResponse(
+            method,
+            url,
+            text=self.render(url_path),
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Allows home assistant to load the integration from `custom_components` in all tests."""
+    return
+
+
+@pytest.fixture
+def fake_pump(aioclient_mock:AiohttpClientMocker) -> FakePump:
+    """Fake rain3 pump answering the requests of the integration."""
+    pump = FakePump(FAKE_PUMP_IP)
+    pump.register(aioclient_mock)
+    return pump
+
+
+@pytest.fixture
+def config_entry() -> MockConfigEntry:
+    """Config entry of the fake pump, without rate limiting the requests."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=f"Wilo rain3 ({FAKE_PUMP_IP})",
+        data={
+            "ip": FAKE_PUMP_IP,
+            "model": WiloModels.RAIN3.value,
+            "interval": 60,
+            "device_id": 0,
+            "rate_limit": 1000.0,
+            "rate_limit_burst": 1000,
+        },
+    )
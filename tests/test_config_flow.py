@@ -0,0 +1,70 @@
+"""Tests for the network discovery of the config flow."""
+
+from unittest.mock import patch
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.wilo.const import DOMAIN, SOURCE_BULK_SETUP
+
+INTERVAL_INPUT = {
+    "interval": 60,
+    "long_term_statistics": False,
+    "history": False,
+    "burst_interval": 0,
+    "max_data_age": 300,
+    "rate_limit": 4.0,
+    "rate_limit_burst": 8,
+    "timeout_floor": 1.0,
+    "timeout_ceiling": 30.0,
+    "cistern_capacity": 0,
+}
+
+
+async def _async_start_discovery(hass:HomeAssistant) -> dict:
+    """Starts a user flow and selects the network discovery."""
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
+    return await hass.config_entries.flow.async_configure(result["flow_id"], {"next_step_id": "discovery"})
+
+
+async def test_discovery_rejects_ipv6_networks(hass:HomeAssistant):
+    """IPv6 networks cannot be enumerated and are rejected before probing."""
+    result = await _async_start_discovery(hass)
+    with patch("custom_components.wilo.config_flow.WiloConfigFlow._async_discover_rain3") as discover:
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {"network": "fd00::/64"})
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "network_not_ipv4"}
+    discover.assert_not_called()
+
+
+async def test_discovery_rejects_large_networks(hass:HomeAssistant):
+    """Networks with more addresses than allowed are rejected before probing."""
+    result = await _async_start_discovery(hass)
+    with patch("custom_components.wilo.config_flow.WiloConfigFlow._async_discover_rain3") as discover:
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {"network": "10.0.0.0/16"})
+
+    assert result["errors"] == {"base": "network_too_large"}
+    discover.assert_not_called()
+
+
+async def test_discovery_sets_up_selected_pumps(hass:HomeAssistant):
+    """The first selected pump is set up by the flow, the others through the bulk setup source."""
+    result = await _async_start_discovery(hass)
+    with patch(
+        "custom_components.wilo.config_flow.WiloConfigFlow._async_discover_rain3",
+        return_value=["192.168.1.10", "192.168.1.11"],
+    ):
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {"network": "192.168.1.0/24"})
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"ips": ["192.168.1.10", "192.168.1.11"]})
+
+    with patch("custom_components.wilo.async_setup_entry", return_value=True):
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], INTERVAL_INPUT)
+        await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    entries = sorted(hass.config_entries.async_entries(DOMAIN), key=lambda entry: entry.data["ip"])
+    assert [entry.data["ip"] for entry in entries] == ["192.168.1.10", "192.168.1.11"]
+    assert [entry.data["device_id"] for entry in entries] == [0, 1]
+    assert entries[1].source == SOURCE_BULK_SETUP
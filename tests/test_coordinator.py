@@ -0,0 +1,102 @@
+"""Tests of the Wilo coordinator."""
+
+import asyncio
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.wilo.const import DOMAIN
+from custom_components.wilo.history import HistorySink
+from custom_components.wilo.providers.rain3 import Rain3Provider
+
+from .conftest import FakePump
+
+
+async def test_revalidated_page_is_published_without_sampling(
+    hass:HomeAssistant, fake_pump:FakePump, config_entry:MockConfigEntry
+):
+    """A page fetched by the background revalidation is published, but not sampled a second time."""
+    config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(config_entry, data={**config_entry.data, "history": True})
+    with (
+        patch("custom_components.wilo.providers.rain3.REVALIDATION_DELAY", 0),
+        patch.object(HistorySink, "add", autospec=True) as history_add,
+        patch.object(
+            Rain3Provider,
+            "_update_rolling_statistics",
+            autospec=True,
+            side_effect=Rain3Provider._update_rolling_statistics,
+        ) as update_rolling_statistics,
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+
+        fake_pump.failing["state"] = 1
+        fake_pump.pages["state"]["Level"] = "150 cm"
+        await coordinator.async_refresh()
+        assert coordinator.data.cistern_level == 120
+        history_adds = history_add.call_count
+        samples = update_rolling_statistics.call_count
+        generation = coordinator.generation
+
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert coordinator.data.cistern_level == 150
+        assert coordinator.generation == generation + 1
+        assert history_add.call_count == history_adds
+        assert update_rolling_statistics.call_count == samples
+
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_refresh_during_update_fetches_uncovered_pages(
+    hass:HomeAssistant, fake_pump:FakePump, config_entry:MockConfigEntry
+):
+    """A refresh requested during the regular update waits for it and only fetches the pages it did not fetch."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    requests = fake_pump.requests.copy()
+
+    fake_pump.released.clear()
+    update = hass.async_create_task(coordinator.async_refresh())
+    refresh = hass.async_create_task(coordinator.async_refresh_pages(frozenset({"state", "settings"})))
+    await asyncio.sleep(0)
+    fake_pump.released.set()
+    await asyncio.gather(update, refresh)
+
+    # The state page has been fetched by the update, the settings page is served from the page cache by it.
+    assert fake_pump.requests["state"] == requests["state"] + 1
+    assert fake_pump.requests["settings"] == requests["settings"] + 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_concurrent_refreshes_are_coalesced(
+    hass:HomeAssistant, fake_pump:FakePump, config_entry:MockConfigEntry
+):
+    """Concurrent refreshes of the same pages share a single fetch."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    requests = fake_pump.requests.copy()
+
+    fake_pump.released.clear()
+    refreshes = [
+        hass.async_create_task(coordinator.async_refresh_pages(frozenset({"settings"})))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    fake_pump.released.set()
+    await asyncio.gather(*refreshes)
+
+    assert fake_pump.requests["settings"] == requests["settings"] + 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,13 @@
+"""Tests of the rain3 datastore."""
+
+from custom_components.wilo.datastores import Rain3Datastore
+
+
+def test_unparseable_duration_is_none():
+    """A duration that cannot be parsed is None like a countdown that is not running and is reported as conversion error."""
+    datastore = Rain3Datastore({"state": {"Calc. protection in": "---", "Flushing in": "12h", "Pressure": "3.2 bar"}})
+
+    assert datastore.calc_protection_timer is None
+    assert datastore.flushing_timer == 12
+    assert datastore.conversion_errors == {"calc_protection_timer": "---"}
+    assert "calc_protection_timer" not in datastore.numeric_values
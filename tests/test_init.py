@@ -0,0 +1,43 @@
+"""Tests of the setup and unload of Wilo config entries."""
+
+import asyncio
+import gc
+import weakref
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.wilo.const import DATA_RATE_LIMITERS, DOMAIN
+
+from .conftest import FakePump
+
+
+async def test_reload_and_unload_release_resources(
+    hass:HomeAssistant, fake_pump:FakePump, config_entry:MockConfigEntry
+):
+    """Reloading and unloading an entry releases its provider, rate limiter, data and tasks."""
+    tasks = asyncio.all_tasks()
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.LOADED
+    providers = [weakref.ref(hass.data[DOMAIN][config_entry.entry_id]["pump"])]
+
+    assert await hass.config_entries.async_reload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.LOADED
+    providers.append(weakref.ref(hass.data[DOMAIN][config_entry.entry_id]["pump"]))
+    assert providers[0]() is not providers[1]()
+    await hass.data[DOMAIN][config_entry.entry_id]["coordinator"].async_refresh()
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+
+    gc.collect()
+    assert not any(provider() is not None for provider in providers)
+    assert DOMAIN not in hass.data
+    assert DATA_RATE_LIMITERS not in hass.data
+    assert not hass.services.has_service(DOMAIN, "refresh")
+    assert not [task for task in asyncio.all_tasks() - tasks if not task.done()]
@@ -0,0 +1,67 @@
+"""Memory tests of the rain3 provider, replaces the manual `--memory` check of the replay script."""
+
+import gc
+import tracemalloc
+import weakref
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.wilo.providers.rain3 import Rain3Provider
+from custom_components.wilo.rate_limiter import get_rate_limiter, remove_rate_limiter
+
+from .conftest import FAKE_PUMP_IP, FakePump
+
+# Fills the rolling windows, the cistern trend and the latency windows before measuring.
+WARMUP_CYCLES = 150
+CYCLES = 200
+MAX_GROWTH = 64 * 1024
+
+
+async def test_update_cycles_retain_no_memory(
+    hass:HomeAssistant, fake_pump:FakePump, aioclient_mock:AiohttpClientMocker
+):
+    """Memory retained over the update cycles stays below `MAX_GROWTH` and parsed documents are released."""
+    get_rate_limiter(hass, FAKE_PUMP_IP).configure(1e6, 10**6)
+    provider = Rain3Provider(FAKE_PUMP_IP, 0, hass)
+    documents:list[weakref.ref] = []
+    parse_document = provider._parse_document
+
+    def track_document(url_path, root):
+        documents.append(weakref.ref(root))
+        return parse_document(url_path, root)
+
+    provider._parse_document = track_document
+
+    async def async_run(cycles:int):
+        for _ in range(cycles):
+            fake_pump.advance()
+            # All pages are fetched, the cycles run faster than the TTLs of the page cache expire.
+            await provider.async_update(frozenset(provider.PAGES))
+            # The mocker records every request.
+            aioclient_mock.mock_calls.clear()
+
+    tracemalloc.start()
+    try:
+        await async_run(WARMUP_CYCLES)
+        gc.collect()
+        harness = [tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__)]
+        baseline = tracemalloc.take_snapshot().filter_traces(harness)
+        documents.clear()
+
+        await async_run(CYCLES)
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces(harness)
+    finally:
+        tracemalloc.stop()
+        await provider.async_close()
+        remove_rate_limiter(hass, FAKE_PUMP_IP)
+
+    sites = snapshot.compare_to(baseline, "lineno")
+    growth = sum(site.size_diff for site in sites)
+    assert growth <= MAX_GROWTH, "Retained growth of {} bytes over {} cycles, main allocation sites:\n{}".format(
+        growth, CYCLES, "\n".join(str(site) for site in sites[:10])
+    )
+
+    # The documents of the last update may legitimately still be referenced by its datastore.
+    assert not any(document() is not None for document in documents[:-len(provider.PAGES)])
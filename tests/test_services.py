@@ -0,0 +1,40 @@
+"""Tests of the Wilo services."""
+
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.wilo.const import DOMAIN
+
+from .conftest import FakePump
+
+
+async def test_overlapping_profiles_are_rejected(
+    hass:HomeAssistant, fake_pump:FakePump, config_entry:MockConfigEntry, tmp_path:Path
+):
+    """A profile requested while another one is running fails instead of colliding in cProfile."""
+    hass.config.config_dir = str(tmp_path)
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+
+    await hass.services.async_call(DOMAIN, "profile", {"cycles": 1}, blocking=True)
+    assert coordinator.profiling
+
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN, "profile", {"cycles": 1, "config_entry_id": config_entry.entry_id}, blocking=True
+        )
+    assert err.value.translation_key == "profile_running"
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert not coordinator.profiling
+    assert list(tmp_path.glob("wilo_profiles/*.pstats"))
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
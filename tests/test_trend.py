@@ -0,0 +1,19 @@
+"""Tests of the linear trend estimator."""
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.wilo.trend import LinearTrend
+
+
+def test_time_until_in_requested_unit():
+    """The time until the threshold is reported in the requested unit, matching the rate."""
+    trend = LinearTrend(timedelta(hours=1), 120)
+    for minute in range(10):
+        trend.add(minute * 60, 100 + minute)
+
+    assert trend.rate() == pytest.approx(60)
+    assert trend.time_until(130) == pytest.approx(21 * 60)
+    assert trend.time_until(130, timedelta(hours=1)) == pytest.approx(21 / 60)
+    assert trend.time_until(90, timedelta(hours=1)) is None